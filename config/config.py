@@ -3,19 +3,47 @@ OGAME_SERVER_URL = "https://s1-de.ogame.gameforge.com"
 OGAME_LOGIN_URL = "https://lobby.ogame.gameforge.com/de_DE/"
 
 # Browser Settings
-BROWSER_HEADLESS = False  # Set to True to run browser in background
-BROWSER_WINDOW_SIZE = (1920, 1080)
+BROWSER_HEADLESS = False  # Set to True to run browser in background (login via persistent profile)
+BROWSER_WINDOW_SIZE = (1280, 720)  # Small window = less renderer memory
 BROWSER_TIMEOUT = 30
+DRIVER_BACKEND = "selenium"  # "selenium" (chromedriver), "cdp" (direct DevTools websocket, needs websocket-client) or "http" (browser only for login)
+PAGE_SNAPSHOT_MAX_AGE = 5  # Seconds a parsed page_source snapshot serves reads (0 = always query live elements)
+DRIVER_INSTRUMENTATION = False  # Count and time every driver call per manager/selector (report after each cycle)
+DRIVER_REPORT_TOP = 10  # Most expensive selectors listed per report
+DRIVER_RETRIES = 3  # Attempts per driver call on stale elements/timeouts (1 = no retry)
+
+# Monitoring
+METRICS_PORT = 0  # Prometheus /metrics endpoint on localhost (0 = off, e.g. 9400)
+METRICS_HOST = "127.0.0.1"
 
 # Bot Settings
 CHECK_INTERVAL = 60  # seconds between checks
 AUTO_BUILD = True
 AUTO_RESEARCH = True
+AUTO_SHIPYARD = True  # Build the ships planned raids and colonization need (one batched order per planet)
 AUTO_FLEET = False  # Be careful with fleet operations!
+RUN_MODE = "async"  # "async" = asyncio tasks per subsystem, "scheduler" = single-threaded job scheduler
+
+# Circuit Breakers (per job / async task)
+BREAKER_FAILURE_RATE = 0.5  # Share of failed runs (of the last BREAKER_WINDOW) that pauses a subsystem
+BREAKER_WINDOW = 10  # Runs per subsystem considered for the failure rate
+BREAKER_MIN_RUNS = 3  # Never trip on fewer runs than this
+BREAKER_COOLDOWN = 60  # First pause of a broken subsystem in seconds (doubles after each failed probe)
+BREAKER_MAX_COOLDOWN = 3600  # Longest pause between probes
+
+# Checkpoint
+CHECKPOINT_ENABLED = True  # Persist state to SQLite after every change and warm-resume after a restart
+CHECKPOINT_DIR = "checkpoints"  # Relative to the project root, one file per account
+CHECKPOINT_MAX_AGE = 24 * 3600  # Older checkpoints are discarded (cold start)
 
 # Logging
 LOG_LEVEL = "INFO"
 LOG_FILE = "ogame_bot.log"
+LOG_LEVELS = {}  # Level per subsystem, e.g. {"fleet": "DEBUG", "inventory": "WARNING"} (building, fleet, colonization, resource, empire, research, shipyard, inventory, planets, core, driver, checkpoint)
+LOG_JSON = True  # Structured JSONL event stream next to the human log (logs/*.jsonl)
+LOG_MAX_BYTES = 10 * 1024 * 1024  # Rotate log files at this size ...
+LOG_ROTATE_WHEN = None  # ... or by time instead ("midnight", "H")
+LOG_BACKUP_COUNT = 5
 
 # User Credentials (create .env file for these)
 # OGAME_EMAIL = "your_email@example.com"
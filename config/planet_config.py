@@ -66,6 +66,9 @@ class PlanetDevelopmentConfig:
         'raumschiffwerft': 12
     }
     
+    # Ab dieser Summe aller Gebäude-Level beginnt Mid- bzw. Late-Game
+    PHASE_LEVELS = (50, 150)
+    
     # === SMART BUILDING LOGIC ===
     # Ressourcen-Verhältnis für Entscheidungen
     RESOURCE_RATIOS = {
@@ -109,9 +112,9 @@ class PlanetDevelopmentConfig:
     @classmethod
     def determine_game_phase(cls, total_building_levels):
         """Bestimme Spiel-Phase basierend auf Gebäude-Leveln"""
-        if total_building_levels < 50:
+        if total_building_levels < cls.PHASE_LEVELS[0]:
             return "early"
-        elif total_building_levels < 150:
+        elif total_building_levels < cls.PHASE_LEVELS[1]:
             return "mid"
         else:
             return "late"
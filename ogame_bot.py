@@ -14,6 +14,10 @@ Features:
 
 Usage:
     python3 ogame_bot.py
+    python3 ogame_bot.py --supervise config/accounts.json   # alle Accounts
+    python3 ogame_bot.py --accounts config/accounts.json --account NAME
+    python3 ogame_bot.py --install-deps                      # Abhängigkeiten installieren
+    python3 ogame_bot.py --import-times                      # Import-Zeiten pro Backend
 
 Das wars! Alles andere läuft automatisch.
 """
@@ -21,43 +25,53 @@ Das wars! Alles andere läuft automatisch.
 import os
 import sys
 import time
-import logging
-import requests
+import argparse
+import importlib
+import json
 import signal
+import urllib.error
+import urllib.request
 from pathlib import Path
 
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# Selenium imports
+# Nur leichte Module beim Start - Selenium, CDP, lxml, requests und die
+# Manager werden erst geladen wenn das gewählte Backend sie braucht
 try:
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.chrome.options import Options
-except ImportError:
-    print("❌ Selenium not installed!")
-    print("Installing selenium...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "selenium", "webdriver-manager", "requests"])
-    
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.chrome.options import Options
-
-# Import our managers
-try:
-    from src.managers.building_manager import BuildingManager
-    from src.managers.fleet_manager import FleetManager
-    from src.managers.colonization_manager import ColonizationManager
-    from src.managers.resource_manager import ResourceManager
+    from src.core.startup import timed_import, record_import_time, import_report
+    started = time.perf_counter()
+    from src.core.scheduler import JobScheduler
+    from src.core.async_core import AsyncCore, PRIORITY_CRITICAL, PRIORITY_NORMAL, PRIORITY_BACKGROUND
+    from src.core.runtime import RUNTIME
+    from config import config
+    from src.browser.launcher import BrowserLauncher
+    from src.browser.instrumented import CallStats, InstrumentedDriver
+    from src.browser.retrying import RetryingDriver
+    from src.core.retry import STEPS, failure_delay
+    from src.core.breaker import BreakerBoard, PhaseFailed
+    from src.core import metrics
+    from src.core.log_pipeline import LogPipeline
+    from config.planet_config import PlanetDevelopmentConfig
+    from src.state.empire_state import EmpireState
+    from src.state.planet_registry import PlanetRegistry
+    from src.state.ship_inventory import ShipInventory
+    from src.state.checkpoint import CheckpointStore
+    record_import_time('core', started)
 except ImportError as e:
-    print(f"❌ Manager import error: {e}")
+    print(f"❌ Import error: {e}")
     print("Make sure all files are in the correct folders!")
     sys.exit(1)
 
+# Scheduler-Job -> Async-Task
+TASK_FOR_JOB = {
+    'status': 'monitoring',
+    'fleet_events': 'monitoring',
+    'raid': 'raiding',
+    'scan_refresh': 'scanning'
+}
+
 class OGameFullBot:
     """
     🚀 VOLLAUTOMATISCHER OGAME BOT
@@ -68,17 +82,49 @@ class OGameFullBot:
     - Automatische Kolonisierung
     """
     
-    def __init__(self):
+    def __init__(self, account=None):
+        # Account aus der Account-Datei (Supervisor-Betrieb) - sonst Einzel-Bot
+        self.account = account or {}
+        self.account_name = self.account.get('name')
+        self.debug_port = self.account.get('debug_port')
+        self.profile_dir = self.account.get('profile_dir', "/tmp/ogame-bot-profile")
+        self.metrics_port = self.account.get('metrics_port', config.METRICS_PORT)
+        self.checkpoint_enabled = self.account.get('checkpoint', config.CHECKPOINT_ENABLED)
+        
         self.driver = None
+        self.launcher = None
         self.wait = None
         self.managers = {}
+        self.ship_inventory = None
+        self.planet_registry = None
+        self.empire_state = None
+        self.empire_status = {}
+        self.scheduler = None
+        self.core = None
+        self.driver_stats = None
+        self.metrics_server = None
+        self.checkpoint = None
+        self.warm_resume = False
         self.running = True
         
         # Setup logging
         self.setup_logging()
         
+        # Eine Sicherung pro Subsystem - kaputte Phasen pausieren, der Rest läuft im vollen Takt
+        self.breakers = BreakerBoard(
+            self.log_pipeline.child('core'),
+            failure_rate=config.BREAKER_FAILURE_RATE,
+            window=config.BREAKER_WINDOW,
+            min_runs=config.BREAKER_MIN_RUNS,
+            cooldown=config.BREAKER_COOLDOWN,
+            max_cooldown=config.BREAKER_MAX_COOLDOWN
+        )
+        
         # Setup signal handler for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
+        signal.signal(signal.SIGTERM, self.signal_handler)
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, self.reload_handler)
         
         self.logger.info("🤖 OGame Full Automation Bot initialized")
 
@@ -87,49 +133,66 @@ class OGameFullBot:
         log_dir = project_root / "logs"
         log_dir.mkdir(exist_ok=True)
         
-        log_file = log_dir / "ogame_bot.log"
+        log_file = log_dir / (f"ogame_bot_{self.account_name}.log" if self.account_name else "ogame_bot.log")
         
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+        # Bot schreibt nur in eine Queue - Datei, JSONL und Konsole im Hintergrund-Thread
+        self.log_pipeline = LogPipeline(
+            f"OGameBot.{self.account_name}" if self.account_name else 'OGameBot',
+            log_file,
+            json_file=log_file.with_suffix('.jsonl') if config.LOG_JSON else None,
+            level=config.LOG_LEVEL,
+            subsystem_levels=config.LOG_LEVELS,
+            max_bytes=config.LOG_MAX_BYTES,
+            backup_count=config.LOG_BACKUP_COUNT,
+            when=config.LOG_ROTATE_WHEN,
+            static={'account': self.account_name} if self.account_name else None
         )
-        
-        # Setup file handler
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        file_handler.setLevel(logging.INFO)
-        
-        # Setup console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        console_handler.setLevel(logging.INFO)
-        
-        # Setup logger
-        self.logger = logging.getLogger('OGameBot')
-        self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-        
-        # Clear any existing handlers to avoid duplicates
-        self.logger.handlers = [file_handler, console_handler]
+        self.logger = self.log_pipeline.logger
 
     def signal_handler(self, signum, frame):
         """Handle Ctrl+C gracefully"""
         self.logger.info("👋 Shutdown signal received...")
         self.running = False
+        RUNTIME.stop()  # Beendet jedes laufende Warten sofort
+        if self.core:
+            self.core.stop()
+
+    def reload_handler(self, signum, frame):
+        """SIGHUP: Config neu laden - passiert im Bot-Thread beim nächsten Aufwachen"""
+        RUNTIME.request_reload()
+        if self.core:
+            self.core.wake('monitoring')
+
+    def apply_reload(self):
+        """Angeforderten Config-Reload ausführen"""
+        if not RUNTIME.take_reload():
+            return False
+            
+        try:
+            importlib.reload(config)
+            for subsystem, level in config.LOG_LEVELS.items():
+                self.log_pipeline.child(subsystem).setLevel(level.upper() if isinstance(level, str) else level)
+            self.logger.info("🔄 Config reloaded")
+        except Exception as e:
+            self.logger.error(f"❌ Config reload failed: {e}")
+            
+        # Status sofort neu bestimmen
+        if self.scheduler:
+            self.scheduler.run_earlier('status', time.time())
+        return True
 
     def find_browser_with_debugging(self):
         """Find browser with remote debugging enabled"""
         self.logger.info("🔍 Searching for browser with remote debugging...")
         
-        ports_to_try = [9223, 9222, 9224, 9225]
+        ports_to_try = [self.debug_port] if self.debug_port else [9223, 9222, 9224, 9225]
         
         for port in ports_to_try:
             try:
-                response = requests.get(f"http://localhost:{port}/json", timeout=2)
-                if response.status_code == 200:
-                    tabs = response.json()
+                with urllib.request.urlopen(f"http://localhost:{port}/json", timeout=2) as response:
+                    status = response.status
+                    tabs = json.loads(response.read().decode('utf-8'))
+                if status == 200:
                     self.logger.info(f"✅ Found browser on port {port} with {len(tabs)} tabs")
                     
                     # Check for OGame tabs
@@ -141,7 +204,7 @@ class OGameFullBot:
                             
                     return port
                     
-            except requests.exceptions.ConnectionError:
+            except (ConnectionError, urllib.error.URLError):
                 continue
             except Exception as e:
                 self.logger.debug(f"Port {port} check failed: {e}")
@@ -159,51 +222,50 @@ class OGameFullBot:
             
         self.logger.info("🚀 Starting new browser with remote debugging...")
         
-        # Try to start Brave Browser
-        brave_cmd = [
-            "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
-            "--remote-debugging-port=9223",
-            "--user-data-dir=/tmp/ogame-bot-profile",
-            "--no-first-run",
-            "--disable-features=VizDisplayCompositor"
-        ]
+        self.launcher = BrowserLauncher(
+            self.logger,
+            port=self.debug_port or 9223,
+            profile_dir=self.profile_dir,
+            headless=self.account.get('headless', config.BROWSER_HEADLESS),
+            window_size=tuple(self.account.get('window_size', config.BROWSER_WINDOW_SIZE)),
+            timeout=config.BROWSER_TIMEOUT
+        )
         
-        try:
-            import subprocess
-            process = subprocess.Popen(
-                brave_cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-            
-            # Wait for browser to start
-            time.sleep(5)
-            
-            # Check if it started successfully
-            port = self.find_browser_with_debugging()
-            if port:
-                self.logger.info("✅ Browser started successfully!")
-                return port
-            else:
-                self.logger.error("❌ Browser started but remote debugging not available")
-                return None
-                
-        except Exception as e:
-            self.logger.error(f"❌ Failed to start browser: {e}")
-            return None
+        if self.launcher.launch():
+            return self.launcher.port
+        return None
 
     def connect_to_browser(self, port):
         """Connect to browser via remote debugging"""
         try:
-            options = Options()
-            options.add_experimental_option("debuggerAddress", f"localhost:{port}")
-            
-            self.driver = webdriver.Chrome(options=options)
-            self.wait = WebDriverWait(self.driver, 30)
-            
-            self.logger.info(f"✅ Connected to browser on port {port}")
+            backend = self.account.get('driver_backend', config.DRIVER_BACKEND)
+            if backend == "cdp":
+                # Direkt über DevTools - ohne chromedriver dazwischen
+                CDPDriver = timed_import('cdp', 'src.browser.cdp_driver').CDPDriver
+                self.driver = CDPDriver(port, self.logger, timeout=config.BROWSER_TIMEOUT)
+                self.logger.info(f"✅ Connected to browser on port {port} (native CDP)")
+            else:
+                webdriver = timed_import('selenium', 'selenium.webdriver')
+                Options = timed_import('selenium', 'selenium.webdriver.chrome.options').Options
+                WebDriverWait = timed_import('selenium', 'selenium.webdriver.support.ui').WebDriverWait
+                
+                options = Options()
+                options.add_experimental_option("debuggerAddress", f"localhost:{port}")
+                
+                self.driver = webdriver.Chrome(options=options)
+                self.wait = WebDriverWait(self.driver, 30)
+                
+                self.logger.info(f"✅ Connected to browser on port {port}")
+                
+            if config.PAGE_SNAPSHOT_MAX_AGE:
+                # Lesende Zugriffe aus einem page_source-Snapshot statt einzeln
+                PageSnapshot = timed_import('snapshot', 'src.browser.snapshot').PageSnapshot
+                self.driver = PageSnapshot(self.driver, self.logger, max_age=config.PAGE_SNAPSHOT_MAX_AGE)
             return True
             
+        except ImportError as e:
+            self.logger.error(f"❌ Missing dependency for backend: {e} - run: python3 ogame_bot.py --install-deps")
+            return False
         except Exception as e:
             self.logger.error(f"❌ Browser connection failed: {e}")
             return False
@@ -213,14 +275,14 @@ class OGameFullBot:
         try:
             self.logger.info("🌐 Navigating to OGame...")
             
-            # OGame lobby URL for German servers
-            ogame_url = "https://lobby.ogame.gameforge.com/de_DE/"
+            # OGame lobby URL for German servers (oder z.B. der lokale Simulator)
+            ogame_url = self.account.get('start_url', config.OGAME_LOGIN_URL)
             
             self.driver.get(ogame_url)
             self.logger.info(f"📍 Opened OGame lobby: {ogame_url}")
             
             # Wait a moment for page to load
-            time.sleep(3)
+            RUNTIME.pause(3)
             
             # Check if we're on OGame page
             current_url = self.driver.current_url
@@ -238,20 +300,147 @@ class OGameFullBot:
     def initialize_managers(self):
         """Initialize all bot managers"""
         try:
+            BuildingManager = timed_import('managers', 'src.managers.building_manager').BuildingManager
+            FleetManager = timed_import('managers', 'src.managers.fleet_manager').FleetManager
+            ColonizationManager = timed_import('managers', 'src.managers.colonization_manager').ColonizationManager
+            ResourceManager = timed_import('managers', 'src.managers.resource_manager').ResourceManager
+            EmpireManager = timed_import('managers', 'src.managers.empire_manager').EmpireManager
+            ResearchManager = timed_import('managers', 'src.managers.research_manager').ResearchManager
+            ShipyardManager = timed_import('managers', 'src.managers.shipyard_manager').ShipyardManager
+            
+            driver = self.driver
+            if config.DRIVER_RETRIES > 1:
+                # Stale Elemente und Timeouts in Millisekunden wiederholen statt den Schritt zu verlieren
+                driver = RetryingDriver(driver, self.log_pipeline.child('driver'), attempts=config.DRIVER_RETRIES)
+            if config.DRIVER_INSTRUMENTATION or self.metrics_port:
+                # Jeden Treiber-Aufruf der Manager zählen und messen
+                if self.driver_stats is None:
+                    self.driver_stats = CallStats(self.log_pipeline.child('driver'))
+                driver = InstrumentedDriver(driver, self.driver_stats)
+            
+            # Ein Logger pro Subsystem - Level einzeln über LOG_LEVELS
+            log = self.log_pipeline.child
+            
+            # Gemeinsamer Schiffs-Cache für Flotte und Kolonisierung
+            self.ship_inventory = ShipInventory(driver, log('inventory'))
+            self.planet_registry = PlanetRegistry(driver, log('planets'))
+            self.empire_state = EmpireState(log('empire'))
+            
             self.managers = {
-                'building': BuildingManager(self.driver, self.logger),
-                'fleet': FleetManager(self.driver, self.logger),
-                'colonization': ColonizationManager(self.driver, self.logger),
-                'resource': ResourceManager(self.driver, self.logger)
+                'building': BuildingManager(driver, log('building')),
+                'fleet': FleetManager(driver, log('fleet'), ship_inventory=self.ship_inventory),
+                'colonization': ColonizationManager(driver, log('colonization'), ship_inventory=self.ship_inventory,
+                                                    planet_registry=self.planet_registry),
+                'resource': ResourceManager(driver, log('resource'))
             }
             
+            # Planeten-Rotation nutzt Gebäude- und Ressourcen-Manager
+            self.managers['empire'] = EmpireManager(
+                driver, log('empire'), self.planet_registry, self.empire_state,
+                self.managers['building'], self.managers['resource'],
+                ship_inventory=self.ship_inventory
+            )
+            self.managers['research'] = ResearchManager(driver, log('research'), self.planet_registry,
+                                                        self.empire_state)
+            
+            # Werft baut was Raids und Kolonisierung brauchen
+            self.managers['shipyard'] = ShipyardManager(
+                driver, log('shipyard'), self.planet_registry, self.empire_state, self.ship_inventory,
+                self.managers['fleet'], self.managers['colonization'], research_manager=self.managers['research']
+            )
+            
             self.logger.info("✅ All managers initialized")
+            self.restore_checkpoint()
             return True
             
         except Exception as e:
             self.logger.error(f"❌ Manager initialization failed: {e}")
             return False
 
+    def switch_to_http_backend(self):
+        """Login-Cookies an den HTTP-Treiber übergeben und Manager neu verdrahten"""
+        try:
+            HTTPDriver = timed_import('http', 'src.browser.http_driver').HTTPDriver
+            http_driver = HTTPDriver.from_browser(self.driver, self.logger, timeout=config.BROWSER_TIMEOUT)
+        except Exception as e:
+            self.logger.error(f"❌ HTTP backend failed: {e}")
+            return False
+            
+        browser_driver = self.driver
+        self.driver = http_driver
+        if not self.initialize_managers():
+            return False
+            
+        self.logger.info(f"✅ Continuing over HTTP: {http_driver.current_url}")
+        
+        if self.launcher and self.launcher.headless:
+            # Headless-Browser wird nur für den Login gebraucht
+            try:
+                browser_driver.quit()
+            except Exception:
+                pass
+            self.launcher.stop()
+            self.logger.info("🔚 Headless browser stopped - session runs browserless")
+        return True
+
+    def open_checkpoint(self):
+        """Checkpoint-Datei öffnen - zu alte Stände werden verworfen"""
+        if self.checkpoint or not self.checkpoint_enabled:
+            return self.checkpoint
+            
+        checkpoint_dir = project_root / config.CHECKPOINT_DIR
+        checkpoint_dir.mkdir(exist_ok=True)
+        name = f"checkpoint_{self.account_name}.db" if self.account_name else "checkpoint.db"
+        
+        try:
+            self.checkpoint = CheckpointStore(checkpoint_dir / name, self.log_pipeline.child('checkpoint'))
+        except Exception as e:
+            self.logger.error(f"❌ Checkpoint not available: {e}")
+            return None
+            
+        saved_at = self.checkpoint.saved_at()
+        if saved_at and time.time() - saved_at > config.CHECKPOINT_MAX_AGE:
+            self.logger.info(f"💾 Checkpoint is {int(time.time() - saved_at) // 3600}h old - starting cold")
+            self.checkpoint.clear()
+        return self.checkpoint
+
+    def restore_checkpoint(self):
+        """Zustände aus dem Checkpoint vorbelegen und ab jetzt mitschreiben lassen"""
+        checkpoint = self.open_checkpoint()
+        if not checkpoint:
+            return False
+            
+        saved_at = checkpoint.saved_at()
+        STEPS.restore(checkpoint)
+        planets = self.planet_registry.restore(checkpoint)
+        self.empire_state.restore(checkpoint)
+        flights = self.ship_inventory.restore(checkpoint)
+        targets = self.managers['fleet'].restore(checkpoint)
+        if self.managers['research'].restore(checkpoint):
+            self.managers['fleet'].raid_config['research'] = self.managers['research'].combat_levels()
+        
+        self.warm_resume = bool(saved_at and planets)
+        if self.warm_resume:
+            age = int(time.time() - saved_at)
+            self.logger.info(f"💾 Warm resume from checkpoint ({age//60}m old): {planets} planets, "
+                             f"{flights} fleets in flight, {targets} cached raid targets")
+        return self.warm_resume
+
+    def reconcile_checkpoint(self):
+        """Warmen Cache einmal gegen das Spiel abgleichen statt alles neu zu entdecken"""
+        if not self.warm_resume:
+            return
+            
+        self.logger.info("🔄 Reconciling checkpoint with the game...")
+        if self.planet_registry.refresh():
+            planet_ids = self.planet_registry.planet_ids()
+            self.empire_state.forget(planet_ids)
+            
+        # Ein Abruf für Ressourcen, Gebäude und Schiffe aller Planeten, dann die Flotten
+        self.managers['empire'].load_empire_overview()
+        self.ship_inventory.sync_event_list()
+        self.warm_resume = False
+
     def find_ogame_tab(self):
         """Find and switch to OGame tab"""
         try:
@@ -286,11 +475,12 @@ class OGameFullBot:
                         self.logger.info("🎮 Game detected! Starting automation...")
                         return True
                         
-                time.sleep(3)
-                
             except Exception as e:
                 self.logger.debug(f"Login check error: {e}")
-                time.sleep(3)
+                
+            # Kurzes Polling - ein Stop beendet das Warten sofort
+            if RUNTIME.wait(1):
+                break
                 
         return False
 
@@ -325,7 +515,10 @@ class OGameFullBot:
             self.logger.info(f"🏗️ Building Ready: {status['ready_for_building']}")
             self.logger.info(f"🏴‍☠️ Raid Ready: {status['ready_for_raids']}")
             self.logger.info(f"🌟 Colonization Ready: {status['ready_for_colonization']}")
+            self.logger.info(f"🔌 Subsystems: {self.breakers.summary()}")
+            status['breakers'] = self.breakers.status()
             
+            self.update_metrics(status)
             return status
             
         except Exception as e:
@@ -334,6 +527,14 @@ class OGameFullBot:
 
     def execute_automation_cycle(self):
         """Execute one complete automation cycle"""
+        started = time.perf_counter()
+        try:
+            return self.run_automation_cycle()
+        finally:
+            metrics.CYCLE_DURATION.observe(time.perf_counter() - started, job='automation_cycle')
+
+    def run_automation_cycle(self):
+        """Status, Aufbau, Raids und Kolonisierung nacheinander"""
         self.logger.info("🤖 === FULL AUTOMATION CYCLE ===")
         
         try:
@@ -351,35 +552,32 @@ class OGameFullBot:
                 
             # === PHASE 1: BUILDING DEVELOPMENT ===
             self.logger.info("🏗️ === PHASE 1: BUILDING ===")
-            if empire_status.get('ready_for_building', False):
-                try:
-                    building_success = self.managers['building'].smart_planet_development(empire_status['resources'])
-                    if building_success:
-                        self.logger.info("✅ Building construction started!")
-                except Exception as e:
-                    self.logger.error(f"❌ Building phase error: {e}")
+            # Ein Aufruf der Sicherung pro Phase - der Fallback zählt nicht doppelt
+            self.breakers.run('building', self.building_phase, empire_status)
+            
+            # Rückkehrende Flotten aus der Ereignisliste übernehmen
+            try:
+                self.ship_inventory.sync_event_list()
+            except Exception as e:
+                self.logger.debug(f"Event list sync failed: {e}")
             
             # === PHASE 2: RAIDING ===
             self.logger.info("🏴‍☠️ === PHASE 2: RAIDING ===")
             if empire_status.get('ready_for_raids', False):
-                try:
-                    raid_success = self.managers['fleet'].auto_raid_cycle()
-                    if raid_success:
-                        self.logger.info("✅ Raid launched successfully!")
-                except Exception as e:
-                    self.logger.error(f"❌ Raiding phase error: {e}")
+                raid_success = self.breakers.run('raid', self.raid_cycle)
+                if raid_success:
+                    self.logger.info("✅ Raid launched successfully!")
             else:
                 self.logger.info("💰 Not enough resources for raiding yet")
             
             # === PHASE 3: COLONIZATION ===
             self.logger.info("🏛️ === PHASE 3: COLONIZATION ===")
             if empire_status.get('ready_for_colonization', False):
-                try:
-                    colonization_success = self.managers['colonization'].auto_colonization_cycle(empire_status['resources'])
-                    if colonization_success:
-                        self.logger.info("🌟 Colonization fleet launched!")
-                except Exception as e:
-                    self.logger.error(f"❌ Colonization phase error: {e}")
+                colonization_success = self.breakers.run('colonization',
+                                                         self.managers['colonization'].auto_colonization_cycle,
+                                                         empire_status['resources'])
+                if colonization_success:
+                    self.logger.info("🌟 Colonization fleet launched!")
             else:
                 # Show progress towards colonization
                 resources = empire_status['resources']
@@ -395,12 +593,66 @@ class OGameFullBot:
                     self.logger.info(f"💾 Saving for colonization - Need: M:{metal_needed:,} C:{crystal_needed:,} D:{deuterium_needed:,}")
             
             self.logger.info("✅ === AUTOMATION CYCLE COMPLETE ===")
+            self.report_driver_calls("automation cycle")
             return True
             
         except Exception as e:
             self.logger.error(f"❌ Automation cycle error: {e}")
             return False
 
+    def building_phase(self, empire_status):
+        """Alle Planeten im Wechsel entwickeln - ohne Planeten-Liste nur den aktuellen"""
+        built = None
+        try:
+            built = self.managers['empire'].develop_all_planets()
+        except Exception as e:
+            self.logger.error(f"❌ Empire development error: {e}")
+            if not empire_status.get('ready_for_building', False):
+                raise
+            
+        if built is None and empire_status.get('ready_for_building', False):
+            # Fallback: nur der aktuell ausgewählte Planet
+            if self.managers['building'].smart_planet_development(empire_status['resources']):
+                self.logger.info("✅ Building construction started!")
+        return built
+
+    def report_driver_calls(self, label):
+        """Teuerste Selektoren seit dem letzten Bericht (nur mit DRIVER_INSTRUMENTATION)"""
+        if not self.driver_stats:
+            return
+        if config.DRIVER_INSTRUMENTATION:
+            self.driver_stats.report(label, limit=config.DRIVER_REPORT_TOP)
+        else:
+            self.driver_stats.reset()  # Nur für die Metriken gemessen
+
+    def start_metrics(self):
+        """Lokalen /metrics-Endpunkt starten (METRICS_PORT bzw. metrics_port des Accounts)"""
+        if not self.metrics_port:
+            return False
+        metrics.REGISTRY.set_constant_labels(account=self.account_name)
+        self.metrics_server = metrics.MetricsServer(self.logger, host=config.METRICS_HOST, port=self.metrics_port)
+        return self.metrics_server.start()
+
+    def update_metrics(self, status):
+        """Ressourcen, Kolonien und Bauschleifen-Auslastung für den Metrik-Endpunkt"""
+        for resource in ('metal', 'crystal', 'deuterium', 'energy'):
+            try:
+                metrics.RESOURCES.set(int(status['resources'].get(resource) or 0), resource=resource)
+            except ValueError:
+                continue
+        metrics.COLONIES.set(status.get('colonies', 0))
+        
+        if self.empire_state and self.empire_state.planets:
+            now = time.time()
+            busy = 0
+            for planet_id, state in self.empire_state.planets.items():
+                occupied = bool(state['queue_end'] and state['queue_end'] > now)
+                metrics.QUEUE_BUSY.set(int(occupied), planet=planet_id)
+                busy += occupied
+            metrics.QUEUE_UTILIZATION.set(round(busy / len(self.empire_state.planets), 3))
+        
+        metrics.update_loot_rate()
+
     def calculate_next_cycle_delay(self, empire_status):
         """Calculate adaptive delay for next cycle"""
         if empire_status.get('ready_for_colonization', False):
@@ -413,65 +665,390 @@ class OGameFullBot:
             return 600  # 10 minutes - waiting mode
 
     def run_main_loop(self):
-        """Main automation loop"""
+        """Main automation loop - event driven job scheduler"""
         self.logger.info("🚀 === STARTING MAIN AUTOMATION LOOP ===")
         
-        cycle = 1
+        if config.RUN_MODE == "async":
+            return self.run_async_core()
+            
+        self.scheduler = JobScheduler(self.log_pipeline.child('core'), wait=self.wait_for_next_job,
+                                      checkpoint=self.checkpoint, breakers=self.breakers)
+        self.setup_jobs()
+        
+        # Jobs haben eigene Sicherungen - diese gilt nur noch für die Schleife selbst
+        breaker = self.breakers.get('main_loop')
         
         while self.running:
-            try:
-                self.logger.info(f"🔄 === CYCLE #{cycle} ===")
-                
-                # Get empire status
-                empire_status = self.get_empire_status()
-                
-                # Execute automation
-                success = self.execute_automation_cycle()
+            if not breaker.allow():
+                self.sleep_with_updates(breaker.retry_in())
+                continue
                 
-                if success:
-                    cycle += 1
-                    
-                    # Calculate adaptive delay
-                    delay = self.calculate_next_cycle_delay(empire_status)
-                    
-                    if empire_status.get('ready_for_colonization', False):
-                        self.logger.info(f"🚀 TURBO MODE - Next cycle in {delay//60} minutes")
-                    elif empire_status.get('ready_for_raids', False):
-                        self.logger.info(f"⚔️ ACTIVE MODE - Next cycle in {delay//60} minutes")
-                    else:
-                        self.logger.info(f"🏗️ BUILDING MODE - Next cycle in {delay//60} minutes")
-                    
-                    # Sleep with periodic status updates
-                    self.sleep_with_updates(delay)
-                else:
-                    self.logger.warning("⚠️ Cycle failed, retrying in 5 minutes...")
-                    self.sleep_with_updates(300)
+            try:
+                if not self.scheduler.run_next(should_continue=lambda: self.running):
+                    if self.running:
+                        self.logger.warning("⚠️ No jobs scheduled - re-creating job plan")
+                        self.setup_jobs()
+                breaker.record_success()
                     
             except KeyboardInterrupt:
                 self.logger.info("👋 Shutdown requested by user")
                 break
             except Exception as e:
                 self.logger.error(f"❌ Main loop error: {e}")
-                self.logger.info("⏳ Waiting 5 minutes before retry...")
-                self.sleep_with_updates(300)
+                breaker.record_failure(e)
+                delay = breaker.retry_in() or failure_delay(e, 300)
+                self.logger.info(f"⏳ Waiting {int(delay)}s before retry...")
+                self.sleep_with_updates(delay)
+
+    def setup_jobs(self):
+        """Plane die wiederkehrenden Jobs"""
+        self.scheduler.schedule('status', self.job_status)
+        self.scheduler.resume('building', self.job_building)
+        self.scheduler.resume('fleet_events', self.job_fleet_events)
+        self.scheduler.resume('raid', self.job_raid)
+        self.scheduler.resume('colonization', self.job_colonization)
+        self.scheduler.resume('scan_refresh', self.job_scan_refresh, 3600)
+        if config.AUTO_RESEARCH:
+            self.scheduler.resume('research', self.job_research, 20)
+        if config.AUTO_SHIPYARD:
+            self.scheduler.resume('shipyard', self.job_shipyard, 30)
+
+    def request_run(self, key, delay=0):
+        """Job/Task früher ausführen (Scheduler oder Async-Kern)"""
+        if self.scheduler:
+            moved = self.scheduler.run_earlier(key, time.time() + max(0, delay))
+            if moved:
+                RUNTIME.wake()  # Laufendes Warten auf den alten nächsten Job beenden
+            return moved
+        if self.core:
+            return self.core.wake(TASK_FOR_JOB.get(key, key), max(0, delay))
+        return False
+
+    def run_async_core(self):
+        """Subsysteme als asyncio-Tasks ausführen"""
+        self.core = AsyncCore(self.log_pipeline.child('core'), checkpoint=self.checkpoint, breakers=self.breakers)
+        self.core.add_subsystem('monitoring', self.task_monitoring)
+        self.core.add_subsystem('building', self.task_building, initial_delay=5)
+        self.core.add_subsystem('raiding', self.task_raiding, initial_delay=10)
+        self.core.add_subsystem('colonization', self.task_colonization, initial_delay=15)
+        self.core.add_subsystem('scanning', self.task_scanning, initial_delay=3600)
+        if config.AUTO_RESEARCH:
+            self.core.add_subsystem('research', self.task_research, initial_delay=20)
+        if config.AUTO_SHIPYARD:
+            self.core.add_subsystem('shipyard', self.task_shipyard, initial_delay=30)
+        
+        try:
+            self.core.run()
+        finally:
+            self.core = None
+
+    async def task_monitoring(self):
+        """Task: Empire-Status und Flotten-Ereignisse"""
+        self.apply_reload()
+        status_delay = await self.core.browser(self.job_status, priority=PRIORITY_NORMAL)
+        events_delay = await self.core.browser(self.job_fleet_events, priority=PRIORITY_NORMAL)
+        return min(status_delay, events_delay)
+
+    async def task_building(self):
+        """Task: Planeten entwickeln"""
+        return await self.core.browser(self.job_building, priority=PRIORITY_CRITICAL)
+
+    async def task_raiding(self):
+        """Task: Galaxie schrittweise scannen, dann Raid starten"""
+        status = self.empire_status or {}
+        if not status.get('ready_for_raids', False):
+            return self.calculate_next_cycle_delay(status)
+            
+        fleet = self.managers['fleet']
+        if not await self.core.browser(fleet.has_raid_ships, priority=PRIORITY_NORMAL):
+            self.logger.info("🚢 Not enough raid ships available")
+            return 600
+            
+        targets = fleet.cached_targets()
+        if targets:
+            self.logger.info(f"🗂️ Using {len(targets)} cached raid targets")
+        else:
+            self.logger.info("🔍 === SCANNING FOR RAID TARGETS ===")
+            if not await self.core.browser(fleet.navigate_to_galaxy, priority=PRIORITY_BACKGROUND):
+                raise PhaseFailed("galaxy view not found")
+                
+            # Lock nach jedem System freigeben - wichtigere Tasks dürfen dazwischen
+            offsets = fleet.scan_offsets()
+            scanned = metrics.SCAN_SYSTEMS.get(result='ok')
+            failed = metrics.SCAN_SYSTEMS.get(result='failed')
+            for offset in offsets:
+                targets.extend(await self.core.browser(fleet.scan_system, offset, True, priority=PRIORITY_BACKGROUND))
+                if await self.core.sleep(2):
+                    return None
+                    
+            metrics.record_scan_pass(metrics.SCAN_SYSTEMS.get(result='ok') - scanned, len(offsets), len(targets))
+            self.check_scan(scanned, failed)
+            fleet.remember_targets(targets)
+        if fleet.espionage_due():
+            html = await self.core.browser(fleet.fetch_espionage_reports, priority=PRIORITY_BACKGROUND)
+            fleet.record_reports(await self.core.offload(fleet.parse_espionage_messages, html))
+        # Kampf-Simulation der ausspionierten Ziele ohne Browser-Lock
+        targets = await self.core.offload(fleet.rank_targets, targets)
+        if not targets:
+            self.logger.info("🔍 No suitable raid targets found")
+            return self.calculate_next_cycle_delay(status)
+            
+        best_target = targets[0]
+        self.logger.info(f"🎯 Best target: {best_target['coordinates']} (Score: {best_target['score']})")
+        
+        if await self.core.browser(fleet.launch_raid, best_target['coordinates'], fleet.raid_config['raid_ship_count'],
+                                   fleet.expected_loot(best_target),
+                                   priority=PRIORITY_CRITICAL):
+            self.logger.info("✅ Raid launched successfully!")
+            self.request_run('fleet_events', 60)
+            return 300
+            
+        self.logger.warning("❌ Raid launch failed")
+        return self.calculate_next_cycle_delay(status)
+
+    async def task_colonization(self):
+        """Task: Kolonisierung"""
+        return await self.core.browser(self.job_colonization, priority=PRIORITY_NORMAL)
+
+    async def task_research(self):
+        """Task: Labor belegen - wacht zum Forschungsende wieder auf"""
+        return await self.core.browser(self.job_research, priority=PRIORITY_NORMAL)
+
+    async def task_shipyard(self):
+        """Task: fehlende Raid- und Kolonie-Schiffe bestellen"""
+        return await self.core.browser(self.job_shipyard, priority=PRIORITY_NORMAL)
+
+    async def task_scanning(self):
+        """Task: Planeten-Liste und Imperium-Übersicht (Parsing ohne Browser-Lock)"""
+        empire = self.managers['empire']
+        await self.core.browser(self.planet_registry.refresh, priority=PRIORITY_BACKGROUND)
+        html = await self.core.browser(empire.fetch_empire_overview, priority=PRIORITY_BACKGROUND)
+        planets = await self.core.offload(empire.parse_empire_overview, html)
+        # Zustand nur unter dem Browser-Lock ändern - die anderen Jobs lesen dieselben Dicts
+        await self.core.browser(empire.apply_planets, planets, priority=PRIORITY_BACKGROUND)
+        return 3600
+
+    def wait_for_next_job(self, seconds):
+        """Warten bis zum nächsten fälligen Job"""
+        seconds = int(seconds + 0.999)
+        if seconds >= 60:
+            next_job = self.scheduler.next_job()
+            if next_job:
+                self.logger.info(f"⏰ Next job '{next_job.key}' in {seconds//60}m {seconds%60}s")
+        self.sleep_with_updates(seconds)
+        self.apply_reload()
+
+    def ensure_game_tab(self):
+        """Sicherstellen dass der OGame-Tab aktiv ist"""
+        if not self.find_ogame_tab():
+            self.logger.warning("⚠️ Lost OGame connection!")
+            return False
+        return True
+
+    def job_status(self):
+        """Job: Empire-Status lesen und Modus bestimmen"""
+        # Ein Status-Intervall = ein Zyklus für den Treiber-Bericht
+        self.report_driver_calls("since last status")
+        
+        if not self.ensure_game_tab():
+            return 300
+            
+        status = self.get_empire_status()
+        if not status:
+            raise PhaseFailed("empire status could not be read")
+            
+        self.empire_status = status
+        delay = self.calculate_next_cycle_delay(status)
+        
+        if status.get('ready_for_colonization', False):
+            self.logger.info(f"🚀 TURBO MODE - Next status check in {delay//60} minutes")
+            self.request_run('colonization')
+        elif status.get('ready_for_raids', False):
+            self.logger.info(f"⚔️ ACTIVE MODE - Next status check in {delay//60} minutes")
+        else:
+            self.logger.info(f"🏗️ BUILDING MODE - Next status check in {delay//60} minutes")
+            
+        return delay
+
+    def job_building(self):
+        """Job: Planeten entwickeln - wacht zum nächsten Bauende wieder auf"""
+        if not self.ensure_game_tab():
+            return 300
+            
+        self.logger.info("🏗️ === BUILDING ===")
+        built = self.managers['empire'].develop_all_planets()
+        
+        if built is None:
+            # Keine Planeten-Liste: nur aktueller Planet
+            status = self.empire_status or self.get_empire_status()
+            if status.get('ready_for_building', False):
+                if self.managers['building'].smart_planet_development(status['resources']):
+                    self.logger.info("✅ Building construction started!")
+            return PlanetDevelopmentConfig.BUILD_CHECK_INTERVAL
+            
+        next_ready = self.empire_state.next_ready_time(self.planet_registry.planet_ids())
+        if next_ready is None:
+            return PlanetDevelopmentConfig.BUILD_CHECK_INTERVAL
+        return max(30, next_ready - time.time())
+
+    def job_fleet_events(self):
+        """Job: Flotten-Rückkehr und fertige Schiffe übernehmen"""
+        self.ship_inventory.sync_event_list()
+        
+        next_event = self.ship_inventory.next_event_time()
+        if next_event is None:
+            return 900 if self.ship_inventory.flights else 1800
+            
+        # Raids direkt nach Rückkehr der Flotte wieder möglich
+        self.request_run('raid', next_event + 5 - time.time())
+        return max(10, next_event - time.time() + 1)
+
+    def job_raid(self):
+        """Job: Raid starten wenn Ressourcen und Schiffe reichen"""
+        status = self.empire_status or {}
+        if not status.get('ready_for_raids', False):
+            self.logger.info("💰 Not enough resources for raiding yet")
+            return self.calculate_next_cycle_delay(status)
+            
+        if not self.ensure_game_tab():
+            return 300
+            
+        self.logger.info("🏴‍☠️ === RAIDING ===")
+        if self.raid_cycle(wait_after_launch=False):
+            self.logger.info("✅ Raid launched successfully!")
+            # Rückkehr in der Ereignisliste nachsehen
+            self.request_run('fleet_events', 60)
+            return 300
+            
+        return self.calculate_next_cycle_delay(status)
+
+    def raid_cycle(self, wait_after_launch=True):
+        """Raid-Zyklus der Flotte - ein Scan, bei dem jedes System scheitert, zählt als Fehlschlag"""
+        scanned = metrics.SCAN_SYSTEMS.get(result='ok')
+        failed = metrics.SCAN_SYSTEMS.get(result='failed')
+        launched = self.managers['fleet'].auto_raid_cycle(wait_after_launch=wait_after_launch)
+        if not launched:
+            self.check_scan(scanned, failed)
+        return launched
+
+    def check_scan(self, scanned, failed):
+        """Kein System lesbar (z.B. geändertes Galaxie-Layout) - Sicherung der Raid-Phase zählt mit"""
+        ok = metrics.SCAN_SYSTEMS.get(result='ok') - scanned
+        errors = metrics.SCAN_SYSTEMS.get(result='failed') - failed
+        if errors and not ok:
+            raise PhaseFailed(f"galaxy scan failed in all {errors} systems")
+
+    def job_colonization(self):
+        """Job: Kolonisierung sobald bezahlbar"""
+        status = self.empire_status or {}
+        resources = status.get('resources', {})
+        
+        if not status.get('ready_for_colonization', False):
+            required = self.managers['colonization'].colonization_config['required_resources']
+            wait = self.time_until_affordable(resources, required)
+            if wait is not None:
+                self.logger.info(f"💾 Colonization affordable in ~{int(wait)//60} minutes")
+                return max(60, min(wait, 6 * 3600))
+            return 1800
+            
+        if not self.ensure_game_tab():
+            return 300
+            
+        self.logger.info("🏛️ === COLONIZATION ===")
+        if self.managers['colonization'].auto_colonization_cycle(resources):
+            self.logger.info("🌟 Colonization fleet launched!")
+            # Kolonieschiff ist verbraucht - Ersatz bestellen
+            self.request_run('shipyard')
+            return 3600
+        return 1800
+
+    def job_research(self):
+        """Job: Forschung starten sobald das Labor frei ist"""
+        research = self.managers['research']
+        if not research.queue_end or research.queue_end <= time.time():
+            if not self.ensure_game_tab():
+                return 300
+            self.logger.info("🔬 === RESEARCH ===")
+            
+        delay = research.research_cycle()
+        # Eigene Kampf-Forschung für die Raid-Simulation
+        self.managers['fleet'].raid_config['research'] = research.combat_levels()
+        return max(30, delay)
+
+    def job_shipyard(self):
+        """Job: Werft-Aufträge für Raids und Kolonisierung - wacht zur Fertigstellung wieder auf"""
+        if not self.ensure_game_tab():
+            return 300
+            
+        self.logger.info("🏭 === SHIPYARD ===")
+        delay = self.managers['shipyard'].shipyard_cycle()
+        
+        # Fertige Schiffe über die Ereignis-Prüfung gutschreiben
+        next_event = self.ship_inventory.next_event_time()
+        if next_event:
+            self.request_run('fleet_events', next_event + 1 - time.time())
+        return delay
+
+    def job_scan_refresh(self):
+        """Job: Planeten-Liste und Imperium-Übersicht auffrischen"""
+        if not self.ensure_game_tab():
+            return 300
+            
+        self.planet_registry.refresh()
+        self.managers['empire'].load_empire_overview()
+        return 3600
+
+    def time_until_affordable(self, resources, cost):
+        """Sekunden bis cost mit aktueller Produktion bezahlbar ist (None = unbekannt)"""
+        planet_id = self.planet_registry.active_planet_id() if self.planet_registry else None
+        production = self.empire_state.get(planet_id)['production'] if planet_id else {}
+        
+        wait = 0
+        for resource, amount in cost.items():
+            missing = amount - int(resources.get(resource, '0') or '0')
+            if missing <= 0:
+                continue
+            per_hour = int(production.get(resource, '0') or '0')
+            if per_hour <= 0:
+                return None
+            wait = max(wait, missing / per_hour * 3600)
+        return wait
 
     def sleep_with_updates(self, total_seconds):
-        """Sleep with periodic status updates"""
+        """Schlafen mit Status-Meldung jede Minute - Stop oder neue Arbeit beenden es sofort"""
         update_interval = 60  # Update every minute
-        elapsed = 0
+        deadline = time.time() + total_seconds
+        generation = RUNTIME.generation
         
-        while elapsed < total_seconds and self.running:
-            time.sleep(min(update_interval, total_seconds - elapsed))
-            elapsed += update_interval
-            
-            if elapsed < total_seconds:
-                remaining = total_seconds - elapsed
+        while self.running:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+                
+            if RUNTIME.wait(min(update_interval, remaining)) or RUNTIME.generation != generation:
+                return  # Gestoppt oder geweckt
+                
+            remaining = int(deadline - time.time())
+            if remaining > 0:
                 self.logger.info(f"😴 Sleeping... {remaining//60}m {remaining%60}s remaining")
 
     def cleanup(self):
         """Clean up resources"""
+        if self.metrics_server:
+            self.metrics_server.stop()
+            
+        if self.checkpoint:
+            self.checkpoint.close()
+            
+        if self.managers.get('fleet') and self.managers['fleet'].combat:
+            self.managers['fleet'].combat.close()
+            
         try:
-            if self.driver:
+            if self.launcher and self.launcher.headless:
+                # Headless-Browser braucht niemand mehr
+                self.launcher.stop()
+                self.logger.info("🔚 Bot finished (headless browser stopped)")
+            elif self.driver:
                 self.logger.info("🔚 Bot finished (browser stays open for your use)")
                 # Don't quit driver - leave browser open for user
         except:
@@ -514,6 +1091,7 @@ class OGameFullBot:
         """Main entry point - start the complete automation"""
         try:
             self.print_startup_banner()
+            self.start_metrics()
             
             # Step 1: Find or start browser
             port = self.start_browser_if_needed()
@@ -533,11 +1111,20 @@ class OGameFullBot:
             # Step 4: Initialize managers
             if not self.initialize_managers():
                 return False
+            self.logger.info(f"📦 Startup imports: {import_report()}")
                 
             # Step 5: Wait for OGame login
             if not self.wait_for_ogame_login():
                 return False
                 
+            # Step 5b: Ab hier ohne Browser weiterarbeiten (nur Cookies übernehmen)
+            if self.account.get('driver_backend', config.DRIVER_BACKEND) == "http":
+                if not self.switch_to_http_backend():
+                    return False
+                
+            # Step 5c: Zustand aus dem Checkpoint mit einem frischen Lesezugriff abgleichen
+            self.reconcile_checkpoint()
+                
             # Step 6: Start main automation loop
             self.run_main_loop()
             
@@ -549,9 +1136,47 @@ class OGameFullBot:
         finally:
             self.cleanup()
 
+def parse_args():
+    """Kommandozeilen-Argumente"""
+    parser = argparse.ArgumentParser(description="OGame Full Automation Bot")
+    parser.add_argument("--supervise", metavar="FILE", help="start one worker per account from FILE")
+    parser.add_argument("--accounts", metavar="FILE", help="account file for --account")
+    parser.add_argument("--account", metavar="NAME", help="run a single account from the account file")
+    parser.add_argument("--start-url", metavar="URL", help="open URL instead of the lobby (e.g. the local simulator)")
+    parser.add_argument("--install-deps", action="store_true", help="install requirements.txt and exit")
+    parser.add_argument("--import-times", action="store_true", help="import all backends and report import times")
+    return parser.parse_args()
+
 def main():
     """Main function"""
-    bot = OGameFullBot()
+    args = parse_args()
+    
+    if args.install_deps:
+        from src.core.startup import install_dependencies
+        sys.exit(install_dependencies())
+        
+    if args.import_times:
+        from src.core.startup import measure_all_imports
+        measure_all_imports()
+        sys.exit(0)
+        
+    if args.supervise:
+        from src.core.supervisor import Supervisor, setup_supervisor_logging
+        supervisor = Supervisor(args.supervise, setup_supervisor_logging())
+        sys.exit(0 if supervisor.run() else 1)
+        
+    account = None
+    if args.account:
+        from src.core.supervisor import find_account
+        account = find_account(args.accounts or str(project_root / "config" / "accounts.json"), args.account)
+        if not account:
+            print(f"❌ Account '{args.account}' not found!")
+            sys.exit(1)
+            
+    if args.start_url:
+        account = dict(account or {}, start_url=args.start_url)
+        
+    bot = OGameFullBot(account)
     success = bot.start()
     
     if not success:
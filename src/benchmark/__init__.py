@@ -0,0 +1 @@
+# OGame Bot Benchmark Module
@@ -0,0 +1,469 @@
+import argparse
+import json
+import logging
+import platform
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.core.runtime import RUNTIME
+from src.simulator.server import SimulatorServer
+from src.simulator.universe import Universe
+
+project_root = Path(__file__).resolve().parent.parent.parent
+
+PHASES = ['status', 'building', 'events', 'raid_scan', 'dispatch', 'colonization', 'other']
+
+# (Objekt, Methode, Phase) - verschachtelte Phasen zählen exklusiv
+PHASE_HOOKS = [
+    ('bot', 'find_ogame_tab', 'status'),
+    ('bot', 'get_empire_status', 'status'),
+    ('empire', 'develop_all_planets', 'building'),
+    ('building', 'smart_planet_development', 'building'),
+    ('ship_inventory', 'sync_event_list', 'events'),
+    ('fleet', 'auto_raid_cycle', 'raid_scan'),
+    ('fleet', 'launch_raid', 'dispatch'),
+    ('colonization', 'auto_colonization_cycle', 'colonization'),
+    ('colonization', 'launch_colonization_fleet', 'dispatch')
+]
+
+# Kennzahlen für den Baseline-Vergleich (Abschnitt, Statistik)
+COMPARE_METRICS = [
+    ('latency_ms', 'p50'),
+    ('latency_ms', 'p95'),
+    ('work_ms', 'p95'),
+    ('calls', 'mean'),
+    ('requests', 'mean')
+]
+
+# Einstellungen, die zwischen Lauf und Baseline gleich sein sollten
+COMPARABLE_SETTINGS = ['backend', 'cycles', 'cycle_gap', 'seed', 'galaxies', 'systems', 'speed',
+                       'latency_ms', 'jitter_ms']
+
+
+class PhaseRecorder:
+    """
+    Misst pro Zyklus und Phase Arbeitszeit, (virtuelle) Schlafzeit,
+    Treiber-Aufrufe und Simulator-Anfragen. Die Phasen bilden einen
+    Stapel: solange eine innere Phase läuft, ruht die Zeit der äußeren.
+    """
+
+    def __init__(self):
+        self.cycles = []
+        self.current = None
+        self.stack = []  # [Phase, Startzeit]
+        self.lock = threading.Lock()
+
+    def start_cycle(self):
+        self.current = {phase: {'work': 0.0, 'sleep': 0.0, 'calls': 0, 'requests': 0} for phase in PHASES}
+        self.stack = [['other', time.perf_counter()]]
+
+    def finish_cycle(self, ok):
+        phase, started = self.stack.pop()
+        self.current[phase]['work'] += time.perf_counter() - started
+        self.cycles.append({'ok': bool(ok), 'phases': self.current})
+        self.current = None
+
+    def phase(self):
+        return self.stack[-1][0] if self.stack else 'other'
+
+    def enter(self, phase):
+        now = time.perf_counter()
+        if self.current is not None and self.stack:
+            top = self.stack[-1]
+            self.current[top[0]]['work'] += now - top[1]
+            self.stack.append([phase, now])
+
+    def leave(self):
+        now = time.perf_counter()
+        if self.current is not None and len(self.stack) > 1:
+            phase, started = self.stack.pop()
+            self.current[phase]['work'] += now - started
+            self.stack[-1][1] = now
+
+    def wrap(self, func, phase):
+        def measured(*args, **kwargs):
+            self.enter(phase)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.leave()
+        return measured
+
+    def count(self, key, amount=1):
+        if self.current is None:
+            return
+        with self.lock:
+            self.current[self.phase()][key] += amount
+
+    def add_call(self):
+        self.count('calls')
+
+    def add_sleep(self, seconds):
+        self.count('sleep', seconds)
+
+    def count_requests(self, route):
+        """Simulator-Anfragen der gerade laufenden Phase zuordnen"""
+        def counted(*args, **kwargs):
+            self.count('requests')
+            return route(*args, **kwargs)
+        return counted
+
+
+class VirtualClock:
+    """
+    Ersetzt time.time/time.sleep und RUNTIME.wait während des Laufs:
+    Schlafen im Bot-Thread wartet nicht, sondern verschiebt nur die Uhr
+    (und wird als Schlafzeit gezählt). Der Simulator läuft auf derselben Uhr; seine Latenz in den
+    Server-Threads wird echt abgewartet.
+    """
+
+    def __init__(self, recorder):
+        self.recorder = recorder
+        self.offset = 0.0
+        self.thread = threading.current_thread()
+        self.real_time = time.time
+        self.real_sleep = time.sleep
+
+    def time(self):
+        return self.real_time() + self.offset
+
+    def sleep(self, seconds):
+        if threading.current_thread() is not self.thread:
+            return self.real_sleep(seconds)
+        seconds = max(0.0, seconds)
+        self.offset += seconds
+        self.recorder.add_sleep(seconds)
+
+    def wait(self, seconds, wakeable=True):
+        """RUNTIME.wait/pause auf der virtuellen Uhr"""
+        self.sleep(seconds)
+        return RUNTIME.stopped
+
+    def advance(self, seconds):
+        self.offset += seconds
+
+    def install(self):
+        time.time = self.time
+        time.sleep = self.sleep
+        RUNTIME.wait = self.wait
+
+    def uninstall(self):
+        time.time = self.real_time
+        time.sleep = self.real_sleep
+        del RUNTIME.wait
+
+
+class CountingProxy:
+    """Zählt jeden Zugriff auf Treiber und Elemente für die laufende Phase"""
+
+    def __init__(self, target, recorder):
+        self.target = target
+        self.recorder = recorder
+
+    def __getattr__(self, name):
+        value = getattr(self.target, name)
+        if not callable(value):
+            self.recorder.add_call()  # Property wie current_url/text = ein Aufruf
+            return value
+
+        def call(*args, **kwargs):
+            self.recorder.add_call()
+            args = [arg.target if isinstance(arg, CountingProxy) else arg for arg in args]
+            return self.wrap(value(*args, **kwargs))
+        return call
+
+    def wrap(self, result):
+        if isinstance(result, list):
+            return [self.wrap(item) for item in result]
+        if hasattr(result, 'click') and hasattr(result, 'get_attribute'):
+            return CountingProxy(result, self.recorder)
+        return result
+
+
+def percentile(values, pct):
+    """Perzentil mit linearer Interpolation"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+def summarize(values, digits=3):
+    if not values:
+        return {'p50': 0, 'p95': 0, 'p99': 0, 'mean': 0, 'max': 0}
+    return {
+        'p50': round(percentile(values, 50), digits),
+        'p95': round(percentile(values, 95), digits),
+        'p99': round(percentile(values, 99), digits),
+        'mean': round(sum(values) / len(values), digits),
+        'max': round(max(values), digits)
+    }
+
+
+def summarize_rows(rows):
+    """Zyklus-Messwerte einer Phase (oder der Summe) -> Perzentile"""
+    return {
+        'latency_ms': summarize([(r['work'] + r['sleep']) * 1000 for r in rows]),
+        'work_ms': summarize([r['work'] * 1000 for r in rows]),
+        'sleep_ms': summarize([r['sleep'] * 1000 for r in rows]),
+        'calls': summarize([r['calls'] for r in rows], digits=1),
+        'requests': summarize([r['requests'] for r in rows], digits=1)
+    }
+
+
+def build_report(cycles, settings):
+    totals = []
+    for cycle in cycles:
+        phases = cycle['phases'].values()
+        totals.append({key: sum(p[key] for p in phases) for key in ('work', 'sleep', 'calls', 'requests')})
+
+    return {
+        'settings': settings,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'cycles': len(cycles),
+        'failed_cycles': sum(1 for c in cycles if not c['ok']),
+        'total': summarize_rows(totals),
+        'phases': {phase: summarize_rows([c['phases'][phase] for c in cycles]) for phase in PHASES}
+    }
+
+
+def compare(report, baseline, tolerance=0.10, noise_ms=2.0):
+    """Lauf gegen Baseline: Regression = mehr als tolerance schlechter (und über dem Rauschen)"""
+    sections = {'total': (report['total'], baseline.get('total', {}))}
+    for phase in PHASES:
+        sections[phase] = (report['phases'][phase], baseline.get('phases', {}).get(phase, {}))
+
+    rows = []
+    for name, (current, base) in sections.items():
+        for metric, stat in COMPARE_METRICS:
+            before = base.get(metric, {}).get(stat)
+            after = current.get(metric, {}).get(stat)
+            if before is None or after is None:
+                continue
+
+            delta = after - before
+            change = delta / before if before else None
+            floor = noise_ms if metric.endswith('_ms') else 0
+            regression = delta > floor and (change is None or change > tolerance)
+
+            rows.append({
+                'phase': name,
+                'metric': f"{metric}.{stat}",
+                'baseline': before,
+                'current': after,
+                'delta': round(delta, 3),
+                'change': round(change, 4) if change is not None else None,
+                'regression': regression
+            })
+    return rows
+
+
+def print_report(report, logger):
+    logger.info(f"📊 === CYCLE BENCHMARK ({report['cycles']} cycles, {report['failed_cycles']} failed) ===")
+    logger.info(f"{'phase':<13}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'work p95':>10}"
+                f"{'sleep p95':>11}{'calls':>8}{'requests':>10}")
+    for name, data in [*report['phases'].items(), ('total', report['total'])]:
+        latency = data['latency_ms']
+        logger.info(f"{name:<13}{latency['p50']:>10.1f}{latency['p95']:>10.1f}{latency['p99']:>10.1f}"
+                    f"{data['work_ms']['p95']:>10.1f}{data['sleep_ms']['p95']:>11.1f}"
+                    f"{data['calls']['mean']:>8.1f}{data['requests']['mean']:>10.1f}")
+
+
+def print_comparison(rows, logger):
+    regressions = [r for r in rows if r['regression']]
+    for row in rows:
+        if not row['delta']:
+            continue
+        change = f"{row['change'] * 100:+.1f}%" if row['change'] is not None else "new"
+        marker = "❌" if row['regression'] else "  "
+        logger.info(f"{marker} {row['phase']:<13}{row['metric']:<16}{row['baseline']:>12}"
+                    f" -> {row['current']:<12}{change:>9}")
+
+    if regressions:
+        logger.warning(f"⚠️ {len(regressions)} regression(s) against baseline")
+    else:
+        logger.info("✅ No regressions against baseline")
+    return regressions
+
+
+def create_bot(options, server, recorder):
+    """Bot gegen den Simulator verbinden; der Treiber zählt jeden Aufruf"""
+    from ogame_bot import OGameFullBot  # Erst hier: prüft beim Import Selenium
+    from src.browser.snapshot import PageSnapshot
+
+    # Immer kalt starten - ein Checkpoint des letzten Laufs würde den Vergleich verfälschen
+    bot = OGameFullBot(account={'name': 'benchmark', 'start_url': server.url, 'checkpoint': False})
+    if not options.verbose:
+        bot.log_pipeline.set_console_level(logging.WARNING)
+
+    if options.backend == 'http':
+        from src.browser.http_driver import HTTPDriver
+        driver = HTTPDriver(server.local_url, bot.logger)
+        driver.get(server.local_url)
+        bot.driver = CountingProxy(driver, recorder)
+    else:
+        port = bot.start_browser_if_needed()
+        if not port or not bot.connect_to_browser(port):
+            raise RuntimeError("Browser not available")
+        bot.driver.get(server.url)
+        if isinstance(bot.driver, PageSnapshot):
+            # Nur echte Treiber-Aufrufe zählen, nicht die aus dem Snapshot
+            bot.driver.driver = CountingProxy(bot.driver.driver, recorder)
+        else:
+            bot.driver = CountingProxy(bot.driver, recorder)
+
+    if not bot.initialize_managers():
+        raise RuntimeError("Manager initialization failed")
+    return bot
+
+
+def instrument(bot, recorder):
+    """Phasen-Methoden am Objekt mit Zeitmessung überdecken"""
+    targets = {'bot': bot, 'ship_inventory': bot.ship_inventory, **bot.managers}
+    for owner, method, phase in PHASE_HOOKS:
+        target = targets.get(owner)
+        if target is not None and hasattr(target, method):
+            setattr(target, method, recorder.wrap(getattr(target, method), phase))
+
+
+def run_benchmark(options, logger):
+    """N Automatisierungs-Zyklen gegen den Simulator -> Bericht"""
+    settings = {
+        'backend': options.backend,
+        'cycles': options.cycles,
+        'cycle_gap': options.cycle_gap,
+        'seed': options.seed,
+        'galaxies': options.galaxies,
+        'systems': options.systems,
+        'speed': options.speed,
+        'latency_ms': options.latency,
+        'jitter_ms': options.jitter
+    }
+
+    recorder = PhaseRecorder()
+    clock = VirtualClock(recorder)
+    clock.install()
+    server = None
+    bot = None
+
+    try:
+        universe = Universe(seed=options.seed, galaxies=options.galaxies, systems=options.systems,
+                            speed=options.speed, clock=clock.time)
+        server = SimulatorServer(universe, logger, port=0, latency=options.latency / 1000,
+                                 jitter=options.jitter / 1000, seed=options.seed)
+        server.route = recorder.count_requests(server.route)
+        server.start()
+
+        bot = create_bot(options, server, recorder)
+        instrument(bot, recorder)
+
+        for cycle in range(1, options.cycles + 1):
+            if not bot.running:
+                break
+            recorder.start_cycle()
+            started = time.perf_counter()
+            ok = bot.execute_automation_cycle()
+            recorder.finish_cycle(ok)
+
+            phases = recorder.cycles[-1]['phases']
+            sleep = sum(p['sleep'] for p in phases.values())
+            logger.info(f"🔁 Cycle {cycle}/{options.cycles}: {(time.perf_counter() - started) * 1000:.0f} ms work, "
+                        f"{sleep:.0f} s sleep, {sum(p['calls'] for p in phases.values())} driver calls"
+                        f"{'' if ok else ' (failed)'}")
+
+            # Spielzeit bis zum nächsten Zyklus (Bau, Produktion, Flotten)
+            clock.advance(options.cycle_gap)
+
+    finally:
+        clock.uninstall()
+        if bot and bot.driver:
+            try:
+                bot.driver.quit()
+            except Exception:
+                pass
+        if bot and bot.launcher:
+            bot.launcher.stop()
+        if server:
+            server.stop()
+
+    return build_report(recorder.cycles, settings)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Automation cycle latency benchmark against the local simulator")
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--backend", choices=["http", "browser"], default="http",
+                        help="http = browserless driver, browser = Chromium via DRIVER_BACKEND")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--galaxies", type=int, default=1)
+    parser.add_argument("--systems", type=int, default=50)
+    parser.add_argument("--speed", type=int, default=1, help="universe speed")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated response delay in milliseconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random +/- delay in milliseconds")
+    parser.add_argument("--cycle-gap", type=float, default=900, help="game seconds between two cycles")
+    parser.add_argument("--output", help="result JSON (default: logs/benchmark_<timestamp>.json)")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed relative slowdown (0.10 = 10%%)")
+    parser.add_argument("--noise-ms", type=float, default=2.0, help="ignore time differences below this")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit code 1 on regressions")
+    parser.add_argument("--verbose", action="store_true", help="show the bot's console log")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S')
+    logger = logging.getLogger('OGameBenchmark')
+    logging.getLogger('OGameSimulator').setLevel(logging.WARNING)
+
+    report = run_benchmark(options, logger)
+    print_report(report, logger)
+
+    output = Path(options.output) if options.output else \
+        project_root / "logs" / f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json"
+
+    baseline_path = Path(options.baseline) if options.baseline else None
+    regressions = []
+    if baseline_path and baseline_path.exists() and not options.save_baseline:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+
+        differing = [key for key in COMPARABLE_SETTINGS
+                     if baseline.get('settings', {}).get(key) != report['settings'].get(key)]
+        if differing:
+            logger.warning(f"⚠️ Baseline was recorded with different settings: {', '.join(differing)}")
+
+        report['comparison'] = {'baseline': str(baseline_path), 'tolerance': options.tolerance,
+                                'rows': compare(report, baseline, options.tolerance, options.noise_ms)}
+        regressions = print_comparison(report['comparison']['rows'], logger)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"💾 Results written to {output}")
+
+    if options.save_baseline:
+        if not baseline_path:
+            logger.error("❌ --save-baseline needs --baseline PATH")
+            return 2
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"📌 Baseline saved to {baseline_path}")
+
+    if regressions and options.fail_on_regression:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+# OGame Bot Browser Module
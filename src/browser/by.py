@@ -0,0 +1,13 @@
+# Locator-Strategien wie selenium.webdriver.common.by.By - ohne beim Import
+# das komplette selenium.webdriver-Paket (alle Browser-Treiber) zu laden
+
+
+class By:
+    ID = "id"
+    XPATH = "xpath"
+    LINK_TEXT = "link text"
+    PARTIAL_LINK_TEXT = "partial link text"
+    NAME = "name"
+    TAG_NAME = "tag name"
+    CLASS_NAME = "class name"
+    CSS_SELECTOR = "css selector"
@@ -0,0 +1,467 @@
+import json
+import time
+import urllib.request
+
+try:
+    from selenium.common.exceptions import (NoSuchElementException, StaleElementReferenceException,
+                                            TimeoutException, WebDriverException)
+except ImportError:
+    class WebDriverException(Exception):
+        pass
+
+    class NoSuchElementException(WebDriverException):
+        pass
+
+    class StaleElementReferenceException(WebDriverException):
+        pass
+
+    class TimeoutException(WebDriverException):
+        pass
+
+# Gleiche Werte wie selenium.webdriver.common.by.By
+BY_ID = "id"
+BY_XPATH = "xpath"
+BY_LINK_TEXT = "link text"
+BY_PARTIAL_LINK_TEXT = "partial link text"
+BY_NAME = "name"
+BY_TAG_NAME = "tag name"
+BY_CLASS_NAME = "class name"
+BY_CSS_SELECTOR = "css selector"
+
+# Alle Element-Handles liegen in einer Objekt-Gruppe und werden bei der
+# Navigation gemeinsam freigegeben (sonst sammeln sie sich im Tab an)
+OBJECT_GROUP = "ogame-bot-elements"
+MAX_HANDLES = 2000  # Ohne Navigation (Ajax-Seiten) spätestens dann freigeben
+
+# JS-Ausdruck der (root, value) -> Array von Elementen liefert
+FIND_FUNCTIONS = {
+    BY_CSS_SELECTOR: "function (root, v) { return Array.prototype.slice.call(root.querySelectorAll(v)); }",
+    BY_ID: "function (root, v) { return Array.prototype.slice.call(root.querySelectorAll('[id=\"' + CSS.escape(v) + '\"]')); }",
+    BY_NAME: "function (root, v) { return Array.prototype.slice.call(root.querySelectorAll('[name=\"' + CSS.escape(v) + '\"]')); }",
+    BY_CLASS_NAME: "function (root, v) { return Array.prototype.slice.call(root.getElementsByClassName(v)); }",
+    BY_TAG_NAME: "function (root, v) { return Array.prototype.slice.call(root.getElementsByTagName(v)); }",
+    BY_XPATH: """function (root, v) {
+        var doc = root.ownerDocument || root;
+        var result = doc.evaluate(v, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var out = [];
+        for (var i = 0; i < result.snapshotLength; i++) { out.push(result.snapshotItem(i)); }
+        return out;
+    }""",
+    BY_LINK_TEXT: """function (root, v) {
+        return Array.prototype.filter.call(root.querySelectorAll('a'), function (a) { return a.innerText.trim() === v; });
+    }""",
+    BY_PARTIAL_LINK_TEXT: """function (root, v) {
+        return Array.prototype.filter.call(root.querySelectorAll('a'), function (a) { return a.innerText.indexOf(v) !== -1; });
+    }"""
+}
+
+# Selenium-ähnliches get_attribute: Property bevorzugt, sonst Attribut
+GET_ATTRIBUTE_FUNCTION = """function (name) {
+    var value = this[name];
+    if (value === undefined || value === null || typeof value === 'object' || typeof value === 'function') {
+        value = this.getAttribute(name);
+    }
+    if (value === null || value === undefined) { return null; }
+    if (value === true) { return 'true'; }
+    return String(value);
+}"""
+
+
+class CDPConnection:
+    """Persistente Websocket-Verbindung zu einem DevTools-Target"""
+
+    def __init__(self, ws_url, timeout=30):
+        import websocket  # websocket-client
+
+        self.ws = websocket.create_connection(ws_url, timeout=timeout, suppress_origin=True)
+        self.timeout = timeout
+        self.next_id = 0
+        self.events = []
+
+    def send(self, method, params=None, timeout=None):
+        """CDP-Befehl senden und auf die passende Antwort warten"""
+        self.next_id += 1
+        message_id = self.next_id
+        self.ws.send(json.dumps({'id': message_id, 'method': method, 'params': params or {}}))
+
+        deadline = time.time() + (timeout or self.timeout)
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutException(f"CDP {method} timed out")
+            self.ws.settimeout(remaining)
+            message = json.loads(self.ws.recv())
+
+            if message.get('id') == message_id:
+                if 'error' in message:
+                    raise WebDriverException(f"CDP {method}: {message['error'].get('message')}")
+                return message.get('result', {})
+
+            if 'method' in message:
+                self.events.append(message)
+                del self.events[:-100]  # Nur die letzten Ereignisse behalten
+
+    def wait_for_event(self, method, timeout=30):
+        """Auf ein Ereignis warten (z.B. Page.loadEventFired)"""
+        for index, event in enumerate(self.events):
+            if event['method'] == method:
+                del self.events[:index + 1]
+                return event
+
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            self.ws.settimeout(max(0.01, deadline - time.time()))
+            try:
+                message = json.loads(self.ws.recv())
+            except Exception:
+                break
+            if message.get('method') == method:
+                return message
+        raise TimeoutException(f"Timed out waiting for {method}")
+
+    def close(self):
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+
+
+class CDPElement:
+    """Element-Handle (Runtime-Objekt) mit Selenium-ähnlicher API"""
+
+    def __init__(self, driver, object_id):
+        self.driver = driver
+        self.object_id = object_id
+
+    def call(self, function, *args):
+        """Funktion mit this = Element ausführen"""
+        return self.driver.call_function(self.object_id, function, args)
+
+    @property
+    def text(self):
+        return self.call("function () { return this.innerText !== undefined ? this.innerText : this.textContent; }") or ""
+
+    @property
+    def tag_name(self):
+        return (self.call("function () { return this.tagName; }") or "").lower()
+
+    def get_attribute(self, name):
+        return self.call(GET_ATTRIBUTE_FUNCTION, name)
+
+    def is_displayed(self):
+        return bool(self.call("function () { var r = this.getBoundingClientRect(); return r.width > 0 && r.height > 0; }"))
+
+    def click(self):
+        """Echter Maus-Klick in die Element-Mitte (Fallback: element.click())"""
+        box = self.call("""function () {
+            this.scrollIntoView({block: 'center'});
+            var r = this.getBoundingClientRect();
+            return {x: r.left + r.width / 2, y: r.top + r.height / 2, w: r.width, h: r.height};
+        }""")
+
+        if not box or not box.get('w') or not box.get('h'):
+            self.call("function () { this.click(); }")
+        else:
+            for event_type in ('mousePressed', 'mouseReleased'):
+                self.driver.cdp.send('Input.dispatchMouseEvent', {
+                    'type': event_type, 'x': box['x'], 'y': box['y'], 'button': 'left', 'clickCount': 1
+                })
+        self.driver.after_interaction()
+
+    def clear(self):
+        self.call("""function () {
+            this.focus();
+            this.value = '';
+            this.dispatchEvent(new Event('input', {bubbles: true}));
+            this.dispatchEvent(new Event('change', {bubbles: true}));
+        }""")
+
+    def send_keys(self, *values):
+        """Text eingeben - Enter wird als Tastendruck gesendet"""
+        self.call("function () { this.focus(); }")
+        text = ''.join(str(v) for v in values)
+
+        for index, chunk in enumerate(text.split('\n')):
+            if index > 0:
+                for event_type in ('keyDown', 'keyUp'):
+                    self.driver.cdp.send('Input.dispatchKeyEvent', {
+                        'type': event_type, 'key': 'Enter', 'code': 'Enter', 'windowsVirtualKeyCode': 13,
+                        'text': '\r' if event_type == 'keyDown' else ''
+                    })
+            if chunk:
+                self.driver.cdp.send('Input.insertText', {'text': chunk})
+
+    def submit(self):
+        self.call("function () { (this.form || this).submit(); }")
+        self.driver.after_interaction()
+
+    def find_element(self, by=BY_ID, value=None):
+        return self.driver.find_element(by, value, root=self)
+
+    def find_elements(self, by=BY_ID, value=None):
+        return self.driver.find_elements(by, value, root=self)
+
+
+class SwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.attach(handle)
+
+
+class CDPDriver:
+    """
+    Treiber, der direkt über das DevTools-Protokoll spricht (ohne chromedriver).
+
+    Bietet die Teilmenge der Selenium-API, die die Manager benutzen:
+    get, find_element(s), execute_script, execute_async_script,
+    page_source, current_url, title, window_handles, switch_to.window.
+    """
+
+    def __init__(self, port, logger, timeout=30):
+        self.port = port
+        self.logger = logger
+        self.timeout = timeout
+        self.script_timeout = 30
+        self.cdp = None
+        self.current_handle = None
+        self.switch_to = SwitchTo(self)
+        self.handles = 0  # Element-Handles seit der letzten Freigabe
+
+        handles = self.window_handles
+        if not handles:
+            raise WebDriverException(f"No page target on port {port}")
+        self.attach(handles[0])
+
+    # === TARGETS ===
+
+    def targets(self):
+        """Offene Tabs laut /json"""
+        with urllib.request.urlopen(f"http://localhost:{self.port}/json", timeout=5) as response:
+            return [t for t in json.loads(response.read().decode('utf-8')) if t.get('type') == 'page']
+
+    @property
+    def window_handles(self):
+        return [t['id'] for t in self.targets()]
+
+    @property
+    def current_window_handle(self):
+        return self.current_handle
+
+    def attach(self, handle):
+        """Mit einem Tab verbinden"""
+        if handle == self.current_handle and self.cdp:
+            return
+
+        target = next((t for t in self.targets() if t['id'] == handle), None)
+        if not target:
+            raise WebDriverException(f"Unknown window handle {handle}")
+
+        if self.cdp:
+            self.release_elements()
+            self.cdp.close()
+        self.cdp = CDPConnection(target['webSocketDebuggerUrl'], timeout=self.timeout)
+        self.cdp.send('Page.enable')
+        self.current_handle = handle
+
+    # === NAVIGATION ===
+
+    def get(self, url):
+        """Seite laden und auf das load-Ereignis warten"""
+        self.release_elements()
+        self.cdp.events.clear()
+        result = self.cdp.send('Page.navigate', {'url': url})
+        if result.get('errorText'):
+            raise WebDriverException(f"Navigation failed: {result['errorText']}")
+        if result.get('loaderId'):
+            self.cdp.wait_for_event('Page.loadEventFired', timeout=self.timeout)
+
+    def refresh(self):
+        self.release_elements()
+        self.cdp.events.clear()
+        self.cdp.send('Page.reload')
+        self.cdp.wait_for_event('Page.loadEventFired', timeout=self.timeout)
+
+    def after_interaction(self):
+        """Nach Klicks: kurz auf eine evtl. ausgelöste Navigation warten"""
+        try:
+            state = self.evaluate("document.readyState")
+            if state != 'complete':
+                self.release_elements()
+                self.cdp.wait_for_event('Page.loadEventFired', timeout=self.timeout)
+        except Exception:
+            pass
+
+    @property
+    def current_url(self):
+        return self.evaluate("location.href")
+
+    @property
+    def title(self):
+        return self.evaluate("document.title")
+
+    @property
+    def page_source(self):
+        return self.evaluate("document.documentElement.outerHTML")
+
+    def get_cookies(self):
+        """Cookies der aktuellen Seite im Selenium-Format"""
+        result = self.cdp.send('Network.getCookies', {'urls': [self.current_url]})
+        return [{
+            'name': c['name'],
+            'value': c['value'],
+            'domain': c.get('domain'),
+            'path': c.get('path', '/'),
+            'secure': c.get('secure', False),
+            'httpOnly': c.get('httpOnly', False)
+        } for c in result.get('cookies', [])]
+
+    # === SCRIPTS ===
+
+    def evaluate(self, expression, await_promise=False, timeout=None):
+        """JS-Ausdruck auswerten und Wert zurückgeben"""
+        result = self.cdp.send('Runtime.evaluate', {
+            'expression': expression,
+            'returnByValue': True,
+            'awaitPromise': await_promise
+        }, timeout=timeout)
+        return self.unwrap(result)
+
+    def call_function(self, object_id, function, args=(), return_by_value=True, timeout=None):
+        """Funktion mit this = Objekt ausführen (Argumente dürfen Elemente sein)"""
+        try:
+            params = {
+                'objectId': object_id,
+                'functionDeclaration': function,
+                'arguments': [self.wrap_argument(a) for a in args],
+                'returnByValue': return_by_value,
+                'awaitPromise': True
+            }
+            if not return_by_value:
+                params['objectGroup'] = OBJECT_GROUP
+            result = self.cdp.send('Runtime.callFunctionOn', params, timeout=timeout)
+        except WebDriverException as e:
+            if 'Could not find object' in str(e) or 'Cannot find context' in str(e):
+                raise StaleElementReferenceException(str(e))
+            raise
+        return self.unwrap(result) if return_by_value else result.get('result', {})
+
+    def wrap_argument(self, value):
+        if isinstance(value, CDPElement):
+            return {'objectId': value.object_id}
+        return {'value': value}
+
+    def unwrap(self, result):
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            message = details.get('exception', {}).get('description') or details.get('text')
+            raise WebDriverException(f"JavaScript error: {message}")
+        return result.get('result', {}).get('value')
+
+    def evaluate_handle(self, expression):
+        """JS-Ausdruck auswerten und Remote-Objekt zurückgeben"""
+        result = self.cdp.send('Runtime.evaluate', {'expression': expression, 'objectGroup': OBJECT_GROUP})
+        self.unwrap(result)
+        return result.get('result', {})
+
+    def release_elements(self):
+        """Alle Element-Handles im Tab freigeben - alte CDPElemente werden stale"""
+        if not self.handles or not self.cdp:
+            return
+        self.handles = 0
+        try:
+            self.cdp.send('Runtime.releaseObjectGroup', {'objectGroup': OBJECT_GROUP})
+        except WebDriverException:
+            pass  # Kontext schon weg (Navigation) - Objekte sind mit ihm freigegeben
+
+    def reserve_handles(self):
+        """Vor einer neuen Suche ab der Seite: ohne Navigation nicht unbegrenzt Handles sammeln"""
+        if self.handles >= MAX_HANDLES:
+            self.release_elements()
+
+    def execute_script(self, script, *args):
+        """Wie Selenium: script ist ein Funktions-Body, Argumente in arguments[]"""
+        function = f"function () {{ {script}\n}}"
+        return self.run_function(function, args)
+
+    def execute_async_script(self, script, *args):
+        """Wie Selenium: letzter Parameter ist der Callback"""
+        function = f"""function () {{
+            var args = Array.prototype.slice.call(arguments);
+            return new Promise(function (resolve) {{
+                args.push(resolve);
+                (function () {{ {script}\n}}).apply(null, args);
+            }});
+        }}"""
+        return self.run_function(function, args, timeout=self.script_timeout)
+
+    def run_function(self, function, args, timeout=None):
+        """Ohne Element-Argumente reicht ein Runtime.evaluate (ein Round-Trip)"""
+        elements = [a for a in args if isinstance(a, CDPElement)]
+        if elements:
+            return self.call_function(elements[0].object_id, function, args, timeout=timeout)
+        return self.evaluate(f"({function}).apply(null, {json.dumps(list(args))})", await_promise=True,
+                             timeout=timeout)
+
+    def set_script_timeout(self, seconds):
+        self.script_timeout = seconds
+
+    def implicitly_wait(self, seconds):
+        pass  # Wie bei den Managern: keine impliziten Wartezeiten
+
+    # === ELEMENTE ===
+
+    def find_elements(self, by=BY_ID, value=None, root=None):
+        """Elemente suchen - ein Aufruf für die Suche, einer für die Handles
+
+        Die Handles liegen in OBJECT_GROUP und leben bis zur nächsten Navigation bzw.
+        MAX_HANDLES Suchen ohne Navigation (danach: StaleElementReferenceException,
+        der RetryingDriver sucht das Element dann neu).
+        """
+        find = FIND_FUNCTIONS.get(by)
+        if not find:
+            raise WebDriverException(f"Unsupported locator: {by}")
+
+        if root:
+            array = self.call_function(root.object_id, f"function (v) {{ return ({find})(this, v); }}", [value],
+                                       return_by_value=False)
+        else:
+            self.reserve_handles()
+            array = self.evaluate_handle(f"({find})(document, {json.dumps(value)})")
+        if not array.get('objectId'):
+            return []
+
+        properties = self.cdp.send('Runtime.getProperties', {'objectId': array['objectId'], 'ownProperties': True})
+        # Das Array selbst wird nicht mehr gebraucht - die Element-Handles bleiben in der Gruppe
+        self.cdp.send('Runtime.releaseObject', {'objectId': array['objectId']})
+        elements = []
+        for prop in properties.get('result', []):
+            if prop.get('name', '').isdigit() and prop.get('value', {}).get('objectId'):
+                elements.append((int(prop['name']), CDPElement(self, prop['value']['objectId'])))
+        self.handles += len(elements)
+        return [element for _, element in sorted(elements, key=lambda e: e[0])]
+
+    def find_element(self, by=BY_ID, value=None, root=None):
+        """Erstes passendes Element - ein einziger Aufruf"""
+        find = FIND_FUNCTIONS.get(by)
+        if not find:
+            raise WebDriverException(f"Unsupported locator: {by}")
+
+        if root:
+            result = self.call_function(root.object_id, f"function (v) {{ return ({find})(this, v)[0] || null; }}",
+                                        [value], return_by_value=False)
+        else:
+            self.reserve_handles()
+            result = self.evaluate_handle(f"({find})(document, {json.dumps(value)})[0] || null")
+        if not result.get('objectId'):
+            raise NoSuchElementException(f"No element for {by}={value}")
+        self.handles += 1
+        return CDPElement(self, result['objectId'])
+
+    def quit(self):
+        if self.cdp:
+            self.cdp.close()
+            self.cdp = None
+
+    close = quit
@@ -0,0 +1,402 @@
+import json
+import re
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.browser.cdp_driver import (BY_ID, NoSuchElementException, StaleElementReferenceException,
+                                    WebDriverException)
+from src.browser.scripts import (BULK_READ_SCRIPT, CURRENT_PLANET_SCRIPT, EVENT_LIST_SCRIPT, FETCH_SCRIPT,
+                                 PLANET_LIST_SCRIPT, QUEUE_END_SCRIPT, RESEARCH_READ_SCRIPT)
+from src.parsers.page_parser import (parse_document, read_current_planet, read_event_rows, read_planet_list,
+                                     read_queue_end, read_research, read_ships, select_elements, visible_text)
+
+# Flotten-Versand läuft in OGame per Ajax statt per Formular
+FLEET_SEND_URL = "index.php?page=ingame&component=fleetdispatch&action=sendFleet&ajax=1&asJson=1"
+FLEET_SEND_BUTTONS = ['sendFleet', 'continueToFleet3']
+FLEET_SEND_DEFAULTS = {'type': '1', 'speed': '10', 'metal': '0', 'crystal': '0', 'deuterium': '0'}
+
+TOKEN_PATTERN = re.compile(r"""(?:fleetSendingToken|token)\s*[=:]\s*["']([0-9a-fA-F]+)["']""")
+URL_PATTERN = re.compile(r"""["']((?:https?://|index\.php\?)[^"']+)["']""")
+
+
+class HTTPElement:
+    """lxml-Element mit Selenium-ähnlicher API"""
+
+    def __init__(self, driver, element):
+        self.driver = driver
+        self.element = element
+        self.generation = driver.generation
+
+    def check(self):
+        if self.generation != self.driver.generation:
+            raise StaleElementReferenceException("Page changed since the element was found")
+
+    @property
+    def text(self):
+        self.check()
+        return visible_text(self.element)
+
+    @property
+    def tag_name(self):
+        return self.element.tag.lower()
+
+    def get_attribute(self, name):
+        self.check()
+        if name in ('textContent', 'innerText'):
+            return self.element.text_content()
+        if name == 'checked':
+            return 'true' if self.element.get('checked') is not None else None
+        if name == 'value' and self.element.tag == 'textarea':
+            return self.element.text or ''
+        return self.element.get(name)
+
+    def is_displayed(self):
+        style = (self.element.get('style') or '').replace(' ', '').lower()
+        return self.element.get('type') != 'hidden' and 'display:none' not in style
+
+    def click(self):
+        self.check()
+        self.driver.click(self.element)
+
+    def clear(self):
+        self.check()
+        self.driver.set_value(self.element, '')
+
+    def send_keys(self, *values):
+        """Text an den Feldwert anhängen - Enter schickt das Formular ab"""
+        self.check()
+        text = ''.join(str(v) for v in values)
+        value = (self.get_attribute('value') or '') + text.replace('\n', '')
+        self.driver.set_value(self.element, value)
+        if '\n' in text:
+            self.submit()
+
+    def submit(self):
+        self.check()
+        form = self.driver.form_of(self.element)
+        if form is None:
+            raise WebDriverException("Element is not inside a form")
+        self.driver.submit_form(form)
+
+    def find_element(self, by=BY_ID, value=None):
+        self.check()
+        return self.driver.find_element(by, value, root=self.element)
+
+    def find_elements(self, by=BY_ID, value=None):
+        self.check()
+        return self.driver.find_elements(by, value, root=self.element)
+
+
+class SwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        pass  # Nur ein "Tab"
+
+
+class HTTPDriver:
+    """
+    Treiber ohne Browser: gepoolte requests.Session plus lxml.
+
+    Startet mit den Cookies eines eingeloggten Browsers und bietet die
+    Teilmenge der Selenium-API, die die Manager benutzen. Klicks auf
+    Links und Formular-Buttons werden zu GET/POST-Anfragen, die
+    Lese-Scripts der Manager (Schiffe, Ereignisliste, Planeten-Liste,
+    Bauschleife, Hintergrund-fetch) laufen als lxml-Parser.
+    """
+
+    WINDOW_HANDLE = 'http'
+
+    def __init__(self, start_url, logger, cookies=None, user_agent=None, timeout=30, pool_size=4):
+        self.logger = logger
+        self.timeout = timeout
+        self.start_url = start_url
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=2)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+
+        for cookie in cookies or []:
+            self.session.cookies.set(cookie['name'], cookie['value'],
+                                     domain=cookie.get('domain') or '', path=cookie.get('path') or '/')
+
+        self.current_url = start_url
+        self.html = ''
+        self.doc = None
+        self.generation = 0  # Zählt Seitenwechsel - alte Elemente werden "stale"
+        self.switch_to = SwitchTo(self)
+
+        # Lese-Scripts der Manager -> lxml-Gegenstück
+        self.scripts = {
+            BULK_READ_SCRIPT: self.script_read_ships,
+            EVENT_LIST_SCRIPT: self.script_event_list,
+            CURRENT_PLANET_SCRIPT: lambda: read_current_planet(self.require_document()),
+            PLANET_LIST_SCRIPT: lambda: read_planet_list(self.require_document()),
+            QUEUE_END_SCRIPT: lambda: read_queue_end(self.require_document()),
+            RESEARCH_READ_SCRIPT: self.script_read_research,
+            FETCH_SCRIPT: self.script_fetch
+        }
+
+    @classmethod
+    def from_browser(cls, driver, logger, **kwargs):
+        """Session eines eingeloggten Browsers übernehmen und aktuelle Seite laden"""
+        start_url = driver.current_url
+        cookies = driver.get_cookies()
+        try:
+            user_agent = driver.execute_script("return navigator.userAgent;")
+        except Exception:
+            user_agent = None
+
+        http_driver = cls(start_url, logger, cookies=cookies, user_agent=user_agent, **kwargs)
+        http_driver.get(start_url)
+        return http_driver
+
+    # === HTTP ===
+
+    def absolute(self, url):
+        return urljoin(self.current_url or self.start_url, url)
+
+    def request(self, method, url, **kwargs):
+        """Anfrage senden - Weiterleitung in die Lobby heißt: Session abgelaufen"""
+        try:
+            response = self.session.request(method, self.absolute(url), timeout=self.timeout, **kwargs)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise WebDriverException(f"HTTP {method} failed: {e}")
+
+        if 'lobby' in urlsplit(response.url).netloc:
+            raise WebDriverException("Session expired - log in with the browser again")
+        return response
+
+    def load(self, response):
+        """Antwort als aktuelle Seite übernehmen"""
+        self.current_url = response.url
+        self.html = response.text
+        self.doc = parse_document(self.html)
+        self.generation += 1
+
+    def fetch(self, url):
+        """Seite im Hintergrund holen (aktuelle Seite bleibt)"""
+        return self.request('GET', url).text
+
+    def require_document(self):
+        if self.doc is None:
+            raise WebDriverException("No page loaded")
+        return self.doc
+
+    # === NAVIGATION ===
+
+    def get(self, url):
+        self.load(self.request('GET', url))
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    @property
+    def title(self):
+        if self.doc is None:
+            return ''
+        found = self.doc.xpath('//title')
+        return found[0].text_content().strip() if found else ''
+
+    @property
+    def page_source(self):
+        return self.html
+
+    @property
+    def window_handles(self):
+        return [self.WINDOW_HANDLE]
+
+    @property
+    def current_window_handle(self):
+        return self.WINDOW_HANDLE
+
+    def get_cookies(self):
+        return [{'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path}
+                for c in self.session.cookies]
+
+    # === SCRIPTS ===
+
+    def execute_script(self, script, *args):
+        """Nur die bekannten Lese-Scripts - beliebiges JavaScript gibt es ohne Browser nicht"""
+        handler = self.scripts.get(script)
+        if not handler:
+            raise WebDriverException("JavaScript is not available in the HTTP backend")
+        return handler(*args)
+
+    execute_async_script = execute_script
+
+    def script_read_ships(self, url=None):
+        try:
+            doc = parse_document(self.fetch(url)) if url else self.doc
+        except WebDriverException as e:
+            return {'error': str(e)}
+        if doc is None:
+            return {'error': 'empty page'}
+        return read_ships(doc)
+
+    def script_read_research(self, url=None):
+        try:
+            doc = parse_document(self.fetch(url)) if url else self.doc
+        except WebDriverException as e:
+            return {'error': str(e)}
+        if doc is None:
+            return {'error': 'empty page'}
+        return read_research(doc)
+
+    def script_event_list(self, url):
+        try:
+            doc = parse_document(self.fetch(url))
+        except WebDriverException as e:
+            return {'error': str(e)}
+        return read_event_rows(doc) if doc is not None else {'rows': []}
+
+    def script_fetch(self, url):
+        try:
+            return self.fetch(url)
+        except WebDriverException:
+            return ''
+
+    def set_script_timeout(self, seconds):
+        pass  # Anfragen nutzen self.timeout
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    # === ELEMENTE ===
+
+    def find_elements(self, by=BY_ID, value=None, root=None):
+        root = root if root is not None else self.doc
+        if root is None:
+            return []
+
+        try:
+            found = select_elements(root, by, value)
+        except Exception as e:
+            raise WebDriverException(f"Invalid selector {by}={value}: {e}")
+
+        return [HTTPElement(self, element) for element in found]
+
+    def find_element(self, by=BY_ID, value=None, root=None):
+        elements = self.find_elements(by, value, root=root)
+        if not elements:
+            raise NoSuchElementException(f"No element for {by}={value}")
+        return elements[0]
+
+    # === INTERAKTION ===
+
+    def set_value(self, element, value):
+        if element.tag == 'textarea':
+            element.text = value
+        else:
+            element.set('value', value)
+
+    def form_of(self, element):
+        """Umschließendes <form> (oder über das form=-Attribut)"""
+        form_id = element.get('form')
+        if form_id and self.doc is not None:
+            found = self.doc.xpath('//form[@id=$v]', v=form_id)
+            if found:
+                return found[0]
+        for ancestor in element.iterancestors('form'):
+            return ancestor
+        return None
+
+    def click(self, element):
+        """Klick als HTTP-Anfrage nachbilden"""
+        tag = element.tag.lower()
+        input_type = (element.get('type') or '').lower()
+
+        if input_type == 'radio':
+            scope = self.form_of(element)
+            scope = scope if scope is not None else self.doc
+            for other in scope.xpath('.//input[@type="radio"][@name=$v]', v=element.get('name') or ''):
+                other.attrib.pop('checked', None)
+            element.set('checked', 'checked')
+            return
+        if input_type == 'checkbox':
+            if element.get('checked') is not None:
+                element.attrib.pop('checked')
+            else:
+                element.set('checked', 'checked')
+            return
+
+        href = element.get('href') or ''
+        if tag == 'a' and href and not href.startswith(('#', 'javascript:')):
+            self.get(href)
+            return
+
+        if element.get('id') in FLEET_SEND_BUTTONS:
+            self.send_fleet()
+            return
+
+        form = self.form_of(element)
+        is_submit = (tag == 'input' and input_type in ('submit', 'image')) or \
+                    (tag == 'button' and input_type in ('', 'submit'))
+        if form is not None and is_submit:
+            self.submit_form(form, element)
+            return
+
+        # Ajax-Buttons (z.B. Bauen): Ziel-URL steht in data-target/data-url/onclick
+        url = element.get('data-target') or element.get('data-url')
+        if not url:
+            match = URL_PATTERN.search(element.get('onclick') or '')
+            url = match.group(1) if match else None
+        if url:
+            self.get(url.replace('&amp;', '&'))
+            return
+
+        raise WebDriverException(f"Click on <{tag}> needs JavaScript")
+
+    def submit_form(self, form, button=None):
+        """Formular wie der Browser absenden"""
+        values = list(form.form_values())
+        if button is not None and button.get('name'):
+            values.append((button.get('name'), button.get('value') or ''))
+
+        action = form.get('action') or self.current_url
+        if (form.get('method') or 'get').lower() == 'post':
+            self.load(self.request('POST', action, data=values))
+        else:
+            self.load(self.request('GET', action, params=values))
+
+    def send_fleet(self):
+        """Flotten-Versand: alle Felder der Seite per Ajax-POST wie der Versand-Button"""
+        doc = self.require_document()
+        values = dict(FLEET_SEND_DEFAULTS)
+        for field in doc.xpath('//input[@name]'):
+            input_type = (field.get('type') or '').lower()
+            if input_type in ('radio', 'checkbox') and field.get('checked') is None:
+                continue
+            if input_type in ('submit', 'button', 'image'):
+                continue
+            if field.get('value'):
+                values[field.get('name')] = field.get('value')
+
+        # Manager setzen "planet", der Endpunkt erwartet "position"
+        if 'planet' in values:
+            values.setdefault('position', values['planet'])
+
+        token = TOKEN_PATTERN.search(self.html)
+        if token and 'token' not in values:
+            values['token'] = token.group(1)
+
+        response = self.request('POST', FLEET_SEND_URL, data=values)
+        try:
+            result = response.json()
+        except ValueError:
+            result = {}
+        if not result.get('success'):
+            errors = result.get('errors') or result.get('message') or 'no success flag'
+            raise WebDriverException(f"Fleet dispatch rejected: {json.dumps(errors)}")
+
+    def quit(self):
+        self.session.close()
+
+    close = quit
@@ -0,0 +1,243 @@
+import os
+import sys
+import time
+
+from src.core.metrics import DRIVER_CALL_SECONDS, DRIVER_CALLS, DRIVER_ERRORS
+
+# Aufrufer-Suche überspringt diese Datei
+THIS_FILE = os.path.abspath(__file__)
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(THIS_FILE)))
+
+# Element-Methoden, die gemessen werden (alles andere geht ungemessen durch)
+ELEMENT_CALLS = ('get_attribute', 'click', 'send_keys', 'clear', 'submit', 'is_displayed')
+
+
+def caller_label():
+    """'Klasse.methode' des ersten Aufrufers aus dem Projekt (außerhalb dieser Datei)"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename != THIS_FILE and filename.startswith(PROJECT_DIR) and 'site-packages' not in filename:
+            owner = frame.f_locals.get('self')
+            if owner is not None:
+                return f"{type(owner).__name__}.{frame.f_code.co_name}"
+            return frame.f_code.co_name
+        frame = frame.f_back
+    return '?'
+
+
+def script_label(script):
+    """Kurzer Schlüssel für ein execute_script-Script"""
+    text = ' '.join(str(script).split())
+    return f"js:{text[:60]}" + ('…' if len(text) > 60 else '')
+
+
+class CallStats:
+    """
+    Sammelt Aufrufe pro (Aufrufer, Operation, Selektor): Anzahl, Zeit,
+    Treffer/Fehlschläge und Exceptions - auch die, die in den Managern
+    von einem bloßen except: verschluckt werden.
+    """
+
+    def __init__(self, logger):
+        self.logger = logger
+        self.entries = {}  # (caller, op, selector) -> dict
+        self.cycle_started = time.time()
+
+    def record(self, caller, op, selector, seconds, hit=None, error=None):
+        key = (caller, op, selector)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = {'calls': 0, 'time': 0.0, 'max': 0.0, 'hits': 0, 'misses': 0,
+                                         'errors': {}}
+        entry['calls'] += 1
+        entry['time'] += seconds
+        if seconds > entry['max']:
+            entry['max'] = seconds
+        if hit is True:
+            entry['hits'] += 1
+        elif hit is False:
+            entry['misses'] += 1
+        if error is not None:
+            name = type(error).__name__
+            entry['errors'][name] = entry['errors'].get(name, 0) + 1
+
+        # Aufruf-Raten für den Metrik-Endpunkt (ohne Selektor - begrenzte Label-Menge)
+        base_op = op.split('(', 1)[0]
+        DRIVER_CALLS.inc(op=base_op)
+        DRIVER_CALL_SECONDS.inc(seconds, op=base_op)
+        if error is not None:
+            DRIVER_ERRORS.inc(op=base_op)
+
+    def top(self, limit=10):
+        """Teuerste Einträge nach Gesamtzeit"""
+        ranked = sorted(self.entries.items(), key=lambda item: item[1]['time'], reverse=True)
+        return [
+            {'caller': caller, 'op': op, 'selector': selector, **entry}
+            for (caller, op, selector), entry in ranked[:limit]
+        ]
+
+    def totals(self):
+        calls = sum(e['calls'] for e in self.entries.values())
+        seconds = sum(e['time'] for e in self.entries.values())
+        errors = sum(sum(e['errors'].values()) for e in self.entries.values())
+        return {'calls': calls, 'time': seconds, 'errors': errors}
+
+    def report(self, label="cycle", limit=10, reset=True):
+        """Teuerste Selektoren seit dem letzten Bericht loggen"""
+        if not self.entries:
+            return []
+
+        totals = self.totals()
+        top = self.top(limit)
+        self.logger.info(f"🔬 === DRIVER CALLS ({label}): {totals['calls']} calls, "
+                         f"{totals['time']:.2f}s, {totals['errors']} exceptions ===")
+        for entry in top:
+            errors = ', '.join(f"{name}×{count}" for name, count in entry['errors'].items())
+            lookups = f" hit {entry['hits']}/miss {entry['misses']}" if entry['hits'] or entry['misses'] else ""
+            self.logger.info(f"   {entry['time'] * 1000:8.1f}ms {entry['calls']:5}× "
+                             f"{entry['caller']} {entry['op']} {entry['selector']}{lookups}"
+                             f"{' ⚠️ ' + errors if errors else ''}")
+
+        if reset:
+            self.reset()
+        return top
+
+    def reset(self):
+        self.entries = {}
+        self.cycle_started = time.time()
+
+
+class InstrumentedElement:
+    """Element-Hülle: misst text/get_attribute/click/... mit dem Selektor, der es gefunden hat"""
+
+    def __init__(self, stats, element, selector):
+        self.stats = stats
+        self.element = element
+        self.selector = selector
+
+    def measure(self, op, call, caller=None):
+        caller = caller or caller_label()
+        started = time.perf_counter()
+        try:
+            result = call()
+        except Exception as e:
+            self.stats.record(caller, op, self.selector, time.perf_counter() - started, error=e)
+            raise
+        self.stats.record(caller, op, self.selector, time.perf_counter() - started)
+        return result
+
+    @property
+    def text(self):
+        return self.measure('text', lambda: self.element.text)
+
+    def __getattr__(self, name):
+        value = getattr(self.element, name)
+        if name not in ELEMENT_CALLS:
+            return value
+
+        def call(*args, **kwargs):
+            op = name if name != 'get_attribute' or not args else f"get_attribute({args[0]})"
+            return self.measure(op, lambda: value(*args, **kwargs), caller_label())
+        return call
+
+    def find_element(self, by="id", value=None):
+        return find_one(self.stats, self.element, by, value, parent=self.selector)
+
+    def find_elements(self, by="id", value=None):
+        return find_many(self.stats, self.element, by, value, parent=self.selector)
+
+
+def selector_key(by, value, parent=None):
+    key = f"{by}={value}"
+    return f"{parent} > {key}" if parent else key
+
+
+def find_one(stats, root, by, value, parent=None):
+    selector = selector_key(by, value, parent)
+    caller = caller_label()
+    started = time.perf_counter()
+    try:
+        element = root.find_element(by, value)
+    except Exception as e:
+        # NoSuchElement ist ein Fehlschlag, alles andere ein Fehler
+        missed = type(e).__name__ == 'NoSuchElementException'
+        stats.record(caller, 'find_element', selector, time.perf_counter() - started,
+                     hit=False if missed else None, error=None if missed else e)
+        raise
+    stats.record(caller, 'find_element', selector, time.perf_counter() - started, hit=True)
+    return InstrumentedElement(stats, element, selector)
+
+
+def find_many(stats, root, by, value, parent=None):
+    selector = selector_key(by, value, parent)
+    caller = caller_label()
+    started = time.perf_counter()
+    try:
+        elements = root.find_elements(by, value)
+    except Exception as e:
+        stats.record(caller, 'find_elements', selector, time.perf_counter() - started, error=e)
+        raise
+    stats.record(caller, 'find_elements', selector, time.perf_counter() - started, hit=bool(elements))
+    return [InstrumentedElement(stats, element, selector) for element in elements]
+
+
+def unwrap(value):
+    return value.element if isinstance(value, InstrumentedElement) else value
+
+
+class InstrumentedDriver:
+    """
+    Durchsichtige Hülle um den Treiber, die die Manager bekommen: zählt
+    und misst find_element(s), Element-Zugriffe, execute_script,
+    page_source und Navigation pro Manager-Methode und Selektor.
+    Alles Übrige wird unverändert weitergereicht.
+    """
+
+    def __init__(self, driver, stats):
+        self.driver = driver
+        self.stats = stats
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+    def measure(self, op, selector, call):
+        caller = caller_label()
+        started = time.perf_counter()
+        try:
+            result = call()
+        except Exception as e:
+            self.stats.record(caller, op, selector, time.perf_counter() - started, error=e)
+            raise
+        self.stats.record(caller, op, selector, time.perf_counter() - started)
+        return result
+
+    def find_element(self, by="id", value=None):
+        return find_one(self.stats, self.driver, by, value)
+
+    def find_elements(self, by="id", value=None):
+        return find_many(self.stats, self.driver, by, value)
+
+    def execute_script(self, script, *args):
+        args = [unwrap(arg) for arg in args]
+        return self.measure('execute_script', script_label(script),
+                            lambda: self.driver.execute_script(script, *args))
+
+    def execute_async_script(self, script, *args):
+        args = [unwrap(arg) for arg in args]
+        return self.measure('execute_async_script', script_label(script),
+                            lambda: self.driver.execute_async_script(script, *args))
+
+    @property
+    def page_source(self):
+        return self.measure('page_source', '-', lambda: self.driver.page_source)
+
+    @property
+    def current_url(self):
+        return self.measure('current_url', '-', lambda: self.driver.current_url)
+
+    def get(self, url):
+        return self.measure('get', url.split('?', 1)[-1][:80], lambda: self.driver.get(url))
+
+    def refresh(self):
+        return self.measure('refresh', '-', lambda: self.driver.refresh())
@@ -0,0 +1,166 @@
+import json
+import os
+import shutil
+import subprocess
+import time
+import urllib.request
+
+from src.core.runtime import RUNTIME
+
+# Bekannte Browser - Reihenfolge = Präferenz
+BROWSER_CANDIDATES = [
+    'chromium',
+    'chromium-browser',
+    'google-chrome-stable',
+    'google-chrome',
+    'chrome',
+    'brave-browser',
+    '/usr/bin/chromium',
+    '/usr/bin/chromium-browser',
+    '/snap/bin/chromium',
+    '/opt/google/chrome/chrome',
+    '/Applications/Brave Browser.app/Contents/MacOS/Brave Browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+    '/Applications/Chromium.app/Contents/MacOS/Chromium'
+]
+
+# Ressourcen-sparende Start-Flags
+LEAN_FLAGS = [
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-translate',
+    '--disable-dev-shm-usage',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--password-store=basic'
+]
+
+
+class BrowserLauncher:
+    """
+    Findet Chromium/Chrome (Linux zuerst) und startet ihn mit Remote
+    Debugging, persistentem Profil und schlanken Flags.
+
+    Statt fest zu warten wird /json/version abgefragt bis der Browser
+    bereit ist.
+    """
+
+    def __init__(self, logger, port=9223, profile_dir="/tmp/ogame-bot-profile",
+                 headless=False, window_size=(1280, 720), timeout=30):
+        self.logger = logger
+        self.port = port
+        self.profile_dir = profile_dir
+        self.headless = headless
+        self.window_size = window_size
+        self.timeout = timeout
+        self.process = None
+
+    def find_executable(self):
+        """Browser-Binary suchen (OGAME_BROWSER überschreibt)"""
+        override = os.environ.get('OGAME_BROWSER')
+        candidates = [override] if override else []
+        candidates += BROWSER_CANDIDATES
+
+        for candidate in candidates:
+            path = shutil.which(candidate) if not os.path.isabs(candidate) else candidate
+            if path and os.path.isfile(path) and os.access(path, os.X_OK):
+                return path
+        return None
+
+    def build_command(self, executable):
+        """Start-Kommando zusammenstellen"""
+        width, height = self.window_size
+        command = [
+            executable,
+            f"--remote-debugging-port={self.port}",
+            f"--user-data-dir={self.profile_dir}",
+            f"--window-size={width},{height}"
+        ] + LEAN_FLAGS
+
+        if self.headless:
+            command.append('--headless=new')
+
+        # Als root (Container) geht Chromium nur ohne Sandbox
+        if hasattr(os, 'geteuid') and os.geteuid() == 0:
+            command.append('--no-sandbox')
+
+        return command
+
+    def debugger_version(self, timeout=1):
+        """Antwort von /json/version oder None"""
+        try:
+            with urllib.request.urlopen(f"http://localhost:{self.port}/json/version", timeout=timeout) as response:
+                return json.loads(response.read().decode('utf-8'))
+        except Exception:
+            return None
+
+    def launch(self):
+        """Browser starten und warten bis Remote Debugging antwortet"""
+        executable = self.find_executable()
+        if not executable:
+            self.logger.error("❌ No Chromium/Chrome/Brave executable found (set OGAME_BROWSER)")
+            return False
+
+        os.makedirs(self.profile_dir, exist_ok=True)
+        command = self.build_command(executable)
+
+        mode = "headless" if self.headless else "windowed"
+        self.logger.info(f"🚀 Starting {os.path.basename(executable)} ({mode}) on port {self.port}...")
+
+        start = time.time()
+        try:
+            self.process = subprocess.Popen(
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                stdin=subprocess.DEVNULL,
+                start_new_session=True
+            )
+        except OSError as e:
+            self.logger.error(f"❌ Failed to start browser: {e}")
+            return False
+
+        if not self.wait_until_ready():
+            self.logger.error(f"❌ Browser did not open remote debugging within {self.timeout}s")
+            self.stop()
+            return False
+
+        self.logger.info(f"✅ Browser ready in {time.time() - start:.1f}s")
+        return True
+
+    def wait_until_ready(self):
+        """/json/version abfragen bis der Browser antwortet"""
+        deadline = time.time() + self.timeout
+        interval = 0.05
+
+        while time.time() < deadline:
+            if self.process and self.process.poll() is not None:
+                self.logger.error(f"❌ Browser exited with code {self.process.returncode}")
+                return False
+            if self.debugger_version(timeout=0.5):
+                return True
+            if RUNTIME.pause(interval):
+                return False  # Bot wird beendet
+            interval = min(interval * 2, 0.5)
+
+        return False
+
+    def stop(self):
+        """Selbst gestarteten Browser beenden"""
+        if not self.process or self.process.poll() is not None:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
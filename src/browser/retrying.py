@@ -0,0 +1,139 @@
+from src.core.retry import classify, retry_call
+
+# Element-Methoden ohne Nebenwirkung - bei jedem vorübergehenden Fehler wiederholbar
+READ_CALLS = ('get_attribute', 'get_property', 'is_displayed', 'is_enabled', 'is_selected',
+              'value_of_css_property')
+# Aktionen - nur wiederholen wenn sicher nichts passiert ist (stale, verdeckt)
+ACTION_CALLS = ('click', 'send_keys', 'clear', 'submit')
+
+
+def unwrap(value):
+    return value.element if isinstance(value, RetryingElement) else value
+
+
+class RetryingElement:
+    """
+    Element-Hülle, die sich ihren Fundort merkt (Wurzel, Selektor, Index).
+    Wird das Element zwischen Suchen und Zugriff ausgetauscht (OGame lädt
+    Teile der Seite per JavaScript nach), wird es neu gesucht und der
+    Zugriff nach kurzer Pause wiederholt.
+    """
+
+    def __init__(self, owner, element, root, by, value, index=None):
+        self.owner = owner  # RetryingDriver - Versuche und Logger
+        self.element = element
+        self.root = root  # RetryingDriver oder RetryingElement
+        self.by = by
+        self.value = value
+        self.index = index  # Position in find_elements (None = find_element)
+
+    def relocate(self, error):
+        """Nach einem stale-Fehler dasselbe Element neu suchen"""
+        if classify(error) != 'stale':
+            return
+        try:
+            self.element = self.root.locate(self.by, self.value, self.index)
+        except Exception:
+            pass  # Nächster Versuch scheitert erneut und meldet den echten Fehler
+
+    def attempt(self, op, call, action=False):
+        return retry_call(lambda: call(self.element), op, attempts=self.owner.attempts, action=action,
+                          on_retry=self.relocate, logger=self.owner.logger)
+
+    @property
+    def text(self):
+        return self.attempt('text', lambda element: element.text)
+
+    @property
+    def tag_name(self):
+        return self.attempt('tag_name', lambda element: element.tag_name)
+
+    def __getattr__(self, name):
+        value = getattr(self.element, name)
+        if name not in READ_CALLS and name not in ACTION_CALLS:
+            return value
+
+        def call(*args, **kwargs):
+            return self.attempt(name, lambda element: getattr(element, name)(*args, **kwargs),
+                                action=name in ACTION_CALLS)
+        return call
+
+    def locate(self, by, value, index=None):
+        """Kind-Element roh suchen (für relocate der Kinder)"""
+        if index is None:
+            return self.attempt('find_element', lambda element: element.find_element(by, value))
+        return self.attempt('find_elements', lambda element: element.find_elements(by, value))[index]
+
+    def find_element(self, by="id", value=None):
+        return RetryingElement(self.owner, self.locate(by, value), self, by, value)
+
+    def find_elements(self, by="id", value=None):
+        elements = self.attempt('find_elements', lambda element: element.find_elements(by, value))
+        return [RetryingElement(self.owner, element, self, by, value, index) for index, element in enumerate(elements)]
+
+
+class RetryingDriver:
+    """
+    Durchsichtige Hülle um den Treiber: vorübergehende Fehler (stale
+    Elemente, Timeouts, Verbindungsabbrüche) werden nach wenigen
+    Millisekunden wiederholt statt den ganzen Schritt scheitern zu lassen.
+    Nicht gefundene Elemente und tote Sessions gehen sofort durch.
+    """
+
+    def __init__(self, driver, logger, attempts=3):
+        self.driver = driver
+        self.logger = logger
+        self.attempts = max(1, attempts)
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+    def attempt(self, op, call, action=False, on_retry=None):
+        return retry_call(call, op, attempts=self.attempts, action=action, on_retry=on_retry, logger=self.logger)
+
+    def locate(self, by, value, index=None):
+        if index is None:
+            return self.attempt('find_element', lambda: self.driver.find_element(by, value))
+        return self.attempt('find_elements', lambda: self.driver.find_elements(by, value))[index]
+
+    def find_element(self, by="id", value=None):
+        return RetryingElement(self, self.locate(by, value), self, by, value)
+
+    def find_elements(self, by="id", value=None):
+        elements = self.attempt('find_elements', lambda: self.driver.find_elements(by, value))
+        return [RetryingElement(self, element, self, by, value, index) for index, element in enumerate(elements)]
+
+    def execute_script(self, script, *args):
+        return self.run_script('execute_script', script, args)
+
+    def execute_async_script(self, script, *args):
+        return self.run_script('execute_async_script', script, args)
+
+    def run_script(self, op, script, args):
+        # Scripts können schreiben - nur bei stale Argumenten (neu gesucht) wiederholen
+        def relocate(error):
+            for arg in args:
+                if isinstance(arg, RetryingElement):
+                    arg.relocate(error)
+
+        return self.attempt(op, lambda: getattr(self.driver, op)(script, *[unwrap(arg) for arg in args]),
+                            action=True, on_retry=relocate)
+
+    @property
+    def page_source(self):
+        return self.attempt('page_source', lambda: self.driver.page_source)
+
+    @property
+    def current_url(self):
+        return self.attempt('current_url', lambda: self.driver.current_url)
+
+    @property
+    def title(self):
+        return self.attempt('title', lambda: self.driver.title)
+
+    def get(self, url):
+        # Seitenaufrufe sind GET - ein zweiter Aufruf nach Timeout ist harmlos
+        return self.attempt('get', lambda: self.driver.get(url))
+
+    def refresh(self):
+        return self.attempt('refresh', lambda: self.driver.refresh())
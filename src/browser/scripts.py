@@ -0,0 +1,155 @@
+# Lese-Scripts im Browser - gemeinsam für Manager und Treiber (der HTTP-Treiber erkennt sie am Text)
+
+# Liest alle Schiffe eines Dokuments in einem einzigen Script-Aufruf.
+# Ohne URL wird die aktuelle Seite gelesen, sonst die Seite per fetch()
+# im Hintergrund geholt (kein Seitenwechsel im Tab).
+BULK_READ_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var url = arguments[0];
+
+function extract(doc) {
+    var meta = doc.querySelector("meta[name='ogame-planet-id']");
+    var coords = doc.querySelector("meta[name='ogame-planet-coordinates']");
+    var out = {
+        planet_id: meta ? meta.getAttribute('content') : null,
+        coordinates: coords ? coords.getAttribute('content') : null,
+        ships: {},
+        found: false
+    };
+    doc.querySelectorAll("[data-technology]").forEach(function (el) {
+        var amount = el.querySelector('.amount');
+        if (!amount) { return; }
+        var value = amount.getAttribute('data-value') || amount.textContent || '';
+        out.ships[el.getAttribute('data-technology')] = value.replace(/[^0-9]/g, '');
+        out.found = true;
+    });
+    doc.querySelectorAll("input[name^='am'], input[name*='ship']").forEach(function (el) {
+        var key = el.getAttribute('name') || el.getAttribute('id') || '';
+        var value = el.getAttribute('max') || el.getAttribute('data-max') || '';
+        if (key && value && !(key in out.ships)) {
+            out.ships[key] = value.replace(/[^0-9]/g, '');
+            out.found = true;
+        }
+    });
+    return out;
+}
+
+if (!url) {
+    done(extract(document));
+    return;
+}
+fetch(url, {credentials: 'same-origin'})
+    .then(function (r) { return r.text(); })
+    .then(function (html) { done(extract(new DOMParser().parseFromString(html, 'text/html'))); })
+    .catch(function (e) { done({error: String(e)}); });
+"""
+
+# Liest die Ereignisliste (Flottenbewegungen) per fetch() ohne Seitenwechsel
+EVENT_LIST_SCRIPT = """
+var done = arguments[arguments.length - 1];
+fetch(arguments[0], {credentials: 'same-origin'})
+    .then(function (r) { return r.text(); })
+    .then(function (html) {
+        var doc = new DOMParser().parseFromString(html, 'text/html');
+        var rows = [];
+        doc.querySelectorAll("tr.eventFleet").forEach(function (row) {
+            var origin = row.querySelector('.coordsOrigin');
+            var dest = row.querySelector('.destCoords');
+            rows.push({
+                id: row.getAttribute('id') || '',
+                mission: row.getAttribute('data-mission-type') || '',
+                return_flight: row.getAttribute('data-return-flight') === 'true',
+                arrival: row.getAttribute('data-arrival-time') || '',
+                origin: origin ? origin.textContent : '',
+                destination: dest ? dest.textContent : ''
+            });
+        });
+        done({rows: rows});
+    })
+    .catch(function (e) { done({error: String(e)}); });
+"""
+
+CURRENT_PLANET_SCRIPT = """
+var meta = document.querySelector("meta[name='ogame-planet-id']");
+var coords = document.querySelector("meta[name='ogame-planet-coordinates']");
+return {
+    planet_id: meta ? meta.getAttribute('content') : null,
+    coordinates: coords ? coords.getAttribute('content') : null
+};
+"""
+
+# Liest die komplette Planeten-Liste (rechte Seitenleiste) in einem Aufruf
+PLANET_LIST_SCRIPT = """
+var planets = [];
+document.querySelectorAll("#planetList .smallplanet").forEach(function (el) {
+    var link = el.querySelector('a.planetlink');
+    var moon = el.querySelector('a.moonlink');
+    var name = el.querySelector('.planet-name');
+    var coords = el.querySelector('.planet-koords');
+    planets.push({
+        id: (el.getAttribute('id') || '').replace('planet-', ''),
+        name: name ? name.textContent.trim() : '',
+        coordinates: coords ? coords.textContent.trim() : '',
+        title: link ? (link.getAttribute('data-tooltip-title') || link.getAttribute('title') || '') : '',
+        active: el.className.indexOf('hightlightPlanet') !== -1,
+        moon_href: moon ? (moon.getAttribute('href') || '') : '',
+        moon_title: moon ? (moon.getAttribute('data-tooltip-title') || moon.getAttribute('title') || '') : ''
+    });
+});
+return planets;
+"""
+
+# Ende der Gebäude-Bauschleife (data-end oder Countdown-Text)
+QUEUE_END_SCRIPT = """
+var el = document.querySelector(
+    '#productionboxbuildingcomponent [data-end], .buildingCountdown, #buildingCountdown');
+if (!el) { return null; }
+return {end: el.getAttribute('data-end') || '', text: el.textContent || ''};
+"""
+
+# Liest alle Forschungs-Stufen und die Forschungs-Schleife in einem einzigen
+# Script-Aufruf. Ohne URL wird die aktuelle Seite gelesen, sonst die Seite
+# per fetch() im Hintergrund geholt (kein Seitenwechsel im Tab).
+RESEARCH_READ_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var url = arguments[0];
+
+function extract(doc) {
+    var out = {levels: {}, active: null, end: '', text: '', found: false};
+    doc.querySelectorAll("[data-technology]").forEach(function (el) {
+        var level = el.querySelector('.level');
+        if (!level) { return; }
+        var value = level.getAttribute('data-value') || level.textContent || '';
+        out.levels[el.getAttribute('data-technology')] = value.replace(/[^0-9]/g, '');
+        if (el.getAttribute('data-status') === 'active') {
+            out.active = el.getAttribute('data-technology');
+        }
+        out.found = true;
+    });
+    var queue = doc.querySelector(
+        '#productionboxresearchcomponent [data-end], .researchCountdown, #researchCountdown');
+    if (queue) {
+        out.end = queue.getAttribute('data-end') || '';
+        out.text = queue.textContent || '';
+    }
+    return out;
+}
+
+if (!url) {
+    done(extract(document));
+    return;
+}
+fetch(url, {credentials: 'same-origin'})
+    .then(function (r) { return r.text(); })
+    .then(function (html) { done(extract(new DOMParser().parseFromString(html, 'text/html'))); })
+    .catch(function (e) { done({error: String(e)}); });
+"""
+
+# Holt eine Seite im Hintergrund per fetch() (kein Seitenwechsel im Tab)
+FETCH_SCRIPT = """
+var done = arguments[arguments.length - 1];
+fetch(arguments[0], {credentials: 'same-origin'})
+    .then(function (r) { return r.text(); })
+    .then(done)
+    .catch(function () { done(''); });
+"""
@@ -0,0 +1,182 @@
+import time
+
+from src.browser.cdp_driver import BY_ID, BY_XPATH, NoSuchElementException, WebDriverException
+from src.parsers.page_parser import parse_document, select_elements, visible_text
+
+# Diese "Attribute" sind live DOM-Properties (Eingaben) und stehen nicht im HTML
+LIVE_PROPERTIES = ('value', 'checked', 'selected')
+
+
+class SnapshotElement:
+    """
+    Element aus dem Snapshot: Lesen lokal aus lxml, Schreiben (Klick,
+    Eingabe) auf dem echten Element, das erst dann per XPath geholt wird.
+    """
+
+    def __init__(self, snapshot, element, generation):
+        self.snapshot = snapshot
+        self.element = element
+        self.generation = generation
+        self.live_element = None
+
+    def current(self):
+        """Ist der Snapshot, aus dem das Element stammt, noch gültig?"""
+        return self.generation == self.snapshot.generation and self.snapshot.doc is not None
+
+    def live(self):
+        """Echtes Element im Browser (ein Aufruf, danach gecacht)"""
+        if self.live_element is None:
+            path = self.element.getroottree().getpath(self.element)
+            try:
+                self.live_element = self.snapshot.driver.find_element(BY_XPATH, path)
+            except NoSuchElementException:
+                element_id = self.element.get('id')
+                if not element_id:
+                    raise
+                self.live_element = self.snapshot.driver.find_element(BY_ID, element_id)
+        return self.live_element
+
+    @property
+    def text(self):
+        if self.current():
+            self.snapshot.hits += 1
+            return visible_text(self.element)
+        return self.live().text
+
+    @property
+    def tag_name(self):
+        return self.element.tag.lower()
+
+    def get_attribute(self, name):
+        if self.current() and name not in LIVE_PROPERTIES:
+            self.snapshot.hits += 1
+            if name in ('textContent', 'innerText'):
+                return self.element.text_content()
+            return self.element.get(name)
+        return self.live().get_attribute(name)
+
+    def is_displayed(self):
+        return self.live().is_displayed()
+
+    def click(self):
+        self.live().click()
+        self.snapshot.invalidate()
+
+    def clear(self):
+        self.live().clear()
+        self.snapshot.invalidate()
+
+    def send_keys(self, *values):
+        self.live().send_keys(*values)
+        self.snapshot.invalidate()
+
+    def submit(self):
+        self.live().submit()
+        self.snapshot.invalidate()
+
+    def find_element(self, by=BY_ID, value=None):
+        if not self.current():
+            return self.live().find_element(by, value)
+        return self.snapshot.find_element(by, value, root=self)
+
+    def find_elements(self, by=BY_ID, value=None):
+        if not self.current():
+            return self.live().find_elements(by, value)
+        return self.snapshot.find_elements(by, value, root=self)
+
+
+class SnapshotSwitchTo:
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+
+    def window(self, handle):
+        self.snapshot.driver.switch_to.window(handle)
+        self.snapshot.invalidate()
+
+
+class PageSnapshot:
+    """
+    Liest page_source einmal pro Seite und beantwortet alle lesenden
+    find_element(s)/text/get_attribute-Aufrufe aus dem lxml-Baum.
+
+    Navigation, Klicks, Eingaben und Tab-Wechsel verwerfen den Snapshot;
+    da OGame Teile der Seite per JavaScript aktualisiert, wird er außerdem
+    nach max_age Sekunden neu gelesen. Alles andere geht an den Treiber.
+    """
+
+    def __init__(self, driver, logger, max_age=5):
+        self.driver = driver
+        self.logger = logger
+        self.max_age = max_age
+
+        self.html = None
+        self.doc = None
+        self.taken_at = 0
+        self.generation = 0
+        self.switch_to = SnapshotSwitchTo(self)
+
+        self.snapshots = 0  # Gelesene Seiten
+        self.hits = 0  # Lokal beantwortete Lesezugriffe
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+    def invalidate(self):
+        """Snapshot verwerfen (nach Navigation oder Interaktion)"""
+        self.doc = None
+        self.html = None
+        self.generation += 1
+
+    def document(self):
+        """Aktueller lxml-Baum - bei Bedarf einmal page_source holen"""
+        if self.doc is None or time.time() - self.taken_at > self.max_age:
+            self.html = self.driver.page_source
+            self.doc = parse_document(self.html)
+            self.taken_at = time.time()
+            self.generation += 1
+            self.snapshots += 1
+        return self.doc
+
+    # === NAVIGATION ===
+
+    def get(self, url):
+        self.invalidate()
+        self.driver.get(url)
+
+    def refresh(self):
+        self.invalidate()
+        self.driver.refresh()
+
+    @property
+    def page_source(self):
+        self.document()
+        return self.html
+
+    # === ELEMENTE ===
+
+    def find_elements(self, by=BY_ID, value=None, root=None):
+        if root is None:
+            doc = self.document()
+            if doc is None:
+                return []
+            base = doc
+        else:
+            base = root.element
+
+        try:
+            found = select_elements(base, by, value)
+        except Exception as e:
+            raise WebDriverException(f"Invalid selector {by}={value}: {e}")
+
+        self.hits += 1
+        return [SnapshotElement(self, element, self.generation) for element in found]
+
+    def find_element(self, by=BY_ID, value=None, root=None):
+        elements = self.find_elements(by, value, root=root)
+        if not elements:
+            raise NoSuchElementException(f"No element for {by}={value}")
+        return elements[0]
+
+    def stats(self):
+        """Gelesene Seiten und lokal beantwortete Zugriffe"""
+        return {'snapshots': self.snapshots, 'local_reads': self.hits}
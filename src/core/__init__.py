@@ -0,0 +1 @@
+# OGame Bot Core Module
@@ -0,0 +1,215 @@
+import asyncio
+import heapq
+import itertools
+import time
+
+from src.core.metrics import CYCLE_DURATION, SCHEDULER_LAG
+from src.core.retry import failure_delay
+
+# Prioritäten für den Browser-Zugriff (kleiner = wichtiger)
+PRIORITY_CRITICAL = 0  # Bauen, Flotten starten
+PRIORITY_NORMAL = 5  # Status, Ereignisse
+PRIORITY_BACKGROUND = 10  # Galaxie-Scans, Übersichten
+
+
+class BrowserLock:
+    """
+    Serialisiert den Zugriff auf den einzigen Browser-Tab.
+
+    Wartende werden nach Priorität bedient, so dass ein langer Scan
+    zwischen zwei Schritten kritische Aktionen vorlassen muss.
+    """
+
+    def __init__(self):
+        self.locked = False
+        self.waiters = []  # (priority, seq, future)
+        self.counter = itertools.count()
+
+    async def acquire(self, priority=PRIORITY_NORMAL):
+        """Lock holen (wartet bei Bedarf)"""
+        if not self.locked and not self.waiters:
+            self.locked = True
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiters, (priority, next(self.counter), future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Lock wurde evtl. schon übergeben - dann weiterreichen
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        """Lock an den wichtigsten Wartenden übergeben oder freigeben"""
+        while self.waiters:
+            _, _, future = heapq.heappop(self.waiters)
+            if not future.done():
+                future.set_result(True)
+                return
+        self.locked = False
+
+
+class AsyncCore:
+    """
+    asyncio-Kern: jedes Subsystem (Bauen, Raids, Kolonisierung, Scans,
+    Monitoring) läuft als eigener Task.
+
+    Browser-Aufrufe laufen über core.browser() im Thread-Pool und sind
+    durch den BrowserLock serialisiert; Parsing und Planung laufen über
+    core.offload() parallel dazu.
+    """
+
+    def __init__(self, logger, checkpoint=None, breakers=None):
+        self.logger = logger
+        self.browser_lock = BrowserLock()
+        self.breakers = breakers  # Sicherung pro Subsystem (BreakerBoard)
+
+        # Nächste Ausführung pro Subsystem überlebt einen Neustart
+        self.checkpoint = checkpoint
+        self.saved_due = checkpoint.load('jobs') if checkpoint else {}
+
+        self.subsystems = {}  # name -> {'step', 'initial_delay', 'retry_delay'}
+        self.tasks = {}
+        self.wake_events = {}
+
+        self.loop = None
+        self.stop_event = None
+        self.browser_time = 0.0  # Summe der Zeit mit gehaltenem Browser-Lock
+
+    def add_subsystem(self, name, step, initial_delay=0, retry_delay=300):
+        """Subsystem registrieren - step ist async und gibt die nächste Wartezeit zurück"""
+        self.subsystems[name] = {
+            'step': step,
+            'initial_delay': initial_delay,
+            'retry_delay': retry_delay
+        }
+
+    async def browser(self, fn, *args, priority=PRIORITY_NORMAL):
+        """Blockierenden Browser-Aufruf exklusiv im Thread-Pool ausführen"""
+        await self.browser_lock.acquire(priority)
+        start = time.time()
+        try:
+            return await asyncio.to_thread(fn, *args)
+        finally:
+            self.browser_time += time.time() - start
+            self.browser_lock.release()
+
+    async def offload(self, fn, *args):
+        """CPU-/HTTP-Arbeit ohne Browser parallel ausführen"""
+        return await asyncio.to_thread(fn, *args)
+
+    async def sleep(self, seconds, name=None):
+        """Unterbrechbar schlafen - True wenn gestoppt wurde"""
+        if self.stop_event.is_set():
+            return True
+
+        waiters = [asyncio.ensure_future(self.stop_event.wait())]
+        wake = self.wake_events.get(name)
+        if wake:
+            waiters.append(asyncio.ensure_future(wake.wait()))
+
+        try:
+            await asyncio.wait(waiters, timeout=max(0, seconds), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+        if wake:
+            wake.clear()
+        return self.stop_event.is_set()
+
+    def wake(self, name, delay=0):
+        """Subsystem früher aufwecken (thread-sicher)"""
+        if not self.loop or name not in self.wake_events:
+            return False
+
+        def trigger():
+            self.wake_events[name].set()
+
+        if delay > 0:
+            self.loop.call_soon_threadsafe(lambda: self.loop.call_later(delay, trigger))
+        else:
+            self.loop.call_soon_threadsafe(trigger)
+        return True
+
+    def stop(self):
+        """Alle Tasks beenden (thread- und signal-sicher)"""
+        if self.loop and self.stop_event:
+            self.loop.call_soon_threadsafe(self.stop_event.set)
+
+    def is_running(self):
+        return self.stop_event is not None and not self.stop_event.is_set()
+
+    async def run_subsystem(self, name, spec):
+        """Schleife eines Subsystems"""
+        initial_delay = spec['initial_delay']
+        if name in self.saved_due:
+            initial_delay = max(0, self.saved_due.pop(name) - time.time())
+        due = time.time() + initial_delay
+        if initial_delay and await self.sleep(initial_delay, name):
+            return
+
+        breaker = self.breakers.get(name) if self.breakers else None
+        while not self.stop_event.is_set():
+            if breaker and not breaker.allow():
+                # Sicherung offen (früh geweckt) - erst zum Probelauf wieder
+                due = time.time() + breaker.retry_in()
+                if await self.sleep(breaker.retry_in(), name):
+                    return
+                continue
+
+            # Verspätung gegenüber der geplanten Zeit (früh geweckt = 0)
+            SCHEDULER_LAG.observe(max(0.0, time.time() - due), job=name)
+            started = time.perf_counter()
+            try:
+                delay = await spec['step']()
+                if breaker:
+                    breaker.record_success()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"❌ Task '{name}' error: {e}")
+                if breaker:
+                    # Erst kurz erneut, nach dem Auslösen mit wachsender Abkühlzeit
+                    breaker.record_failure(e)
+                    delay = breaker.retry_in() or failure_delay(e, breaker.base_cooldown)
+                else:
+                    delay = failure_delay(e, spec['retry_delay'])
+            CYCLE_DURATION.observe(time.perf_counter() - started, job=name)
+
+            if delay is None:
+                self.logger.info(f"🔚 Task '{name}' finished")
+                if self.checkpoint:
+                    self.checkpoint.delete('jobs', name)
+                return
+
+            due = time.time() + max(0, delay)
+            if self.checkpoint:
+                self.checkpoint.put('jobs', name, due)
+            if await self.sleep(delay, name):
+                return
+
+    async def main(self):
+        """Alle Subsysteme starten und bis zum Stop laufen lassen"""
+        self.loop = asyncio.get_running_loop()
+        self.stop_event = asyncio.Event()
+
+        for name, spec in self.subsystems.items():
+            self.wake_events[name] = asyncio.Event()
+            self.tasks[name] = asyncio.create_task(self.run_subsystem(name, spec), name=name)
+
+        self.logger.info(f"⚡ Async core running {len(self.tasks)} tasks: {', '.join(self.tasks)}")
+
+        await self.stop_event.wait()
+
+        for task in self.tasks.values():
+            task.cancel()
+        await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+        self.logger.info("🔚 Async core stopped")
+
+    def run(self):
+        """Blockierend ausführen"""
+        asyncio.run(self.main())
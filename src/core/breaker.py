@@ -0,0 +1,151 @@
+import time
+from collections import deque
+
+from src.core.metrics import BREAKER_STATE
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Werte für den Metrik-Endpunkt
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class PhaseFailed(Exception):
+    """Phase hat nichts erreicht, obwohl kein Fehler durchgekommen ist (z.B. jedes System beim Scan gescheitert)"""
+
+
+class CircuitBreaker:
+    """
+    Sicherung für ein Subsystem (Job bzw. Async-Task).
+
+    Geschlossen läuft das Subsystem im normalen Takt. Scheitert ein zu
+    großer Anteil der letzten Läufe, öffnet sie: das Subsystem pausiert
+    für eine Abkühlzeit, die sich bei jedem erneuten Scheitern verdoppelt.
+    Danach ist sie halb offen - genau ein Probelauf entscheidet, ob sie
+    wieder schließt oder länger offen bleibt.
+    """
+
+    def __init__(self, name, logger, failure_rate=0.5, window=10, min_runs=3, cooldown=60, max_cooldown=3600):
+        self.name = name
+        self.logger = logger
+        self.failure_rate = failure_rate
+        self.min_runs = min_runs
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+        self.results = deque(maxlen=window)  # True = Erfolg
+        self.state = CLOSED
+        self.cooldown = cooldown  # Aktuelle Abkühlzeit (verdoppelt sich)
+        self.opened_until = 0
+        self.last_error = None
+        self.trips = 0  # Wie oft geöffnet
+
+    def allow(self):
+        """Darf das Subsystem jetzt laufen? Nach Ablauf der Abkühlzeit als Probelauf"""
+        if self.state == OPEN:
+            if time.time() < self.opened_until:
+                return False
+            self.set_state(HALF_OPEN)
+            self.logger.info(f"🔌 {self.name}: probing after {int(self.cooldown)}s cooldown")
+        return True
+
+    def retry_in(self):
+        """Sekunden bis zum nächsten Probelauf (0 = darf laufen)"""
+        if self.state != OPEN:
+            return 0
+        return max(0, self.opened_until - time.time())
+
+    def record_success(self):
+        self.results.append(True)
+        if self.state == HALF_OPEN:
+            self.logger.info(f"✅ {self.name}: probe succeeded - back to full cadence")
+            self.results.clear()
+            self.cooldown = self.base_cooldown
+            self.set_state(CLOSED)
+
+    def record_failure(self, error=None):
+        self.results.append(False)
+        self.last_error = str(error)[:120] if error is not None else None
+
+        if self.state == HALF_OPEN:
+            self.trip(min(self.cooldown * 2, self.max_cooldown))
+        elif self.state == CLOSED and len(self.results) >= self.min_runs and self.rate() >= self.failure_rate:
+            self.trip(self.base_cooldown)
+
+    def trip(self, cooldown):
+        self.cooldown = cooldown
+        self.opened_until = time.time() + cooldown
+        self.trips += 1
+        self.set_state(OPEN)
+        self.logger.warning(f"🔌 {self.name}: circuit open for {int(cooldown)}s "
+                            f"({self.rate():.0%} of last {len(self.results)} runs failed: {self.last_error})")
+
+    def rate(self):
+        """Anteil der Fehlschläge im Fenster"""
+        if not self.results:
+            return 0.0
+        return self.results.count(False) / len(self.results)
+
+    def set_state(self, state):
+        self.state = state
+        BREAKER_STATE.set(STATE_VALUES[state], subsystem=self.name)
+
+    def status(self):
+        return {
+            'state': self.state,
+            'failure_rate': round(self.rate(), 2),
+            'runs': len(self.results),
+            'retry_in': int(self.retry_in()),
+            'trips': self.trips,
+            'last_error': self.last_error
+        }
+
+
+class BreakerBoard:
+    """Eine Sicherung pro Subsystem - gemeinsam für Scheduler, Async-Kern und Zyklus"""
+
+    def __init__(self, logger, **settings):
+        self.logger = logger
+        self.settings = settings  # An jede neue Sicherung (failure_rate, window, cooldown, ...)
+        self.breakers = {}
+
+    def get(self, name):
+        breaker = self.breakers.get(name)
+        if breaker is None:
+            breaker = self.breakers[name] = CircuitBreaker(name, self.logger, **self.settings)
+        return breaker
+
+    def run(self, name, call, *args):
+        """call(*args) geschützt ausführen - None wenn die Sicherung offen ist oder call scheitert"""
+        breaker = self.get(name)
+        if not breaker.allow():
+            self.logger.info(f"🔌 {name} skipped - circuit open, probe in {int(breaker.retry_in())}s")
+            return None
+        try:
+            result = call(*args)
+        except Exception as e:
+            breaker.record_failure(e)
+            self.logger.error(f"❌ {name} phase error: {e}")
+            return None
+        breaker.record_success()
+        return result
+
+    def status(self):
+        return {name: breaker.status() for name, breaker in sorted(self.breakers.items())}
+
+    def summary(self):
+        """Eine Zeile für die Status-Ausgabe"""
+        if not self.breakers:
+            return "no runs yet"
+        parts = []
+        for name, breaker in sorted(self.breakers.items()):
+            if breaker.state == OPEN:
+                parts.append(f"{name} OPEN ({breaker.rate():.0%} failed, probe in {int(breaker.retry_in())}s)")
+            elif breaker.state == HALF_OPEN:
+                parts.append(f"{name} probing")
+            elif breaker.rate():
+                parts.append(f"{name} ok ({breaker.rate():.0%} failed)")
+            else:
+                parts.append(f"{name} ok")
+        return ', '.join(parts)
@@ -0,0 +1,105 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+from datetime import datetime
+
+# Standard-Attribute eines LogRecords - alles andere kommt aus extra={...}
+RECORD_FIELDS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """Eine JSON-Zeile pro Log-Eintrag (Zeit, Level, Subsystem, Text, extra-Felder)"""
+
+    def __init__(self, base_name, static=None):
+        super().__init__()
+        self.base_name = base_name
+        self.static = static or {}
+
+    def format(self, record):
+        name = record.name
+        subsystem = name[len(self.base_name) + 1:] if name.startswith(self.base_name + '.') else 'main'
+        event = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'subsystem': subsystem,
+            'msg': record.getMessage(),
+            **self.static
+        }
+        for key, value in record.__dict__.items():
+            if key not in RECORD_FIELDS and not key.startswith('_'):
+                event[key] = value
+        if record.exc_text:
+            event['exc'] = record.exc_text
+        return json.dumps(event, ensure_ascii=False, default=str)
+
+
+def rotating_handler(path, max_bytes, backup_count, when=None):
+    """Rotation nach Größe oder - mit when ('midnight', 'H', ...) - nach Zeit"""
+    if when:
+        return logging.handlers.TimedRotatingFileHandler(path, when=when, backupCount=backup_count,
+                                                         encoding='utf-8', delay=True)
+    return logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count,
+                                                encoding='utf-8', delay=True)
+
+
+class LogPipeline:
+    """
+    Nicht-blockierendes Logging: der Bot legt Einträge nur in eine Queue,
+    ein Hintergrund-Thread schreibt Log-Datei (rotierend), JSONL-Stream
+    und Konsole. Kind-Logger pro Subsystem haben eigene Level, so dass
+    abgeschaltetes Debug-Logging schon vor dem Erzeugen des Eintrags endet.
+    """
+
+    def __init__(self, name, log_file, json_file=None, level="INFO", subsystem_levels=None,
+                 max_bytes=10 * 1024 * 1024, backup_count=5, when=None, static=None):
+        self.name = name
+        self.logger = logging.getLogger(name)
+        self.queue = queue.SimpleQueue()
+
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+
+        file_handler = rotating_handler(log_file, max_bytes, backup_count, when)
+        file_handler.setFormatter(formatter)
+
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+
+        handlers = [file_handler, console_handler]
+        if json_file:
+            json_handler = rotating_handler(json_file, max_bytes, backup_count, when)
+            json_handler.setFormatter(JsonFormatter(name, static))
+            handlers.append(json_handler)
+        self.handlers = handlers
+
+        self.listener = logging.handlers.QueueListener(self.queue, *handlers, respect_handler_level=True)
+
+        self.logger.setLevel(logging.getLevelName(level.upper()) if isinstance(level, str) else level)
+        self.logger.handlers = [logging.handlers.QueueHandler(self.queue)]
+        self.logger.propagate = False
+
+        for subsystem, subsystem_level in (subsystem_levels or {}).items():
+            self.child(subsystem).setLevel(subsystem_level.upper() if isinstance(subsystem_level, str)
+                                           else subsystem_level)
+
+        self.listener.start()
+        atexit.register(self.stop)
+
+    def child(self, subsystem):
+        """Logger eines Subsystems (erbt Handler, eigenes Level über LOG_LEVELS)"""
+        return self.logger.getChild(subsystem)
+
+    def set_console_level(self, level):
+        for handler in self.handlers:
+            if type(handler) is logging.StreamHandler:
+                handler.setLevel(level)
+
+    def stop(self):
+        """Queue leeren und Dateien schließen"""
+        if self.listener is None:
+            return
+        self.listener.stop()
+        self.listener = None
+        for handler in self.handlers:
+            handler.close()
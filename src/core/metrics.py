@@ -0,0 +1,260 @@
+import bisect
+import collections
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_BUCKETS = (0.1, 0.5, 1, 2, 5, 10, 30, 60, 120, 300, 600)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LOOT_WINDOW = 3600  # Sekunden für ogame_loot_per_hour
+
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(names, values, extra=None):
+    pairs = list(zip(names, values)) + list((extra or {}).items())
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in pairs) + '}'
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def snapshot(values):
+    """Kopie der Werte - der Bot schreibt evtl. gerade (kein Lock auf dem heißen Pfad)"""
+    for _ in range(5):
+        try:
+            return list(values.items())
+        except RuntimeError:
+            continue  # dict wurde während des Kopierens größer
+    return []
+
+
+class Metric:
+    """
+    Basis für Zähler/Messwerte mit Labels.
+
+    Schreiben ohne Lock: Werte werden nur vom Bot (serialisiert über den
+    Browser-Zugriff) geändert, der Scrape-Thread liest nur Kopien.
+    """
+
+    kind = 'untyped'
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self.values = {}  # Label-Werte (Tupel) -> Wert
+        if not self.label_names and self.kind != 'histogram':
+            self.values[()] = 0  # Ohne Labels von Anfang an mit 0 sichtbar
+
+    def key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.label_names)
+
+    def get(self, **labels):
+        return self.values.get(self.key(labels), 0)
+
+    def samples(self, constant_labels):
+        for key, value in snapshot(self.values):
+            yield f"{self.name}{format_labels(self.label_names, key, constant_labels)} {format_value(value)}"
+
+    def render(self, constant_labels):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples(constant_labels))
+        return lines
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self.key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        self.values[self.key(labels)] = value
+
+    def inc(self, amount=1, **labels):
+        key = self.key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def remove(self, **labels):
+        self.values.pop(self.key(labels), None)
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self.key(labels)
+        data = self.values.get(key)
+        if data is None:
+            data = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        data[0][bisect.bisect_left(self.buckets, value)] += 1
+        data[1] += value
+        data[2] += 1
+
+    def get(self, **labels):
+        data = self.values.get(self.key(labels))
+        return data[2] if data else 0
+
+    def samples(self, constant_labels):
+        for key, (counts, total, count) in snapshot(self.values):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), list(counts)):
+                cumulative += bucket_count
+                labels = format_labels(self.label_names, key, {**constant_labels, 'le': format_value(bound)})
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = format_labels(self.label_names, key, constant_labels)
+            yield f"{self.name}_sum{labels} {format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class MetricsRegistry:
+    """Alle Metriken eines Bot-Prozesses (ein Prozess = ein Account)"""
+
+    def __init__(self):
+        self.metrics = []
+        self.constant_labels = {}
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, help_text, labels=()):
+        return self.register(Counter(name, help_text, labels))
+
+    def gauge(self, name, help_text, labels=()):
+        return self.register(Gauge(name, help_text, labels))
+
+    def histogram(self, name, help_text, labels=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, help_text, labels, buckets))
+
+    def set_constant_labels(self, **labels):
+        """Labels für alle Werte (z.B. account) - so lassen sich viele Bots in einem Dashboard trennen"""
+        self.constant_labels = {name: value for name, value in labels.items() if value}
+
+    def render(self):
+        """Prometheus-Textformat"""
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render(self.constant_labels))
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+CYCLE_DURATION = REGISTRY.histogram('ogame_cycle_duration_seconds', 'Duration of automation cycles and jobs', ['job'])
+SCHEDULER_LAG = REGISTRY.histogram('ogame_scheduler_lag_seconds', 'Delay between a job being due and starting',
+                                   ['job'], buckets=(0.01, 0.1, 0.5, 1, 5, 15, 60, 300))
+BREAKER_STATE = REGISTRY.gauge('ogame_breaker_state', 'Circuit breaker per subsystem (0 closed, 1 half-open, 2 open)',
+                               ['subsystem'])
+
+DRIVER_CALLS = REGISTRY.counter('ogame_driver_calls_total', 'WebDriver calls made by the managers', ['op'])
+DRIVER_CALL_SECONDS = REGISTRY.counter('ogame_driver_call_seconds_total', 'Time spent in WebDriver calls', ['op'])
+DRIVER_ERRORS = REGISTRY.counter('ogame_driver_errors_total', 'WebDriver calls that raised', ['op'])
+DRIVER_RETRIES = REGISTRY.counter('ogame_driver_retries_total', 'Transient driver failures retried', ['op', 'kind'])
+
+SCAN_SYSTEMS = REGISTRY.counter('ogame_scan_systems_total', 'Galaxy systems scanned', ['result'])
+SCAN_TARGETS = REGISTRY.counter('ogame_scan_targets_total', 'Raid targets found by galaxy scans')
+SCAN_COVERAGE = REGISTRY.gauge('ogame_scan_coverage_ratio', 'Share of planned systems scanned in the last scan pass')
+
+QUEUE_BUSY = REGISTRY.gauge('ogame_building_queue_busy', 'Building queue occupied (1) or idle (0)', ['planet'])
+QUEUE_UTILIZATION = REGISTRY.gauge('ogame_building_queue_utilization_ratio', 'Share of planets with a busy queue')
+
+RAIDS_LAUNCHED = REGISTRY.counter('ogame_raids_launched_total', 'Raid fleets launched')
+FLEETS_RETURNED = REGISTRY.counter('ogame_fleets_returned_total', 'Own fleets returned home', ['mission'])
+LOOT = REGISTRY.counter('ogame_loot_total', 'Estimated loot of returned raids (resources)')
+LOOT_PER_HOUR = REGISTRY.gauge('ogame_loot_per_hour', 'Estimated loot of raids returned in the last hour')
+
+RESOURCES = REGISTRY.gauge('ogame_resources', 'Resources on the active planet', ['resource'])
+COLONIES = REGISTRY.gauge('ogame_colonies', 'Number of colonies')
+
+loot_events = collections.deque()  # (Zeit, Beute) der letzten Stunde
+
+
+def record_loot(amount, now=None):
+    """Beute einer zurückgekehrten Flotte"""
+    now = now or time.time()
+    LOOT.inc(amount)
+    loot_events.append((now, amount))
+    update_loot_rate(now)
+
+
+def update_loot_rate(now=None):
+    """Gleitendes Fenster neu berechnen (auch ohne neue Rückkehrer)"""
+    now = now or time.time()
+    while loot_events and loot_events[0][0] < now - LOOT_WINDOW:
+        loot_events.popleft()
+    LOOT_PER_HOUR.set(sum(amount for _, amount in loot_events) * 3600 / LOOT_WINDOW)
+
+
+def record_scan_pass(scanned, planned, targets):
+    """Abgeschlossener Galaxie-Scan: Abdeckung und Ziele"""
+    SCAN_COVERAGE.set(round(scanned / planned, 3) if planned else 0)
+    SCAN_TARGETS.inc(targets)
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?', 1)[0] != '/metrics':
+            body = b'See /metrics\n'
+            self.send_response(404)
+        else:
+            body = self.server.registry.render().encode('utf-8')
+            self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes nicht ins Bot-Log schreiben
+
+
+class MetricsServer:
+    """Lokaler /metrics-Endpunkt (Prometheus-Textformat) im Hintergrund-Thread"""
+
+    def __init__(self, logger, host="127.0.0.1", port=9400, registry=REGISTRY):
+        self.logger = logger
+        self.host = host
+        self.port = port
+        self.registry = registry
+        self.httpd = None
+
+    def start(self):
+        try:
+            self.httpd = ThreadingHTTPServer((self.host, self.port), MetricsHandler)
+        except OSError as e:
+            self.logger.error(f"❌ Metrics endpoint on port {self.port} failed: {e}")
+            return False
+
+        self.httpd.daemon_threads = True
+        self.httpd.registry = self.registry
+        self.port = self.httpd.server_address[1]
+        threading.Thread(target=self.httpd.serve_forever, name='metrics', daemon=True).start()
+        self.logger.info(f"📈 Metrics on http://{self.host}:{self.port}/metrics")
+        return True
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
@@ -0,0 +1,154 @@
+import random
+import time
+
+from src.core.metrics import DRIVER_RETRIES
+from src.core.runtime import RUNTIME
+
+# Fehlerklassen nach Klassen-Namen (Selenium, CDP, HTTP-Treiber, requests,
+# websocket) - so muss keins der optionalen Pakete importiert sein
+ERROR_KINDS = {
+    'StaleElementReferenceException': 'stale',
+    'ElementClickInterceptedException': 'blocked',
+    'ElementNotInteractableException': 'blocked',
+    'MoveTargetOutOfBoundsException': 'blocked',
+    'TimeoutException': 'timeout',
+    'ScriptTimeoutException': 'timeout',
+    'WebSocketTimeoutException': 'timeout',
+    'Timeout': 'timeout',  # requests (ReadTimeout, ConnectTimeout)
+    'TimeoutError': 'timeout',
+    'ConnectionError': 'connection',  # requests und eingebaut (ConnectionResetError, ...)
+    'ChunkedEncodingError': 'connection',
+    'RemoteDisconnected': 'connection',
+    'NoSuchElementException': 'missing',
+    'NoSuchAttributeException': 'missing',
+    'InvalidSessionIdException': 'fatal',
+    'NoSuchWindowException': 'fatal',
+    'SessionNotCreatedException': 'fatal',
+    'WebSocketConnectionClosedException': 'fatal',
+    'InvalidSelectorException': 'fatal'
+}
+
+# Treiber-Meldungen ohne eigene Exception-Klasse (z.B. CDP, WebDriverException)
+MESSAGE_KINDS = [
+    ('stale element', 'stale'),
+    ('not attached to the page', 'stale'),
+    ('node with given id does not exist', 'stale'),
+    ('timed out', 'timeout'),
+    ('timeout', 'timeout'),
+    ('connection refused', 'connection'),
+    ('connection reset', 'connection'),
+    ('disconnected', 'fatal'),
+    ('session deleted', 'fatal'),
+    ('invalid session id', 'fatal')
+]
+
+# Lesezugriffe dürfen bei jedem vorübergehenden Fehler wiederholt werden,
+# Aktionen (Klick, Eingabe) nur wenn sicher nichts passiert ist
+TRANSIENT_READ = {'stale', 'blocked', 'timeout', 'connection'}
+TRANSIENT_ACTION = {'stale', 'blocked'}
+
+
+def classify(error):
+    """Fehlerklasse: stale, blocked, timeout, connection, missing, fatal oder error"""
+    for cls in type(error).__mro__:
+        kind = ERROR_KINDS.get(cls.__name__)
+        if kind:
+            return kind
+
+    message = str(error).lower()
+    for text, kind in MESSAGE_KINDS:
+        if text in message:
+            return kind
+    return 'error'
+
+
+def is_transient(error, action=False):
+    """Lohnt ein sofortiger zweiter Versuch?"""
+    return classify(error) in (TRANSIENT_ACTION if action else TRANSIENT_READ)
+
+
+def backoff(attempt, base_delay=0.05, max_delay=1.0):
+    """Wartezeit vor Versuch attempt+1: exponentiell mit vollem Jitter"""
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+
+def retry_call(call, op='call', attempts=3, base_delay=0.05, max_delay=1.0, action=False, on_retry=None,
+               logger=None):
+    """
+    call() ausführen und vorübergehende Fehler nach kurzer Pause wiederholen.
+
+    on_retry(error) läuft vor jedem neuen Versuch (z.B. Element neu suchen).
+    Nicht vorübergehende Fehler und der letzte Fehlversuch werden
+    unverändert weitergereicht.
+    """
+    attempt = 0
+    while True:
+        try:
+            return call()
+        except Exception as e:
+            attempt += 1
+            if attempt >= attempts or not is_transient(e, action):
+                raise
+
+            kind = classify(e)
+            DRIVER_RETRIES.inc(op=op, kind=kind)
+            if logger:
+                logger.debug(f"🔁 {op}: {kind} ({type(e).__name__}) - retry {attempt}/{attempts - 1}")
+
+            if RUNTIME.pause(backoff(attempt - 1, base_delay, max_delay)):
+                raise  # Bot wird beendet
+            if on_retry:
+                on_retry(e)
+
+
+def failure_delay(error, default, transient_delay=15):
+    """Wartezeit nach einem fehlgeschlagenen Job: vorübergehende Fehler kosten keinen ganzen Zyklus"""
+    if is_transient(error):
+        return transient_delay * random.uniform(0.5, 1.5)
+    return default
+
+
+class StepMarkers:
+    """
+    Idempotenz-Marker für Schritte mit Nebenwirkung (Raid starten,
+    Forschung starten, Werft-Auftrag). Ein Schritt wird markiert sobald die
+    Aktion abgeschickt ist; scheitert danach etwas und der Job läuft erneut,
+    wird der Schritt innerhalb der Frist nicht doppelt ausgeführt.
+    """
+
+    def __init__(self):
+        self.markers = {}  # Schlüssel -> Ablaufzeit
+        self.checkpoint = None  # CheckpointStore - Marker überleben einen Absturz
+
+    def is_done(self, key):
+        expires = self.markers.get(key)
+        if expires is None:
+            return False
+        if expires <= time.time():
+            self.clear(key)
+            return False
+        return True
+
+    def mark(self, key, ttl=300):
+        self.markers[key] = time.time() + ttl
+        if self.checkpoint:
+            self.checkpoint.put('steps', key, self.markers[key])
+
+    def clear(self, key):
+        if self.markers.pop(key, None) is not None and self.checkpoint:
+            self.checkpoint.delete('steps', key)
+
+    def restore(self, checkpoint):
+        """Noch gültige Marker aus dem Checkpoint übernehmen"""
+        self.checkpoint = checkpoint
+        now = time.time()
+        for key, expires in checkpoint.load('steps').items():
+            if expires > now:
+                self.markers[key] = expires
+            else:
+                checkpoint.delete('steps', key)
+        return len(self.markers)
+
+
+# Ein Satz Marker pro Prozess - alle Manager teilen ihn
+STEPS = StepMarkers()
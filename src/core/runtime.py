@@ -0,0 +1,69 @@
+import threading
+import time
+
+
+class Runtime:
+    """
+    Gemeinsames Stop-/Weck-Signal für alle Wartezeiten eines Prozesses.
+
+    Jedes Warten läuft über wait() bzw. pause(): stop() beendet alle sofort,
+    wake() (neue Arbeit, Config neu laden) beendet nur wait(). pause() ist
+    für kurze Pausen mitten in einem Schritt (Seite laden) und endet nur
+    beim Stop. Die Aufrufe sind thread- und signal-sicher.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()  # RLock - auch aus einem Signal-Handler nutzbar
+        self.stopped = False
+        self.reload_requested = False
+        self.generation = 0  # Zählt wake()-Aufrufe
+
+    def wait(self, seconds, wakeable=True):
+        """Bis zu seconds warten - True wenn gestoppt wurde"""
+        deadline = time.monotonic() + max(0, seconds)
+        with self.condition:
+            generation = self.generation
+            while not self.stopped and not (wakeable and self.generation != generation):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.condition.wait(remaining)
+            return self.stopped
+
+    def pause(self, seconds):
+        """Kurze Pause innerhalb eines Schritts - nur ein Stop unterbricht"""
+        return self.wait(seconds, wakeable=False)
+
+    def wake(self):
+        """Alle wait()-Aufrufe sofort zurückkehren lassen"""
+        with self.condition:
+            self.generation += 1
+            self.condition.notify_all()
+
+    def stop(self):
+        """Alle Wartezeiten sofort beenden"""
+        with self.condition:
+            self.stopped = True
+            self.generation += 1
+            self.condition.notify_all()
+
+    def request_reload(self):
+        """Config neu laden lassen (z.B. SIGHUP)"""
+        self.reload_requested = True
+        self.wake()
+
+    def take_reload(self):
+        """Angeforderten Reload abholen (nur einmal True)"""
+        with self.condition:
+            requested, self.reload_requested = self.reload_requested, False
+            return requested
+
+    def reset(self):
+        """Für einen neuen Lauf im selben Prozess (Benchmark)"""
+        with self.condition:
+            self.stopped = False
+            self.reload_requested = False
+
+
+# Ein Signal pro Prozess - Bot, Manager und Supervisor teilen es
+RUNTIME = Runtime()
@@ -0,0 +1,170 @@
+import heapq
+import itertools
+import time
+
+from src.core.metrics import CYCLE_DURATION, SCHEDULER_LAG
+from src.core.retry import failure_delay
+
+
+class Job:
+    """Ein geplanter Job - callback gibt optional die nächste Wartezeit in Sekunden zurück"""
+
+    def __init__(self, key, callback, due, retry_delay=300):
+        self.key = key
+        self.callback = callback
+        self.due = due
+        self.retry_delay = retry_delay
+        self.cancelled = False
+        self.runs = 0
+        self.failures = 0
+        self.last_run = None
+
+
+class JobScheduler:
+    """
+    Prioritäts-Warteschlange zeitgesteuerter Jobs.
+
+    Wacht nur zum nächsten fälligen Job auf und führt genau diesen aus.
+    Jobs haben einen eindeutigen Schlüssel und können abgebrochen oder
+    verschoben werden (z.B. Bauende, Flotten-Rückkehr, Bezahlbarkeit).
+    """
+
+    def __init__(self, logger, wait=None, clock=None, checkpoint=None, breakers=None):
+        self.logger = logger
+        self.wait = wait or time.sleep  # wait(seconds) - darf früher zurückkehren
+        self.clock = clock or time.time
+
+        # Fälligkeiten überleben einen Neustart (Callbacks werden neu zugeordnet)
+        self.checkpoint = checkpoint
+        self.saved_due = checkpoint.load('jobs') if checkpoint else {}
+
+        # Sicherung pro Job (BreakerBoard) - kaputte Jobs pausieren, gesunde laufen weiter
+        self.breakers = breakers
+
+        self.queue = []  # (due, seq, job)
+        self.jobs = {}  # key -> aktiver Job
+        self.counter = itertools.count()
+
+        self.last_lag = 0.0  # Verspätung des zuletzt gestarteten Jobs
+
+    def schedule(self, key, callback, due=None, retry_delay=300):
+        """Job zu einer absoluten Zeit planen (ersetzt Job mit gleichem Schlüssel)"""
+        self.cancel(key)
+        job = Job(key, callback, due if due is not None else self.clock(), retry_delay)
+        self.jobs[key] = job
+        heapq.heappush(self.queue, (job.due, next(self.counter), job))
+        if self.checkpoint:
+            self.checkpoint.put('jobs', key, job.due)
+        return job
+
+    def resume(self, key, callback, delay=0, retry_delay=300):
+        """Job zur gespeicherten Fälligkeit planen - ohne Checkpoint in delay Sekunden"""
+        due = self.saved_due.pop(key, None)
+        if due is None:
+            return self.schedule_in(key, callback, delay, retry_delay)
+        return self.schedule(key, callback, due, retry_delay)
+
+    def schedule_in(self, key, callback, delay, retry_delay=300):
+        """Job in delay Sekunden planen"""
+        return self.schedule(key, callback, self.clock() + max(0, delay), retry_delay)
+
+    def cancel(self, key):
+        """Job abbrechen"""
+        job = self.jobs.pop(key, None)
+        if job:
+            job.cancelled = True
+            if self.checkpoint:
+                self.checkpoint.delete('jobs', key)
+        return job is not None
+
+    def reschedule(self, key, due):
+        """Job auf neue Zeit verschieben"""
+        job = self.jobs.get(key)
+        if not job:
+            return False
+        self.schedule(key, job.callback, due, job.retry_delay)
+        return True
+
+    def run_earlier(self, key, due):
+        """Job vorziehen falls er später fällig wäre"""
+        job = self.jobs.get(key)
+        if job and due < job.due:
+            return self.reschedule(key, due)
+        return False
+
+    def due_time(self, key):
+        """Fälligkeit eines Jobs (None wenn nicht geplant)"""
+        job = self.jobs.get(key)
+        return job.due if job else None
+
+    def next_job(self):
+        """Nächster nicht abgebrochener Job"""
+        while self.queue and self.queue[0][2].cancelled:
+            heapq.heappop(self.queue)
+        return self.queue[0][2] if self.queue else None
+
+    def run_next(self, should_continue=None):
+        """Schlafe bis zum nächsten Job und führe ihn aus - False wenn nichts lief"""
+        while True:
+            job = self.next_job()
+            if not job:
+                return False
+
+            delay = job.due - self.clock()
+            if delay <= 0:
+                break
+
+            # wait() darf früher zurückkehren (Stop, neue Jobs) - dann neu prüfen
+            self.wait(delay)
+            if should_continue and not should_continue():
+                return False
+
+        heapq.heappop(self.queue)
+        self.run_job(job)
+        return True
+
+    def run_job(self, job):
+        """Einen Job ausführen und anhand des Ergebnisses neu planen"""
+        breaker = self.breakers.get(job.key) if self.breakers else None
+        if breaker and not breaker.allow():
+            # Sicherung offen (z.B. vorgezogen) - erst zum Probelauf wieder
+            del self.jobs[job.key]
+            self.schedule_in(job.key, job.callback, breaker.retry_in(), job.retry_delay)
+            return
+
+        start = self.clock()
+        self.last_lag = max(0.0, start - job.due)
+        job.last_run = start
+        job.runs += 1
+        SCHEDULER_LAG.observe(self.last_lag, job=job.key)
+
+        started = time.perf_counter()
+        try:
+            next_delay = job.callback()
+            if breaker:
+                breaker.record_success()
+        except Exception as e:
+            job.failures += 1
+            self.logger.error(f"❌ Job '{job.key}' failed: {e}")
+            if breaker:
+                # Erst kurz erneut, nach dem Auslösen mit wachsender Abkühlzeit
+                breaker.record_failure(e)
+                next_delay = breaker.retry_in() or failure_delay(e, breaker.base_cooldown)
+            else:
+                next_delay = failure_delay(e, job.retry_delay)
+        CYCLE_DURATION.observe(time.perf_counter() - started, job=job.key)
+
+        # Job könnte sich während der Ausführung selbst neu geplant haben
+        if job.cancelled or self.jobs.get(job.key) is not job:
+            return
+
+        del self.jobs[job.key]
+        if next_delay is not None:
+            self.schedule_in(job.key, job.callback, next_delay, job.retry_delay)
+        elif self.checkpoint:
+            self.checkpoint.delete('jobs', job.key)
+
+    def pending(self):
+        """Übersicht der geplanten Jobs (key -> Sekunden bis fällig)"""
+        now = self.clock()
+        return {key: round(job.due - now) for key, job in sorted(self.jobs.items(), key=lambda kv: kv[1].due)}
@@ -0,0 +1,61 @@
+import importlib
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+
+IMPORT_TIMES = {}  # Gruppe -> Sekunden für den ersten Import
+
+# Was jedes Backend beim Start nachlädt (für --import-times)
+IMPORT_GROUPS = {
+    'managers': ['src.managers.building_manager', 'src.managers.fleet_manager', 'src.managers.colonization_manager',
+                 'src.managers.resource_manager', 'src.managers.empire_manager', 'src.managers.research_manager',
+                 'src.managers.shipyard_manager'],
+    'selenium': ['selenium.webdriver', 'selenium.webdriver.chrome.options', 'selenium.webdriver.support.ui'],
+    'cdp': ['src.browser.cdp_driver', 'websocket'],
+    'snapshot': ['src.browser.snapshot'],
+    'http': ['src.browser.http_driver']
+}
+
+
+def timed_import(group, module):
+    """Modul erst bei Bedarf importieren - die Zeit zählt für die Gruppe"""
+    if module in sys.modules:
+        return sys.modules[module]
+    started = time.perf_counter()
+    try:
+        return importlib.import_module(module)
+    finally:
+        IMPORT_TIMES[group] = IMPORT_TIMES.get(group, 0.0) + time.perf_counter() - started
+
+
+def record_import_time(group, started):
+    """Zeit seit started (perf_counter) einer Gruppe zuschreiben"""
+    IMPORT_TIMES[group] = IMPORT_TIMES.get(group, 0.0) + time.perf_counter() - started
+
+
+def import_report():
+    """'selenium 412ms, managers 38ms, ...' - teuerste zuerst"""
+    ranked = sorted(IMPORT_TIMES.items(), key=lambda item: item[1], reverse=True)
+    return ', '.join(f"{group} {seconds * 1000:.0f}ms" for group, seconds in ranked)
+
+
+def measure_all_imports():
+    """Alle Backends laden und die Zeiten ausgeben (python3 ogame_bot.py --import-times)"""
+    for group, modules in IMPORT_GROUPS.items():
+        for module in modules:
+            try:
+                timed_import(group, module)
+            except ImportError as e:
+                print(f"⚠️ {group}: {e}")
+    total = sum(IMPORT_TIMES.values())
+    print(f"📦 Import times ({total * 1000:.0f}ms): {import_report()}")
+
+
+def install_dependencies(requirements=None):
+    """Abhängigkeiten explizit installieren (python3 ogame_bot.py --install-deps)"""
+    requirements = requirements or project_root / "requirements.txt"
+    print(f"📦 Installing dependencies from {requirements}...")
+    return subprocess.call([sys.executable, "-m", "pip", "install", "-r", str(requirements)])
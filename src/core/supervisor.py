@@ -0,0 +1,343 @@
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from src.core.runtime import RUNTIME
+
+project_root = Path(__file__).resolve().parent.parent.parent
+
+
+def load_accounts(config_path):
+    """Lies Account-Datei und ergänze Port/Profil pro Account"""
+    with open(config_path) as f:
+        data = json.load(f)
+
+    defaults = {
+        'base_port': 9300,
+        'profiles_dir': str(project_root / "profiles"),
+        'max_restarts_per_hour': 5,
+        'restart_backoff': 10,
+        'max_backoff': 600,
+        'start_stagger': 5,  # Sekunden zwischen Worker-Starts
+        'nice': 10,  # Worker mit niedriger CPU-Priorität
+        'status_interval': 60,
+        'metrics_base_port': 0  # >0: Worker N bekommt /metrics auf metrics_base_port + N
+    }
+    settings = {**defaults, **data.get('supervisor', {})}
+
+    accounts = []
+    for index, account in enumerate(data.get('accounts', [])):
+        if account.get('enabled', True) is False:
+            continue
+        account = dict(account)
+        account.setdefault('name', f"account{index + 1}")
+        account.setdefault('debug_port', settings['base_port'] + index)
+        account.setdefault('profile_dir', str(Path(settings['profiles_dir']) / account['name']))
+        if settings['metrics_base_port']:
+            account.setdefault('metrics_port', settings['metrics_base_port'] + index)
+        accounts.append(account)
+
+    names = [a['name'] for a in accounts]
+    if len(names) != len(set(names)):
+        raise ValueError("Account names must be unique")
+
+    return settings, accounts
+
+
+def setup_supervisor_logging():
+    """Supervisor-Log (enthält auch die Ausgaben aller Worker)"""
+    log_dir = project_root / "logs"
+    log_dir.mkdir(exist_ok=True)
+
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+
+    file_handler = logging.FileHandler(log_dir / "supervisor.log")
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    logger = logging.getLogger('OGameSupervisor')
+    logger.setLevel(logging.INFO)
+    logger.handlers = [file_handler, console_handler]
+    return logger
+
+
+def find_account(config_path, name):
+    """Einen Account aus der Datei holen"""
+    _, accounts = load_accounts(config_path)
+    for account in accounts:
+        if account['name'] == name:
+            return account
+    return None
+
+
+class Worker:
+    """Ein Bot-Prozess für einen Account"""
+
+    def __init__(self, account):
+        self.account = account
+        self.name = account['name']
+        self.process = None
+        self.started_at = None
+        self.restarts = []  # Zeitpunkte der Neustarts
+        self.last_exit = None
+        self.next_start = 0
+        self.backoff = None
+        self.log_lines = 0
+
+
+class Supervisor:
+    """
+    Startet einen Bot-Prozess pro Account/Universum aus einer Account-Datei.
+
+    Jeder Worker bekommt eigenen Debugging-Port und eigenes Profil,
+    abgestürzte Worker werden mit Backoff neu gestartet. Logs aller
+    Worker landen mit Präfix im Supervisor-Log, Prozess-Kennzahlen
+    regelmäßig in logs/supervisor_status.json.
+    """
+
+    def __init__(self, config_path, logger):
+        self.config_path = config_path
+        self.logger = logger
+        self.settings, accounts = load_accounts(config_path)
+        self.workers = {a['name']: Worker(a) for a in accounts}
+        self.running = True
+        self.status_file = project_root / "logs" / "supervisor_status.json"
+
+    def run(self):
+        """Worker starten und überwachen bis zum Stop"""
+        if not self.workers:
+            self.logger.error("❌ No accounts configured")
+            return False
+
+        signal.signal(signal.SIGINT, self.signal_handler)
+        signal.signal(signal.SIGTERM, self.signal_handler)
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, self.reload_handler)
+
+        self.logger.info(f"👥 Supervisor starting {len(self.workers)} workers")
+
+        # Starts staffeln damit nicht alle Browser gleichzeitig hochfahren
+        now = time.time()
+        for index, worker in enumerate(self.workers.values()):
+            worker.next_start = now + index * self.settings['start_stagger']
+
+        last_status = 0
+        while self.running:
+            for worker in self.workers.values():
+                self.check_worker(worker)
+
+            if time.time() - last_status >= self.settings['status_interval']:
+                self.write_status()
+                last_status = time.time()
+
+            RUNTIME.wait(1)
+
+        self.stop_all()
+        self.write_status()
+        return True
+
+    def check_worker(self, worker):
+        """Worker starten oder Absturz behandeln"""
+        if worker.process is None:
+            if time.time() >= worker.next_start:
+                self.start_worker(worker)
+            return
+
+        exit_code = worker.process.poll()
+        if exit_code is None:
+            return
+
+        worker.last_exit = exit_code
+        worker.process = None
+        runtime = time.time() - (worker.started_at or time.time())
+
+        if exit_code == 0:
+            self.logger.info(f"✅ Worker {worker.name} finished")
+            worker.next_start = float('inf')
+            return
+
+        # Lief der Worker lange genug, Backoff zurücksetzen
+        if runtime > self.settings['max_backoff']:
+            worker.backoff = None
+
+        hour_ago = time.time() - 3600
+        worker.restarts = [t for t in worker.restarts if t > hour_ago]
+        if len(worker.restarts) >= self.settings['max_restarts_per_hour']:
+            self.logger.error(f"❌ Worker {worker.name} crashed too often - giving up for one hour")
+            worker.next_start = worker.restarts[0] + 3600
+            return
+
+        worker.backoff = min((worker.backoff or self.settings['restart_backoff'] / 2) * 2, self.settings['max_backoff'])
+        worker.next_start = time.time() + worker.backoff
+        worker.restarts.append(time.time())
+        self.logger.warning(f"⚠️ Worker {worker.name} exited with {exit_code} - restart in {int(worker.backoff)}s")
+
+    def start_worker(self, worker):
+        """Bot-Prozess für einen Account starten"""
+        command = [
+            sys.executable, str(project_root / "ogame_bot.py"),
+            "--accounts", str(self.config_path),
+            "--account", worker.name
+        ]
+
+        try:
+            worker.process = subprocess.Popen(
+                command,
+                cwd=str(project_root),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                env={**os.environ, 'PYTHONUNBUFFERED': '1'}
+            )
+        except Exception as e:
+            self.logger.error(f"❌ Could not start worker {worker.name}: {e}")
+            worker.next_start = time.time() + self.settings['restart_backoff']
+            return
+
+        if self.settings['nice']:
+            self.lower_priority(worker)
+
+        worker.started_at = time.time()
+        self.logger.info(f"🚀 Worker {worker.name} started (pid {worker.process.pid}, port {worker.account['debug_port']})")
+
+        threading.Thread(target=self.pump_logs, args=(worker, worker.process), daemon=True).start()
+
+    def lower_priority(self, worker):
+        """
+        Worker nach dem Start niedriger priorisieren. Kein preexec_fn - das ist
+        in einem Prozess mit Threads (Log-Pumpen) nicht sicher. Der Browser
+        startet erst später aus dem Worker und erbt die Priorität.
+        """
+        if not hasattr(os, 'setpriority'):
+            return
+        try:
+            niceness = min(os.getpriority(os.PRIO_PROCESS, 0) + self.settings['nice'], 19)
+            os.setpriority(os.PRIO_PROCESS, worker.process.pid, niceness)
+        except OSError as e:
+            self.logger.debug(f"Could not lower priority of {worker.name}: {e}")
+
+    def pump_logs(self, worker, process):
+        """Ausgabe eines Workers mit Präfix ins Supervisor-Log"""
+        for line in process.stdout:
+            worker.log_lines += 1
+            self.logger.info(f"[{worker.name}] {line.rstrip()}")
+
+    def stop_all(self, timeout=20):
+        """Alle Worker sauber beenden"""
+        running = [w for w in self.workers.values() if w.process and w.process.poll() is None]
+        for worker in running:
+            worker.process.send_signal(signal.SIGTERM)
+
+        deadline = time.time() + timeout
+        for worker in running:
+            try:
+                worker.process.wait(timeout=max(0, deadline - time.time()))
+            except subprocess.TimeoutExpired:
+                self.logger.warning(f"⚠️ Killing worker {worker.name}")
+                worker.process.kill()
+
+        self.logger.info("🔚 All workers stopped")
+
+    def signal_handler(self, signum, frame):
+        self.logger.info("👋 Supervisor shutdown requested...")
+        self.running = False
+        RUNTIME.stop()
+
+    def reload_handler(self, signum, frame):
+        """SIGHUP an alle Worker weiterreichen (Config neu laden)"""
+        for worker in self.workers.values():
+            if worker.process and worker.process.poll() is None:
+                worker.process.send_signal(signum)
+
+    def process_table(self):
+        """Alle Prozesse aus /proc (Linux): pid -> (ppid, session, CPU-Sekunden, RSS in MB)"""
+        table = {}
+        try:
+            ticks = os.sysconf('SC_CLK_TCK')
+            page_size = os.sysconf('SC_PAGE_SIZE')
+            pids = [int(entry) for entry in os.listdir('/proc') if entry.isdigit()]
+        except (OSError, ValueError, AttributeError):
+            return table
+
+        for pid in pids:
+            try:
+                with open(f"/proc/{pid}/stat") as f:
+                    fields = f.read().rsplit(')', 1)[1].split()
+                table[pid] = (int(fields[1]), int(fields[3]),
+                              (int(fields[11]) + int(fields[12])) / ticks,
+                              int(fields[21]) * page_size / 1024 / 1024)
+            except (OSError, IndexError, ValueError):
+                continue  # Prozess inzwischen beendet
+        return table
+
+    def process_stats(self, pid, table):
+        """
+        CPU-Zeit und Speicher eines Workers und seines Browsers.
+
+        Chromium läuft in eigener Session (start_new_session) mit vielen
+        Kindprozessen - gezählt werden alle Nachfahren des Workers plus alle
+        Prozesse deren Session ein Nachfahre eröffnet hat (auch wenn sie
+        umgehängt wurden). RSS ist die Summe, geteilte Seiten zählen mehrfach.
+        """
+        if pid not in table:
+            return {}
+
+        children = {}
+        for child, (ppid, _, _, _) in table.items():
+            children.setdefault(ppid, []).append(child)
+
+        descendants = set()
+        stack = list(children.get(pid, []))
+        while stack:
+            child = stack.pop()
+            if child not in descendants:
+                descendants.add(child)
+                stack.extend(children.get(child, []))
+        descendants |= {p for p, (_, session, _, _) in table.items() if session in descendants and p != pid}
+
+        _, _, cpu, rss = table[pid]
+        return {
+            'cpu_seconds': round(cpu, 1),
+            'rss_mb': round(rss, 1),
+            'browser_processes': len(descendants),
+            'browser_cpu_seconds': round(sum(table[p][2] for p in descendants), 1),
+            'browser_rss_mb': round(sum(table[p][3] for p in descendants), 1)
+        }
+
+    def write_status(self):
+        """Kennzahlen aller Worker als JSON schreiben"""
+        now = time.time()
+        status = {'updated_at': int(now), 'workers': {}}
+        table = self.process_table()
+
+        for worker in self.workers.values():
+            alive = worker.process is not None and worker.process.poll() is None
+            entry = {
+                'alive': alive,
+                'pid': worker.process.pid if alive else None,
+                'debug_port': worker.account['debug_port'],
+                'uptime': int(now - worker.started_at) if alive and worker.started_at else 0,
+                'restarts_last_hour': len([t for t in worker.restarts if t > now - 3600]),
+                'last_exit': worker.last_exit,
+                'log_lines': worker.log_lines
+            }
+            if alive:
+                entry.update(self.process_stats(worker.process.pid, table))
+            status['workers'][worker.name] = entry
+
+        try:
+            self.status_file.parent.mkdir(exist_ok=True)
+            tmp = self.status_file.with_suffix('.tmp')
+            tmp.write_text(json.dumps(status, indent=2))
+            tmp.replace(self.status_file)
+        except OSError as e:
+            self.logger.debug(f"Status write failed: {e}")
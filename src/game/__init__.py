@@ -0,0 +1 @@
+# OGame Bot Game Data Module
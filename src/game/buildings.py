@@ -0,0 +1,30 @@
+# OGame Gebäude-Daten (Technologie-IDs wie im Spiel, Namen wie im BuildingManager)
+
+BUILDING_IDS = {
+    1: 'metallmine',
+    2: 'kristallmine',
+    3: 'deuteriumsynthetisierer',
+    4: 'solarkraftwerk',
+    12: 'fusionskraftwerk',
+    14: 'roboterfabrik',
+    15: 'nanofabrik',
+    21: 'raumschiffwerft',
+    22: 'metallspeicher',
+    23: 'kristallspeicher',
+    24: 'deuteriumtank',
+    31: 'forschungslabor',
+    33: 'terraformer',
+    34: 'allianzdepot',
+    36: 'raumdock',
+    44: 'raketensilo'
+}
+
+BUILDING_NAME_IDS = {name: building_id for building_id, name in BUILDING_IDS.items()}
+
+
+def building_name_from_id(building_id):
+    """Gebäude-Name aus Technologie-ID"""
+    try:
+        return BUILDING_IDS.get(int(building_id))
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,247 @@
+# OGame Kampf-Simulation (Standard-Regeln: 6 Runden, Schilde, Hülle, Rapidfire)
+
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.game.defense import DEFENSE_IDS, defense_type_from_id
+from src.game.ships import ship_type_from_id
+
+ROUNDS = 6
+PLUNDER_RATIO = 0.5  # Anteil der Ressourcen, den ein Sieger mitnimmt
+DEFENSE_REBUILD = 0.7  # Zerstörte Verteidigung wird zu 70% wieder aufgebaut
+
+# Strukturpunkte, Schild, Waffe, Ladekapazität, Kosten (Metall, Kristall, Deuterium)
+UNITS = {
+    'small_cargo': (4000, 10, 5, 5000, (2000, 2000, 0)),
+    'large_cargo': (12000, 25, 5, 25000, (6000, 6000, 0)),
+    'light_fighter': (4000, 10, 50, 50, (3000, 1000, 0)),
+    'heavy_fighter': (10000, 25, 150, 100, (6000, 4000, 0)),
+    'cruiser': (27000, 50, 400, 800, (20000, 7000, 2000)),
+    'battleship': (60000, 200, 1000, 1500, (45000, 15000, 0)),
+    'colony_ship': (30000, 100, 50, 7500, (10000, 20000, 10000)),
+    'recycler': (16000, 10, 1, 20000, (10000, 6000, 2000)),
+    'espionage_probe': (1000, 0, 0, 0, (0, 1000, 0)),
+    'bomber': (75000, 500, 1000, 500, (50000, 25000, 15000)),
+    'solar_satellite': (2000, 1, 1, 0, (0, 2000, 500)),
+    'destroyer': (110000, 500, 2000, 2000, (60000, 50000, 15000)),
+    'deathstar': (9000000, 50000, 200000, 1000000, (5000000, 4000000, 1000000)),
+    'battlecruiser': (70000, 400, 700, 750, (30000, 40000, 15000)),
+    'crawler': (4000, 1, 1, 0, (2000, 2000, 1000)),
+    'reaper': (140000, 700, 2800, 10000, (85000, 55000, 20000)),
+    'pathfinder': (23000, 100, 200, 10000, (8000, 15000, 8000)),
+    'rocket_launcher': (2000, 20, 80, 0, (2000, 0, 0)),
+    'light_laser': (2000, 25, 100, 0, (1500, 500, 0)),
+    'heavy_laser': (8000, 100, 250, 0, (6000, 2000, 0)),
+    'gauss_cannon': (35000, 200, 1100, 0, (20000, 15000, 2000)),
+    'ion_cannon': (8000, 500, 150, 0, (5000, 3000, 0)),
+    'plasma_turret': (100000, 300, 3000, 0, (50000, 50000, 30000)),
+    'small_shield_dome': (20000, 2000, 1, 0, (10000, 10000, 0)),
+    'large_shield_dome': (100000, 10000, 1, 0, (50000, 50000, 0))
+}
+
+# Schütze -> {Ziel: Rapidfire}; Sonden, Satelliten und Crawler trifft fast jedes Schiff mehrfach
+CIVIL_TARGETS = {'espionage_probe': 5, 'solar_satellite': 5, 'crawler': 5}
+RAPID_FIRE = {
+    'small_cargo': CIVIL_TARGETS,
+    'large_cargo': CIVIL_TARGETS,
+    'light_fighter': CIVIL_TARGETS,
+    'heavy_fighter': {**CIVIL_TARGETS, 'small_cargo': 3},
+    'cruiser': {**CIVIL_TARGETS, 'light_fighter': 6, 'rocket_launcher': 10},
+    'battleship': {**CIVIL_TARGETS, 'pathfinder': 5},
+    'colony_ship': CIVIL_TARGETS,
+    'recycler': CIVIL_TARGETS,
+    'bomber': {**CIVIL_TARGETS, 'rocket_launcher': 20, 'light_laser': 20, 'heavy_laser': 10, 'ion_cannon': 10,
+               'plasma_turret': 5},
+    'destroyer': {**CIVIL_TARGETS, 'light_laser': 10, 'battlecruiser': 2},
+    'deathstar': {'small_cargo': 250, 'large_cargo': 250, 'light_fighter': 200, 'heavy_fighter': 100, 'cruiser': 33,
+                  'battleship': 30, 'colony_ship': 250, 'recycler': 250, 'espionage_probe': 1250,
+                  'solar_satellite': 1250, 'bomber': 25, 'destroyer': 5, 'battlecruiser': 15, 'crawler': 1250,
+                  'reaper': 10, 'pathfinder': 30, 'rocket_launcher': 200, 'light_laser': 200, 'heavy_laser': 100,
+                  'gauss_cannon': 50, 'ion_cannon': 100},
+    'battlecruiser': {**CIVIL_TARGETS, 'small_cargo': 3, 'large_cargo': 3, 'heavy_fighter': 4, 'cruiser': 4,
+                      'battleship': 7},
+    'reaper': {**CIVIL_TARGETS, 'battleship': 7, 'bomber': 4, 'destroyer': 3},
+    'pathfinder': {**CIVIL_TARGETS, 'cruiser': 3, 'light_fighter': 3, 'heavy_fighter': 2}
+}
+
+UNIT_NAMES = list(UNITS)
+UNIT_INDEX = {name: index for index, name in enumerate(UNIT_NAMES)}
+STRUCTURE = np.array([UNITS[name][0] for name in UNIT_NAMES], dtype=float)
+SHIELD = np.array([UNITS[name][1] for name in UNIT_NAMES], dtype=float)
+WEAPON = np.array([UNITS[name][2] for name in UNIT_NAMES], dtype=float)
+CARGO = np.array([UNITS[name][3] for name in UNIT_NAMES], dtype=float)
+VALUE = np.array([sum(UNITS[name][4]) for name in UNIT_NAMES], dtype=float)
+IS_DEFENSE = np.array([name in DEFENSE_IDS.values() for name in UNIT_NAMES])
+
+RAPID_FIRE_MATRIX = np.ones((len(UNIT_NAMES), len(UNIT_NAMES)))
+for shooter, targets in RAPID_FIRE.items():
+    for target, value in targets.items():
+        RAPID_FIRE_MATRIX[UNIT_INDEX[shooter], UNIT_INDEX[target]] = value
+# Chance auf einen weiteren Schuss nach jedem Treffer
+RAPID_FIRE_CHANCE = 1 - 1 / RAPID_FIRE_MATRIX
+
+
+def unit_counts(units):
+    """{'light_fighter': 5, '401': 10, ...} -> {Einheiten-Index: Anzahl} (Unbekanntes wird ignoriert)"""
+    counts = {}
+    for key, count in (units or {}).items():
+        name = key if key in UNIT_INDEX else ship_type_from_id(key) or defense_type_from_id(key)
+        count = int(count or 0)
+        if name in UNIT_INDEX and count > 0:
+            counts[UNIT_INDEX[name]] = counts.get(UNIT_INDEX[name], 0) + count
+    return counts
+
+
+class CombatSide:
+    """Alle Einheiten einer Seite als Arrays (eine Zeile pro Einheit)"""
+
+    def __init__(self, counts, research=None):
+        research = research or {}
+        self.types = np.repeat(np.array(list(counts), dtype=int), list(counts.values()))
+        self.max_hull = STRUCTURE[self.types] / 10 * (1 + 0.1 * research.get('armour', 0))
+        self.hull = self.max_hull.copy()
+        self.shield = SHIELD[self.types] * (1 + 0.1 * research.get('shielding', 0))
+        self.attack = WEAPON[self.types] * (1 + 0.1 * research.get('weapons', 0))
+
+    def __len__(self):
+        return len(self.types)
+
+    def fire_at(self, enemy, rng):
+        """Alle Schüsse einer Runde (inkl. Rapidfire) -> Schaden pro gegnerischer Einheit"""
+        damage = np.zeros(len(enemy))
+        shooters = np.arange(len(self))
+        while len(shooters):
+            hit = rng.integers(0, len(enemy), len(shooters))
+            attack = self.attack[shooters]
+            # Schüsse unter 1% des Schilds prallen wirkungslos ab
+            attack = np.where(attack < 0.01 * enemy.shield[hit], 0.0, attack)
+            damage += np.bincount(hit, weights=attack, minlength=len(enemy))
+            again = rng.random(len(shooters)) < RAPID_FIRE_CHANCE[self.types[shooters], enemy.types[hit]]
+            shooters = shooters[again]
+        return damage
+
+    def take(self, damage, rng):
+        """Schaden nach Schild auf die Hülle, Explosionen, Zerstörte entfernen"""
+        self.hull -= np.maximum(0.0, damage - self.shield)  # Schilde laden jede Runde neu
+        integrity = np.clip(self.hull / self.max_hull, 0.0, 1.0)
+        exploded = (integrity < 0.7) & (rng.random(len(self)) < 1 - integrity)
+        alive = (self.hull > 0) & ~exploded
+
+        self.types = self.types[alive]
+        self.max_hull = self.max_hull[alive]
+        self.hull = self.hull[alive]
+        self.shield = self.shield[alive]
+        self.attack = self.attack[alive]
+
+
+def loss_value(before, after):
+    """Ressourcen-Wert der zerstörten Einheiten (Verteidigung nur der nicht wieder aufgebaute Teil)"""
+    lost = np.bincount(before, minlength=len(UNIT_NAMES)) - np.bincount(after, minlength=len(UNIT_NAMES))
+    return float((lost * VALUE * np.where(IS_DEFENSE, 1 - DEFENSE_REBUILD, 1.0)).sum())
+
+
+def fight(attackers, defenders, attacker_research=None, defender_research=None, rng=None):
+    """Ein Kampf -> (Ergebnis 1/0/-1, Verlust Angreifer, Verlust Verteidiger, Ladekapazität der Überlebenden)"""
+    rng = rng or np.random.default_rng()
+    attack = CombatSide(attackers, attacker_research)
+    defend = CombatSide(defenders, defender_research)
+    attack_before, defend_before = attack.types, defend.types
+
+    for _ in range(ROUNDS):
+        if not len(attack) or not len(defend):
+            break
+        to_defender = attack.fire_at(defend, rng)
+        to_attacker = defend.fire_at(attack, rng)
+        defend.take(to_defender, rng)
+        attack.take(to_attacker, rng)
+
+    if len(attack) and not len(defend):
+        outcome = 1
+    elif len(defend) and not len(attack):
+        outcome = -1
+    else:
+        outcome = 0  # Unentschieden (auch wenn beide Seiten vernichtet sind)
+    return (outcome, loss_value(attack_before, attack.types), loss_value(defend_before, defend.types),
+            float(CARGO[attack.types].sum()))
+
+
+def simulate_batch(attackers, defenders, attacker_research, defender_research, runs, seed):
+    """Monte-Carlo-Block (läuft im Worker-Prozess) -> Ergebnis-Arrays"""
+    rng = np.random.default_rng(seed)
+    results = np.array([fight(attackers, defenders, attacker_research, defender_research, rng)
+                        for _ in range(runs)])
+    return results.reshape(runs, 4)
+
+
+class CombatSimulator:
+    """
+    Monte-Carlo-Vorhersage eines Raids aus Spionage-Daten.
+
+    Jeder Kampf rechnet über alle Einheiten zugleich (NumPy); die Läufe
+    werden in Blöcken auf einen Prozess-Pool verteilt, der beim ersten
+    größeren Auftrag startet und danach wiederverwendet wird.
+    """
+
+    def __init__(self, logger, runs=200, workers=None, min_batch=50):
+        self.logger = logger
+        self.runs = runs
+        self.workers = workers or max(1, min(4, multiprocessing.cpu_count() - 1))
+        self.min_batch = min_batch  # Kleinere Aufträge laufen ohne Pool
+        self.pool = None
+
+    def predict(self, attackers, report, attacker_research=None, runs=None, seed=None):
+        """Siegchance, Verluste und Beute eines Angriffs auf ein ausspioniertes Ziel"""
+        runs = runs or self.runs
+        attacking = unit_counts(attackers)
+        defending = unit_counts({**(report.get('ships') or {}), **(report.get('defense') or {})})
+        defender_research = report.get('research') or {}
+        seed = seed if seed is not None else random.getrandbits(32)
+
+        if not attacking:
+            raise ValueError("No attacking ships")
+
+        if not defending:
+            # Ungeschütztes Ziel - kein Kampf, nur Ladekapazität zählt
+            results = np.array([[1, 0.0, 0.0, float(sum(CARGO[t] * n for t, n in attacking.items()))]] * runs)
+        else:
+            results = self.run_batches(attacking, defending, attacker_research or {}, defender_research, runs, seed)
+
+        outcome, attacker_lost, defender_lost, cargo = results.T
+        resources = sum(float(value or 0) for value in (report.get('resources') or {}).values())
+        loot = np.where(outcome == 1, np.minimum(cargo, resources * PLUNDER_RATIO), 0.0)
+
+        return {
+            'runs': runs,
+            'win_probability': round(float((outcome == 1).mean()), 3),
+            'draw_probability': round(float((outcome == 0).mean()), 3),
+            'loss_probability': round(float((outcome == -1).mean()), 3),
+            'attacker_losses': round(float(attacker_lost.mean())),
+            'defender_losses': round(float(defender_lost.mean())),
+            'expected_loot': round(float(loot.mean())),
+            'expected_profit': round(float(loot.mean() - attacker_lost.mean()))
+        }
+
+    def run_batches(self, attacking, defending, attacker_research, defender_research, runs, seed):
+        """Läufe auf den Pool verteilen (oder direkt rechnen wenn es sich nicht lohnt)"""
+        batches = min(self.workers, runs // self.min_batch)
+        if batches <= 1:
+            return simulate_batch(attacking, defending, attacker_research, defender_research, runs, seed)
+
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+            self.logger.info(f"⚔️ Combat simulator pool started ({self.workers} workers)")
+
+        sizes = [runs // batches + (1 if i < runs % batches else 0) for i in range(batches)]
+        futures = [
+            self.pool.submit(simulate_batch, attacking, defending, attacker_research, defender_research, size, seed + i)
+            for i, size in enumerate(sizes)
+        ]
+        return np.concatenate([future.result() for future in futures])
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
@@ -0,0 +1,22 @@
+# OGame Verteidigungs-Daten (Technologie-IDs wie im Spiel)
+
+DEFENSE_IDS = {
+    401: 'rocket_launcher',
+    402: 'light_laser',
+    403: 'heavy_laser',
+    404: 'gauss_cannon',
+    405: 'ion_cannon',
+    406: 'plasma_turret',
+    407: 'small_shield_dome',
+    408: 'large_shield_dome',
+    502: 'anti_ballistic_missile',
+    503: 'interplanetary_missile'
+}
+
+
+def defense_type_from_id(defense_id):
+    """Verteidigungs-Typ aus Technologie-ID"""
+    try:
+        return DEFENSE_IDS.get(int(defense_id))
+    except (TypeError, ValueError):
+        return None
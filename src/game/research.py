@@ -0,0 +1,85 @@
+# OGame Forschungs-Daten (Technologie-IDs wie im Spiel)
+
+RESEARCH_IDS = {
+    106: 'espionage',
+    108: 'computer',
+    109: 'weapons',
+    110: 'shielding',
+    111: 'armour',
+    113: 'energy',
+    114: 'hyperspace',
+    115: 'combustion_drive',
+    117: 'impulse_drive',
+    118: 'hyperspace_drive',
+    120: 'laser',
+    121: 'ion',
+    122: 'plasma',
+    123: 'research_network',
+    124: 'astrophysics'
+}
+
+RESEARCH_TYPE_IDS = {research: research_id for research_id, research in RESEARCH_IDS.items()}
+
+# Grundkosten Stufe 1 (Metall, Kristall, Deuterium) und Kostenfaktor pro Stufe
+RESEARCH_COSTS = {
+    'espionage': (200, 1000, 200, 2),
+    'computer': (0, 400, 600, 2),
+    'weapons': (800, 200, 0, 2),
+    'shielding': (200, 600, 0, 2),
+    'armour': (1000, 0, 0, 2),
+    'energy': (0, 800, 400, 2),
+    'hyperspace': (0, 4000, 2000, 2),
+    'combustion_drive': (400, 0, 600, 2),
+    'impulse_drive': (2000, 4000, 600, 2),
+    'hyperspace_drive': (10000, 20000, 6000, 2),
+    'laser': (200, 100, 0, 2),
+    'ion': (1000, 300, 100, 2),
+    'plasma': (2000, 4000, 1000, 2),
+    'research_network': (240000, 400000, 160000, 2),
+    'astrophysics': (4000, 8000, 4000, 1.75)
+}
+
+# Voraussetzungen: Forschungen und Forschungslabor-Stufe
+RESEARCH_REQUIREMENTS = {
+    'espionage': {'forschungslabor': 3},
+    'computer': {'forschungslabor': 1},
+    'weapons': {'forschungslabor': 4},
+    'shielding': {'forschungslabor': 6, 'energy': 3},
+    'armour': {'forschungslabor': 2},
+    'energy': {'forschungslabor': 1},
+    'hyperspace': {'forschungslabor': 7, 'energy': 5, 'shielding': 5},
+    'combustion_drive': {'forschungslabor': 1, 'energy': 1},
+    'impulse_drive': {'forschungslabor': 2, 'energy': 1},
+    'hyperspace_drive': {'forschungslabor': 7, 'hyperspace': 3},
+    'laser': {'forschungslabor': 1, 'energy': 2},
+    'ion': {'forschungslabor': 4, 'laser': 5, 'energy': 4},
+    'plasma': {'forschungslabor': 4, 'energy': 8, 'laser': 10, 'ion': 5},
+    'research_network': {'forschungslabor': 10, 'computer': 8, 'hyperspace': 8},
+    'astrophysics': {'forschungslabor': 3, 'espionage': 4, 'impulse_drive': 3}
+}
+
+
+def research_type_from_id(research_id):
+    """Forschungs-Name aus Technologie-ID"""
+    try:
+        return RESEARCH_IDS.get(int(research_id))
+    except (TypeError, ValueError):
+        return None
+
+
+def research_cost(research, level):
+    """Kosten einer Stufe - gleiche Formel wie bei Gebäuden (Basis * Faktor^(Stufe-1))"""
+    metal, crystal, deuterium, factor = RESEARCH_COSTS[research]
+    scale = factor ** (level - 1)
+    return {'metal': int(metal * scale), 'crystal': int(crystal * scale), 'deuterium': int(deuterium * scale)}
+
+
+def research_time(cost, lab_level, speed=1):
+    """Forschungszeit in Sekunden - wie die Bauzeit, nur mit dem Labor statt der Roboterfabrik"""
+    hours = (cost['metal'] + cost['crystal']) / (1000 * (1 + lab_level) * speed)
+    return max(1, int(hours * 3600))
+
+
+def max_planets(astrophysics):
+    """Planeten-Limit inkl. Hauptplanet (jede zweite Astrophysik-Stufe ein Slot)"""
+    return 1 + (astrophysics + 1) // 2
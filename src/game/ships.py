@@ -0,0 +1,101 @@
+# OGame Schiffs-Daten (Technologie-IDs wie im Spiel)
+
+SHIP_IDS = {
+    202: 'small_cargo',
+    203: 'large_cargo',
+    204: 'light_fighter',
+    205: 'heavy_fighter',
+    206: 'cruiser',
+    207: 'battleship',
+    208: 'colony_ship',
+    209: 'recycler',
+    210: 'espionage_probe',
+    211: 'bomber',
+    212: 'solar_satellite',
+    213: 'destroyer',
+    214: 'deathstar',
+    215: 'battlecruiser',
+    217: 'crawler',
+    218: 'reaper',
+    219: 'pathfinder'
+}
+
+SHIP_TYPE_IDS = {ship_type: ship_id for ship_id, ship_type in SHIP_IDS.items()}
+
+# Schiffe die nicht fliegen können
+STATIONARY_SHIPS = ['solar_satellite', 'crawler']
+
+# Baukosten (Metall, Kristall, Deuterium) der Schiffe, die der Bot selbst baut
+SHIP_COSTS = {
+    'small_cargo': (2000, 2000, 0),
+    'large_cargo': (6000, 6000, 0),
+    'light_fighter': (3000, 1000, 0),
+    'heavy_fighter': (6000, 4000, 0),
+    'colony_ship': (10000, 20000, 10000),
+    'recycler': (10000, 6000, 2000),
+    'espionage_probe': (0, 1000, 0)
+}
+
+# Voraussetzungen: Raumschiffwerft-Stufe und Forschungen
+SHIP_REQUIREMENTS = {
+    'small_cargo': {'raumschiffwerft': 2, 'combustion_drive': 2},
+    'large_cargo': {'raumschiffwerft': 4, 'combustion_drive': 6},
+    'light_fighter': {'raumschiffwerft': 1, 'combustion_drive': 1},
+    'heavy_fighter': {'raumschiffwerft': 3, 'armour': 2, 'impulse_drive': 2},
+    'colony_ship': {'raumschiffwerft': 4, 'impulse_drive': 3},
+    'recycler': {'raumschiffwerft': 4, 'combustion_drive': 6, 'shielding': 2},
+    'espionage_probe': {'raumschiffwerft': 3, 'combustion_drive': 3, 'espionage': 2}
+}
+
+
+def ship_type_from_id(ship_id):
+    """Schiff-Typ aus Technologie-ID"""
+    try:
+        return SHIP_IDS.get(int(ship_id))
+    except (TypeError, ValueError):
+        return None
+
+
+def ship_type_from_name(name):
+    """Schiff-Typ aus Input-Name oder ID raten (am202, small_cargo, ...)"""
+    if not name:
+        return None
+
+    name = name.lower()
+    if name in SHIP_TYPE_IDS:
+        return name
+
+    # Aktuelle OGame-Inputs heißen am<ID>
+    digits = ''.join(c for c in name if c.isdigit())
+    if digits and ship_type_from_id(digits):
+        return ship_type_from_id(digits)
+
+    if 'colony' in name or 'kolonie' in name:
+        return 'colony_ship'
+    elif 'large' in name or 'grosse' in name:
+        return 'large_cargo'
+    elif 'small' in name or 'kleine' in name or 'cargo' in name:
+        return 'small_cargo'
+    elif 'heavy' in name:
+        return 'heavy_fighter'
+    elif 'light' in name or 'fighter' in name:
+        return 'light_fighter'
+    elif 'probe' in name or 'spionage' in name:
+        return 'espionage_probe'
+    elif 'recycler' in name:
+        return 'recycler'
+
+    return None
+
+
+def ship_cost(ship_type, count=1):
+    """Kosten von count Schiffen"""
+    metal, crystal, deuterium = SHIP_COSTS[ship_type]
+    return {'metal': metal * count, 'crystal': crystal * count, 'deuterium': deuterium * count}
+
+
+def ship_build_time(ship_type, shipyard_level, nanite_level=0, speed=1):
+    """Bauzeit eines Schiffs in Sekunden - wie bei Gebäuden, nur mit der Werft statt der Roboterfabrik"""
+    metal, crystal, _ = SHIP_COSTS[ship_type]
+    hours = (metal + crystal) / (2500 * (1 + shipyard_level) * 2 ** nanite_level * speed)
+    return max(1, int(hours * 3600))
@@ -1,13 +1,15 @@
+import re
 import time
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from src.browser.by import By
+from src.browser.scripts import QUEUE_END_SCRIPT
+from src.core.retry import STEPS
+from src.core.runtime import RUNTIME
+
 
 class BuildingManager:
     def __init__(self, driver, logger):
         self.driver = driver
         self.logger = logger
-        self.wait = WebDriverWait(driver, 10)
         
         # Aufbau-Strategie: Prioritäten der Gebäude
         self.building_priority = {
@@ -41,6 +43,10 @@ class BuildingManager:
             'forschungslabor': 5
         }
         
+        # Ergebnis der letzten Entwicklung (für den Planeten-Zustand)
+        self.last_buildings = {}
+        self.last_target = None
+        
     def navigate_to_buildings(self):
         """Navigate to buildings page"""
         try:
@@ -60,7 +66,7 @@ class BuildingManager:
                     else:
                         element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     element.click()
-                    time.sleep(2)
+                    RUNTIME.pause(2)
                     self.logger.info("Navigated to buildings page")
                     return True
                 except:
@@ -140,25 +146,28 @@ class BuildingManager:
         except:
             return None
             
-    def smart_planet_development(self, resources):
+    def smart_planet_development(self, resources, planet_id=None, on_buildings_page=False):
         """Intelligente Planeten-Entwicklung basierend auf Ressourcen und Strategie"""
-        self.logger.info("🏗️ === SMART PLANET DEVELOPMENT ===")
+        planet_label = f" [{planet_id}]" if planet_id else ""
+        self.logger.info(f"🏗️ === SMART PLANET DEVELOPMENT{planet_label} ===")
         
         try:
             # 1. Prüfe aktuellen Gebäude-Status
             current_buildings = self.get_current_building_levels()
+            self.last_buildings = current_buildings
             
             # 2. Bestimme nächstes zu bauendes Gebäude
             next_building = self.determine_next_building(current_buildings, resources)
+            self.last_target = next_building
             
             if next_building:
-                self.logger.info(f"🎯 Target building: {next_building}")
+                self.logger.info(f"🎯 Target building{planet_label}: {next_building}")
                 
                 # 3. Navigiere zu Gebäuden und baue
-                if self.navigate_to_buildings():
-                    return self.build_specific_building(next_building)
+                if on_buildings_page or self.navigate_to_buildings():
+                    return self.build_specific_building(next_building, planet_id)
                 else:
-                    return self.build_from_overview(next_building)
+                    return self.build_from_overview(next_building, planet_id)
             else:
                 self.logger.info("✅ No immediate building needed")
                 return False
@@ -167,6 +176,34 @@ class BuildingManager:
             self.logger.error(f"❌ Smart development error: {e}")
             return False
 
+    def get_queue_end(self):
+        """Ende der Gebäude-Bauschleife als Unix-Zeit (None = Schleife frei)"""
+        try:
+            info = self.driver.execute_script(QUEUE_END_SCRIPT)
+            
+            if not info:
+                return None
+                
+            end = info.get('end', '')
+            if end.isdigit():
+                return int(end)
+                
+            seconds = self.parse_duration(info.get('text', ''))
+            return time.time() + seconds if seconds else None
+            
+        except Exception as e:
+            self.logger.debug(f"Queue end lookup failed: {e}")
+            return None
+
+    def parse_duration(self, text):
+        """Countdown-Text wie '1h 5m 3s' oder '2T 4Std 10Min' in Sekunden"""
+        units = {'w': 604800, 'd': 86400, 't': 86400, 'h': 3600, 'std': 3600,
+                 'm': 60, 'min': 60, 's': 1, 'sek': 1}
+        total = 0
+        for value, unit in re.findall(r'(\d+)\s*([a-zA-Z]+)', text or ''):
+            total += int(value) * units.get(unit.lower(), 0)
+        return total
+
     def get_current_building_levels(self):
         """Versuche aktuelle Gebäude-Level zu ermitteln"""
         buildings = {}
@@ -224,7 +261,7 @@ class BuildingManager:
         else:
             return 'solarkraftwerk'  # Mehr Energie
             
-    def build_from_overview(self, building_name):
+    def build_from_overview(self, building_name, planet_id=None):
         """Versuche von der Übersichtsseite aus zu bauen"""
         try:
             self.logger.info(f"🔍 Looking for {building_name} on overview page...")
@@ -246,20 +283,20 @@ class BuildingManager:
                     
                     self.logger.info(f"🔨 Found build button for {building_name}")
                     build_button.click()
-                    time.sleep(2)
+                    RUNTIME.pause(2)
                     return True
                     
                 except:
                     continue
                     
             # Fallback: Baue irgendwas verfügbares
-            return self.build_any_available()
+            return self.build_any_available(planet_id)
             
         except Exception as e:
             self.logger.error(f"❌ Build from overview error: {e}")
             return False
 
-    def build_specific_building(self, building_name):
+    def build_specific_building(self, building_name, planet_id=None):
         """Baue ein spezifisches Gebäude"""
         try:
             buildable = self.get_buildable_buildings()
@@ -268,12 +305,12 @@ class BuildingManager:
             for building in buildable:
                 if building_name.lower() in building['name'].lower():
                     self.logger.info(f"🎯 Found target: {building['name']}")
-                    return self.build_building(building)
+                    return self.build_building(building, planet_id)
                     
             # Wenn spezifisches Gebäude nicht verfügbar, baue erstes verfügbares
             if buildable:
                 self.logger.info(f"⚠️ {building_name} not available, building: {buildable[0]['name']}")
-                return self.build_building(buildable[0])
+                return self.build_building(buildable[0], planet_id)
                 
             return False
             
@@ -281,7 +318,7 @@ class BuildingManager:
             self.logger.error(f"❌ Build specific error: {e}")
             return False
 
-    def build_any_available(self):
+    def build_any_available(self, planet_id=None):
         """Baue das erste verfügbare Gebäude"""
         try:
             buildable = self.get_buildable_buildings()
@@ -289,7 +326,7 @@ class BuildingManager:
             if buildable:
                 building = buildable[0]
                 self.logger.info(f"🔨 Building first available: {building['name']}")
-                return self.build_building(building)
+                return self.build_building(building, planet_id)
             else:
                 self.logger.info("ℹ️ No buildings available to build")
                 return False
@@ -298,14 +335,20 @@ class BuildingManager:
             self.logger.error(f"❌ Build any available error: {e}")
             return False
 
-    def build_building(self, building_info):
-        """Baue ein Gebäude basierend auf building_info"""
+    def build_building(self, building_info, planet_id=None):
+        """Baue ein Gebäude basierend auf building_info (Marker pro Planet - andere Planeten dürfen dasselbe bauen)"""
+        step = f"build:{planet_id}:{building_info['name']}" if planet_id else f"build:{building_info['name']}"
+        if STEPS.is_done(step):
+            self.logger.info(f"⏭️ {building_info['name']} was already ordered - not building twice")
+            return False
+            
         try:
             self.logger.info(f"🏗️ Starting construction: {building_info['name']}")
             
-            # Klicke Build-Button
+            # Klicke Build-Button - ab hier kann der Auftrag im Spiel sein
+            STEPS.mark(step, ttl=60)
             building_info['element'].click()
-            time.sleep(2)
+            RUNTIME.pause(2)
             
             # Suche nach Bestätigungs-Button
             confirm_selectors = [
@@ -325,7 +368,7 @@ class BuildingManager:
                         confirm_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
                     confirm_btn.click()
                     self.logger.info(f"✅ Construction confirmed: {building_info['name']}")
-                    time.sleep(3)  # Warte auf Bestätigung
+                    RUNTIME.pause(3)  # Warte auf Bestätigung
                     return True
                 except:
                     continue
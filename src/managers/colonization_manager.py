@@ -1,12 +1,16 @@
-import time
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
+from src.browser.by import By
+from src.core.retry import STEPS
+from src.core.runtime import RUNTIME
+from src.state.planet_registry import PlanetRegistry
+from src.state.ship_inventory import ShipInventory
 
 class ColonizationManager:
-    def __init__(self, driver, logger):
+    def __init__(self, driver, logger, ship_inventory=None, planet_registry=None):
         self.driver = driver
         self.logger = logger
-        self.wait = WebDriverWait(driver, 10)
+        self.ship_inventory = ship_inventory or ShipInventory(driver, logger)
+        self.planet_registry = planet_registry or PlanetRegistry(driver, logger)
+        self.selected_ships = {}  # Zuletzt eingetragene Schiffe (für den Bestand)
         
         # Kolonisierungs-Konfiguration
         self.colonization_config = {
@@ -73,11 +77,7 @@ class ColonizationManager:
     def has_required_ships(self):
         """Prüfe ob erforderliche Schiffe vorhanden sind"""
         try:
-            # Navigiere zur Flotten-Übersicht
-            if not self.navigate_to_fleet_overview():
-                return False
-                
-            # Prüfe verfügbare Schiffe
+            # Bestand kommt aus dem Cache - kein Seitenwechsel nötig
             available_ships = self.get_available_ships()
             required = self.colonization_config['required_ships']
             
@@ -94,60 +94,10 @@ class ColonizationManager:
             self.logger.error(f"❌ Ship check error: {e}")
             return False
 
-    def navigate_to_fleet_overview(self):
-        """Navigiere zur Flotten-Übersicht"""
-        try:
-            fleet_selectors = [
-                "//a[contains(@href, 'fleet')]",
-                "//a[contains(@href, 'component=fleet')]",
-                "#fleet", 
-                ".fleet"
-            ]
-            
-            for selector in fleet_selectors:
-                try:
-                    if selector.startswith("//"):
-                        element = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    element.click()
-                    time.sleep(2)
-                    return True
-                except:
-                    continue
-                    
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"❌ Fleet navigation error: {e}")
-            return False
-
     def get_available_ships(self):
-        """Hole verfügbare Schiffe"""
-        ships = {}
-        
+        """Hole verfügbare Schiffe aus dem Schiffs-Cache"""
         try:
-            # Suche nach Schiff-Eingabefeldern oder Anzeigen
-            ship_selectors = [
-                "input[name*='small']",  # Kleine Transporter
-                "input[name*='large']",  # Große Transporter  
-                "input[name*='light']",  # Leichte Jäger
-                "input[name*='heavy']",  # Schwere Jäger
-                "input[name*='colony']", # Kolonieschiff
-                ".ship-count",
-                "[class*='ship']"
-            ]
-            
-            for selector in ship_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        ship_type, count = self.extract_ship_info(element)
-                        if ship_type and count > 0:
-                            ships[ship_type] = count
-                except:
-                    continue
-                    
+            ships = self.ship_inventory.get_ships()
             self.logger.info(f"🚢 Available ships: {ships}")
             return ships
             
@@ -155,64 +105,10 @@ class ColonizationManager:
             self.logger.error(f"❌ Ship inventory error: {e}")
             return {}
 
-    def extract_ship_info(self, element):
-        """Extrahiere Schiff-Typ und Anzahl aus Element"""
-        try:
-            # Hole verfügbare Anzahl
-            max_attr = element.get_attribute('max')
-            value_attr = element.get_attribute('value')
-            text = element.text
-            
-            count = 0
-            if max_attr and max_attr.isdigit():
-                count = int(max_attr)
-            elif value_attr and value_attr.isdigit():
-                count = int(value_attr)
-            elif text and text.isdigit():
-                count = int(text)
-                
-            # Bestimme Schiff-Typ basierend auf Name/ID
-            name = element.get_attribute('name') or element.get_attribute('id') or ''
-            
-            ship_type = None
-            if 'small' in name.lower() or 'cargo' in name.lower():
-                ship_type = 'small_cargo'
-            elif 'large' in name.lower():
-                ship_type = 'large_cargo'
-            elif 'light' in name.lower() or 'fighter' in name.lower():
-                ship_type = 'light_fighter'
-            elif 'colony' in name.lower():
-                ship_type = 'colony_ship'
-                
-            return ship_type, count
-            
-        except:
-            return None, 0
-
     def count_current_colonies(self):
-        """Zähle aktuelle Kolonien"""
+        """Zähle aktuelle Kolonien (aus der Planeten-Liste)"""
         try:
-            # Suche nach Planeten-Liste oder Dropdown
-            planet_selectors = [
-                ".planet-list .planet",
-                "#planetList option", 
-                ".planet-selector option",
-                "[class*='planet']"
-            ]
-            
-            colony_count = 0
-            
-            for selector in planet_selectors:
-                try:
-                    planets = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if planets:
-                        colony_count = len(planets)
-                        break
-                except:
-                    continue
-                    
-            # Hauptplanet nicht mitzählen
-            colony_count = max(0, colony_count - 1)
+            colony_count = self.planet_registry.count_colonies()
             
             self.logger.info(f"🏛️ Current colonies: {colony_count}")
             return colony_count
@@ -238,7 +134,7 @@ class ColonizationManager:
                     self.navigate_to_system(system_offset)
                     system_targets = self.scan_system_for_free_slots()
                     targets.extend(system_targets)
-                    time.sleep(1)
+                    RUNTIME.pause(1)
                 except:
                     continue
                     
@@ -268,7 +164,7 @@ class ColonizationManager:
                     else:
                         element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     element.click()
-                    time.sleep(3)
+                    RUNTIME.pause(3)
                     return True
                 except:
                     continue
@@ -291,7 +187,7 @@ class ColonizationManager:
             
             submit_btn = self.driver.find_element(By.CSS_SELECTOR, "input[type='submit'], .submit")
             submit_btn.click()
-            time.sleep(2)
+            RUNTIME.pause(2)
             return True
             
         except Exception as e:
@@ -422,10 +318,21 @@ class ColonizationManager:
         """Starte Kolonisierungs-Flotte"""
         self.logger.info(f"🚀 === LAUNCHING COLONIZATION TO {target_coords} ===")
         
+        step = f"colonize:{target_coords}"
+        if STEPS.is_done(step):
+            self.logger.info(f"⏭️ Colonization to {target_coords} was already sent - not launching twice")
+            return False
+            
         try:
-            # Navigiere zur Flotte
-            if not self.navigate_to_fleet_overview():
+            # Flotten-Seite des Heimatplaneten direkt per URL
+            planet_id = self.planet_registry.active_planet_id()
+            if planet_id is None:
+                planet_id, _ = self.ship_inventory.current_planet()
+            if planet_id is None:
+                self.logger.warning("⚠️ No home planet for colonization")
                 return False
+            self.driver.get(self.planet_registry.planet_url(planet_id, 'fleetdispatch'))
+            self.planet_registry.set_active(planet_id)
                 
             # Wähle Schiffe für Kolonisierung
             if not self.select_colonization_ships():
@@ -439,8 +346,19 @@ class ColonizationManager:
             if not self.select_colonization_mission():
                 return False
                 
-            # Bestätige Start
-            return self.confirm_colonization_launch()
+            # Bestätige Start - ab hier kann die Flotte unterwegs sein
+            STEPS.mark(step, ttl=600)
+            if not self.confirm_colonization_launch():
+                STEPS.clear(step)
+                return False
+                
+            # Bestand mit den tatsächlich eingetragenen Schiffen fortschreiben
+            self.ship_inventory.record_launch(self.selected_ships, target_coords, mission='colonize',
+                                              planet_id=planet_id)
+            
+            # Planeten-Liste nach Ankunft neu lesen
+            self.planet_registry.expect_new_planet(target_coords)
+            return True
             
         except Exception as e:
             self.logger.error(f"❌ Colonization launch error: {e}")
@@ -448,6 +366,8 @@ class ColonizationManager:
 
     def select_colonization_ships(self):
         """Wähle Schiffe für Kolonisierung"""
+        self.selected_ships = {}
+        
         try:
             required = self.colonization_config['required_ships']
             
@@ -455,17 +375,20 @@ class ColonizationManager:
             colony_ship_input = self.driver.find_element(By.CSS_SELECTOR, "input[name*='colony']")
             colony_ship_input.clear()
             colony_ship_input.send_keys("1")
+            self.selected_ships['colony_ship'] = 1
             
             # Transporter für Ressourcen
             cargo_input = self.driver.find_element(By.CSS_SELECTOR, "input[name*='small']")
             cargo_input.clear()
             cargo_input.send_keys(str(required['small_cargo']))
+            self.selected_ships['small_cargo'] = required['small_cargo']
             
             # Jäger für Schutz
             try:
                 fighter_input = self.driver.find_element(By.CSS_SELECTOR, "input[name*='light']")
                 fighter_input.clear()
                 fighter_input.send_keys(str(required['light_fighter']))
+                self.selected_ships['light_fighter'] = required['light_fighter']
             except:
                 pass  # Jäger optional
                 
@@ -539,12 +462,18 @@ class ColonizationManager:
             for selector in confirm_selectors:
                 try:
                     confirm_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    confirm_btn.click()
-                    self.logger.info("🏛️ Colonization fleet launched!")
-                    return True
-                except:
+                except Exception:
                     continue
                     
+                # Genau ein Versand-Versuch (siehe FleetManager.confirm_and_launch_fleet)
+                try:
+                    confirm_btn.click()
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Colonization dispatch failed: {e}")
+                    return False
+                self.logger.info("🏛️ Colonization fleet launched!")
+                return True
+                    
             return False
             
         except Exception as e:
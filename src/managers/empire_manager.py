@@ -0,0 +1,227 @@
+import time
+from config.planet_config import PlanetDevelopmentConfig
+from src.browser.scripts import FETCH_SCRIPT
+from src.game.ships import SHIP_TYPE_IDS
+from src.parsers.empire_parser import EMPIRE_PAGE_URL, parse_empire_html
+
+
+class EmpireManager:
+    """
+    Entwickelt alle eigenen Planeten im Wechsel.
+
+    Jeder Planet hat eigenen Zustand, Bau-Plan und Cooldown im EmpireState.
+    Planeten mit belegter Bauschleife werden bis zum Ende der Schleife
+    übersprungen - pro Planet nur ein cp=-Wechsel und wenige Lesezugriffe.
+    """
+
+    def __init__(self, driver, logger, planet_registry, empire_state, building_manager, resource_manager,
+                 ship_inventory=None):
+        self.driver = driver
+        self.logger = logger
+        self.planet_registry = planet_registry
+        self.empire_state = empire_state
+        self.building_manager = building_manager
+        self.resource_manager = resource_manager
+        self.ship_inventory = ship_inventory
+
+        self.config = {
+            'max_planets_per_cycle': 0,  # 0 = alle bereiten Planeten
+            'build_component': 'supplies',
+            'idle_cooldown': PlanetDevelopmentConfig.BUILD_CHECK_INTERVAL,
+            'queue_grace': 5,  # Sekunden Puffer nach Bauende
+            'overview_max_age': 300,  # Imperium-Übersicht höchstens alle 5 Min laden
+            'script_timeout': 20
+        }
+
+        self.overview_loaded_at = None
+        self.next_index = 0  # Round-Robin Startpunkt
+
+    def develop_all_planets(self):
+        """Ein Durchgang über alle Planeten - None wenn keine Planeten-Liste"""
+        planet_ids = self.planet_registry.planet_ids()
+
+        if not planet_ids:
+            return None
+
+        self.empire_state.forget(planet_ids)
+        
+        # Ein Abruf für Ressourcen/Gebäude aller Planeten
+        overview_fresh = self.ensure_empire_overview()
+
+        home_id = self.planet_registry.active_planet_id()
+        switched = False
+        built = 0
+        visited = 0
+        limit = self.config['max_planets_per_cycle'] or len(planet_ids)
+        now = time.time()
+
+        self.logger.info(f"🪐 === EMPIRE DEVELOPMENT ({len(planet_ids)} planets) ===")
+
+        for planet_id in self.rotation(planet_ids):
+            if visited >= limit:
+                break
+
+            if not self.empire_state.is_ready(planet_id, now):
+                wait = int(self.empire_state.ready_at(planet_id) - now)
+                self.logger.info(f"⏭️ {self.planet_label(planet_id)} busy for {wait//60}m {wait%60}s")
+                continue
+
+            # Ohne Seitenwechsel aussortieren wenn die Übersicht zu wenig Ressourcen zeigt
+            if overview_fresh and not self.can_afford_anything(planet_id):
+                self.logger.info(f"💰 {self.planet_label(planet_id)}: not enough resources to build")
+                self.empire_state.set_cooldown(planet_id, self.config['idle_cooldown'])
+                continue
+
+            if not self.switch_to_planet(planet_id):
+                continue
+
+            switched = True
+            visited += 1
+
+            if self.develop_planet(planet_id):
+                built += 1
+
+        # Zurück zum Ausgangsplaneten (Raids/Kolonisierung starten dort)
+        if switched and home_id:
+            self.switch_to_planet(home_id, component='overview')
+
+        self.logger.info(f"🪐 Empire development: {built} constructions on {visited} planets")
+        return built
+
+    def ensure_empire_overview(self):
+        """Übersicht laden wenn sie zu alt ist"""
+        if self.overview_loaded_at and time.time() - self.overview_loaded_at < self.config['overview_max_age']:
+            return True
+        return self.load_empire_overview()
+
+    def load_empire_overview(self):
+        """Ressourcen, Produktion, Gebäude, Schiffe und Verteidigung aller Planeten in einem Abruf"""
+        return self.apply_empire_overview(self.fetch_empire_overview())
+
+    def fetch_empire_overview(self):
+        """Imperium-Seite im Hintergrund holen (Browser)"""
+        try:
+            self.driver.set_script_timeout(self.config['script_timeout'])
+            return self.driver.execute_async_script(FETCH_SCRIPT, EMPIRE_PAGE_URL)
+        except Exception as e:
+            self.logger.debug(f"Empire overview fetch failed: {e}")
+            return None
+
+    def apply_empire_overview(self, html):
+        """Imperium-Seite parsen und in den Planeten-Zustand übernehmen (kein Browser)"""
+        return self.apply_planets(self.parse_empire_overview(html))
+
+    def parse_empire_overview(self, html):
+        """Nur parsen - ändert keinen Zustand, darf parallel zu Browser-Jobs laufen"""
+        return parse_empire_html(html)
+
+    def apply_planets(self, planets):
+        """Geparste Planeten in Planeten-Zustand und Schiffs-Cache übernehmen"""
+        if not planets:
+            self.logger.info("ℹ️ Empire overview not available - reading planets one by one")
+            return False
+
+        for planet_id, planet in planets.items():
+            self.empire_state.update(
+                planet_id,
+                resources=planet['resources'],
+                production=planet['production'],
+                buildings=planet['buildings'],
+                ships=planet['ships'],
+                defense=planet['defense']
+            )
+            
+            if self.ship_inventory:
+                self.ship_inventory.update_from_read({
+                    'planet_id': planet_id,
+                    'coordinates': planet['coordinates'],
+                    'ships': {str(SHIP_TYPE_IDS[ship]): str(count) for ship, count in planet['ships'].items()}
+                })
+
+        self.overview_loaded_at = time.time()
+        self.logger.info(f"📊 Empire overview loaded for {len(planets)} planets")
+        return True
+
+    def can_afford_anything(self, planet_id):
+        """Mindest-Ressourcen laut Planeten-Zustand vorhanden?"""
+        resources = self.empire_state.get(planet_id)['resources']
+        if not resources:
+            return True  # Unbekannt - nachsehen
+        metal = int(resources.get('metal', '0') or '0')
+        crystal = int(resources.get('crystal', '0') or '0')
+        return metal >= PlanetDevelopmentConfig.MIN_METAL_TO_BUILD or crystal >= PlanetDevelopmentConfig.MIN_CRYSTAL_TO_BUILD
+
+    def rotation(self, planet_ids):
+        """Planeten ab dem Round-Robin Startpunkt"""
+        start = self.next_index % len(planet_ids)
+        self.next_index = start + 1
+        return planet_ids[start:] + planet_ids[:start]
+
+    def switch_to_planet(self, planet_id, component=None):
+        """Günstiger Planeten-Wechsel per cp= direkt auf die Zielseite"""
+        try:
+            url = self.planet_registry.planet_url(planet_id, component or self.config['build_component'])
+            self.driver.get(url)
+            self.planet_registry.set_active(planet_id)
+            return True
+
+        except Exception as e:
+            self.logger.error(f"❌ Planet switch error ({planet_id}): {e}")
+            return False
+
+    def develop_planet(self, planet_id):
+        """Baue auf dem aktuell ausgewählten Planeten"""
+        label = self.planet_label(planet_id)
+
+        try:
+            resources = self.resource_manager.get_resources()
+            self.empire_state.update(planet_id, resources=resources)
+
+            # Bauschleife belegt? Dann erst nach Bauende wiederkommen
+            queue_end = self.building_manager.get_queue_end()
+            if queue_end:
+                self.empire_state.set_queue_end(planet_id, queue_end + self.config['queue_grace'])
+                self.logger.info(f"⏳ {label}: construction queue busy")
+                return False
+
+            self.empire_state.set_queue_end(planet_id, None)
+
+            metal = int(resources.get('metal', '0') or '0')
+            crystal = int(resources.get('crystal', '0') or '0')
+            if metal < PlanetDevelopmentConfig.MIN_METAL_TO_BUILD and crystal < PlanetDevelopmentConfig.MIN_CRYSTAL_TO_BUILD:
+                self.logger.info(f"💰 {label}: not enough resources to build")
+                self.empire_state.set_cooldown(planet_id, self.config['idle_cooldown'])
+                return False
+
+            success = self.building_manager.smart_planet_development(
+                resources, planet_id=planet_id, on_buildings_page=True)
+
+            self.empire_state.update(
+                planet_id,
+                buildings=self.building_manager.last_buildings,
+                plan=[self.building_manager.last_target] if self.building_manager.last_target else []
+            )
+
+            if success:
+                queue_end = self.building_manager.get_queue_end()
+                if queue_end:
+                    self.empire_state.set_queue_end(planet_id, queue_end + self.config['queue_grace'])
+                else:
+                    self.empire_state.set_cooldown(planet_id, self.config['idle_cooldown'])
+                self.logger.info(f"✅ {label}: construction started")
+            else:
+                self.empire_state.set_cooldown(planet_id, self.config['idle_cooldown'])
+
+            return success
+
+        except Exception as e:
+            self.logger.error(f"❌ Planet development error ({label}): {e}")
+            self.empire_state.set_cooldown(planet_id, self.config['idle_cooldown'])
+            return False
+
+    def planet_label(self, planet_id):
+        """Lesbarer Name für Logs"""
+        planet = self.planet_registry.planets.get(planet_id)
+        if planet:
+            return f"{planet['name']} [{planet['coordinates']}]"
+        return str(planet_id)
@@ -1,14 +1,26 @@
 import time
 import random
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from src.browser.by import By
+from src.browser.scripts import FETCH_SCRIPT
+from src.core.retry import STEPS
+from src.core.runtime import RUNTIME
+from src.core.metrics import RAIDS_LAUNCHED, SCAN_SYSTEMS, record_scan_pass
+from src.game.ships import SHIP_TYPE_IDS, ship_type_from_name
+from src.parsers.espionage_parser import MESSAGES_PAGE_URL, parse_espionage_reports
+from src.state.ship_inventory import ShipInventory
 
 class FleetManager:
-    def __init__(self, driver, logger):
+    def __init__(self, driver, logger, ship_inventory=None):
         self.driver = driver
         self.logger = logger
-        self.wait = WebDriverWait(driver, 10)
+        self.ship_inventory = ship_inventory or ShipInventory(driver, logger)
+        self.selected_ships = {}
+        self.available_ships = {}  # Bestand bei der letzten Raid-Prüfung (ohne Browser nutzbar)
+        self.scan_cache = {}  # Koordinaten -> gefundenes Raid-Ziel (mit scanned_at)
+        self.checkpoint = None  # CheckpointStore - Scan-Ergebnisse überleben einen Neustart
+        self.espionage = {}  # Koordinaten -> Spionage-Daten (ships, defense, research, resources)
+        self.combat = None  # CombatSimulator, erst bei Bedarf (braucht numpy)
+        self.espionage_checked_at = 0  # Letzter Blick in die Spionageberichte
         
         # Raid-Konfiguration
         self.raid_config = {
@@ -17,6 +29,16 @@ class FleetManager:
             'preferred_targets': ['inactive', 'weak', 'vacation'],
             'avoid_targets': ['strong', 'alliance', 'admin'],
             'resource_threshold': 10000,  # Min Ressourcen für lohnenswerten Raid
+            'plunder_ratio': 0.5,  # Anteil der Ressourcen, den ein Raid mitnimmt
+            'scan_cache_max_age': 1800,  # Gefundene Ziele 30 Min ohne neuen Scan nutzen
+            'raid_ship_count': 5,  # Schiffe pro Raid
+            'raid_ship_types': ['small_cargo', 'light_fighter'],  # Raid-Schiffe in dieser Reihenfolge bevorzugt
+            'min_win_probability': 0.9,  # Ausspionierte Ziele nur bei sicherem Sieg angreifen
+            'combat_runs': 200,  # Monte-Carlo-Kämpfe pro ausspioniertem Ziel
+            'espionage_max_age': 3600,  # Ältere Spionage-Daten nicht mehr verwenden
+            'espionage_read_interval': 600,  # Nachrichten höchstens so oft nach Berichten durchsehen
+            'script_timeout': 15,
+            'research': {}  # Eigene Forschung für den Kampf: weapons, shielding, armour
         }
         
         # Kolonisierungs-Ziele
@@ -44,7 +66,7 @@ class FleetManager:
                     else:
                         element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     element.click()
-                    time.sleep(3)
+                    RUNTIME.pause(3)
                     self.logger.info("🌌 Navigated to galaxy view")
                     return True
                 except:
@@ -62,31 +84,191 @@ class FleetManager:
         self.logger.info("🔍 === SCANNING FOR RAID TARGETS ===")
         
         try:
+            cached = self.cached_targets()
+            if cached:
+                self.logger.info(f"🗂️ Using {len(cached)} cached raid targets")
+                return self.rank_targets(cached)
+                
             if not self.navigate_to_galaxy():
                 return []
                 
             targets = []
+            offsets = self.scan_offsets()
+            scanned = SCAN_SYSTEMS.get(result='ok')
             
             # Scanne mehrere Systeme
-            for system_offset in range(-5, 6):  # 10 Systeme scannen
-                try:
-                    self.navigate_to_system(system_offset)
-                    system_targets = self.analyze_system_for_targets()
-                    targets.extend(system_targets)
-                    time.sleep(2)  # Kurze Pause zwischen Systemen
-                except:
-                    continue
+            for system_offset in offsets:
+                targets.extend(self.scan_system(system_offset))
+                RUNTIME.pause(2)  # Kurze Pause zwischen Systemen
                     
-            # Sortiere Ziele nach Attraktivität
-            targets.sort(key=lambda x: x.get('score', 0), reverse=True)
-            
-            self.logger.info(f"🎯 Found {len(targets)} potential raid targets")
-            return targets[:10]  # Top 10 Ziele
+            record_scan_pass(SCAN_SYSTEMS.get(result='ok') - scanned, len(offsets), len(targets))
+            self.remember_targets(targets)
+            return self.rank_targets(targets)
             
         except Exception as e:
             self.logger.error(f"❌ Raid scan error: {e}")
             return []
 
+    def scan_offsets(self):
+        """System-Offsets für den Scan"""
+        return range(-5, 6)  # 10 Systeme scannen
+
+    def scan_system(self, system_offset, ensure_galaxy=False):
+        """Ein System scannen (einzelner Schritt)"""
+        try:
+            if ensure_galaxy and not self.driver.find_elements(By.CSS_SELECTOR, "input[name='system'], #system, .system-input"):
+                # Andere Aufgabe hat die Seite gewechselt
+                if not self.navigate_to_galaxy():
+                    return []
+                    
+            self.navigate_to_system(system_offset)
+            targets = self.analyze_system_for_targets()
+            SCAN_SYSTEMS.inc(result='ok')
+            return targets
+        except:
+            SCAN_SYSTEMS.inc(result='failed')
+            return []
+
+    def remember_targets(self, targets):
+        """Scan-Ergebnisse merken (und in den Checkpoint schreiben)"""
+        now = time.time()
+        for target in targets:
+            entry = dict(target, scanned_at=now)
+            self.scan_cache[target['coordinates']] = entry
+            if self.checkpoint:
+                self.checkpoint.put('scan', target['coordinates'], entry)
+
+    def cached_targets(self):
+        """Noch frische Ziele aus früheren Scans"""
+        oldest = time.time() - self.raid_config['scan_cache_max_age']
+        for coords in [c for c, t in self.scan_cache.items() if t['scanned_at'] < oldest]:
+            self.forget_target(coords)
+        return [dict(target) for target in self.scan_cache.values()]
+
+    def forget_target(self, coords):
+        """Ziel aus dem Cache nehmen (veraltet oder gerade geplündert)"""
+        if self.scan_cache.pop(coords, None) and self.checkpoint:
+            self.checkpoint.delete('scan', coords)
+
+    def restore(self, checkpoint):
+        """Scan-Ergebnisse aus dem Checkpoint übernehmen"""
+        self.checkpoint = checkpoint
+        self.scan_cache.update(checkpoint.load('scan'))
+        return len(self.cached_targets())
+
+    def rank_targets(self, targets):
+        """Sortiere Ziele nach Attraktivität - ausspionierte Ziele per Kampf-Simulation"""
+        targets.sort(key=lambda x: x.get('score', 0), reverse=True)
+        
+        self.logger.info(f"🎯 Found {len(targets)} potential raid targets")
+        return self.assess_targets(targets[:10])  # Top 10 Ziele
+
+    def record_espionage(self, coords, report):
+        """Spionage-Daten eines Ziels merken (ships/defense/research/resources)"""
+        self.espionage[coords] = dict(report, read_at=report.get('read_at') or time.time())
+
+    def espionage_due(self):
+        return time.time() - self.espionage_checked_at >= self.raid_config['espionage_read_interval']
+
+    def fetch_espionage_reports(self):
+        """Spionage-Reiter der Nachrichten im Hintergrund holen (Browser)"""
+        self.espionage_checked_at = time.time()
+        try:
+            self.driver.set_script_timeout(self.raid_config['script_timeout'])
+            return self.driver.execute_async_script(FETCH_SCRIPT, MESSAGES_PAGE_URL)
+        except Exception as e:
+            self.logger.debug(f"Espionage report fetch failed: {e}")
+            return None
+
+    def parse_espionage_messages(self, html):
+        """Nachrichten-Seite -> {Koordinaten: Bericht} (ohne Browser)"""
+        return parse_espionage_reports(html)
+
+    def record_reports(self, reports):
+        """Neue Berichte übernehmen - ältere als die bekannten werden ignoriert"""
+        fresh = 0
+        for coords, report in reports.items():
+            known = self.espionage.get(coords)
+            # Ohne Zeitstempel nur beim ersten Mal - sonst würde ein alter Bericht nie veralten
+            if known and (not report.get('read_at') or report['read_at'] <= known['read_at']):
+                continue
+            self.record_espionage(coords, report)
+            fresh += 1
+        if fresh:
+            self.logger.info(f"🕵️ {fresh} new espionage reports")
+        return fresh
+
+    def read_espionage_reports(self):
+        """Berichte lesen und merken, wenn die letzte Durchsicht lange genug her ist"""
+        if not self.espionage_due():
+            return 0
+        return self.record_reports(self.parse_espionage_messages(self.fetch_espionage_reports()))
+
+    def assess_targets(self, targets):
+        """Ausspionierte Ziele simulieren: unsichere verwerfen, nach erwartetem Gewinn sortieren"""
+        simulator = self.combat_simulator()
+        if simulator is None:
+            return targets
+            
+        fleet = self.planned_raid_fleet()
+        max_age = self.raid_config['espionage_max_age']
+        safe = []
+        
+        for target in targets:
+            report = self.espionage.get(target['coordinates'])
+            if not report or time.time() - report['read_at'] > max_age:
+                safe.append(target)
+                continue
+            if 'ships' not in report or 'defense' not in report:
+                # Zu wenige Sonden - ohne Flotte/Verteidigung wäre die Simulation zu optimistisch
+                safe.append(target)
+                continue
+                
+            try:
+                prediction = simulator.predict(fleet, report, self.raid_config['research'],
+                                               runs=self.raid_config['combat_runs'])
+            except Exception as e:
+                self.logger.debug(f"Combat simulation for {target['coordinates']} failed: {e}")
+                safe.append(target)
+                continue
+                
+            target['combat'] = prediction
+            if prediction['win_probability'] < self.raid_config['min_win_probability']:
+                self.logger.info(f"🛡️ Skipping {target['coordinates']}: win chance "
+                                 f"{prediction['win_probability']:.0%}, expected losses {prediction['attacker_losses']}")
+                continue
+            safe.append(target)
+            
+        # Simulierte Ziele nach erwartetem Gewinn, die übrigen dahinter wie bisher
+        safe.sort(key=lambda t: t['combat']['expected_profit'] if 'combat' in t else float('-inf'), reverse=True)
+        if safe and targets and safe[0] is not targets[0]:
+            self.logger.info(f"⚔️ Combat simulation picked {safe[0]['coordinates']} over {targets[0]['coordinates']}")
+        return safe
+
+    def combat_simulator(self):
+        """Kampf-Simulator erst laden wenn es Spionage-Daten gibt"""
+        if self.combat is None and self.espionage:
+            try:
+                from src.game.combat import CombatSimulator
+                self.combat = CombatSimulator(self.logger, runs=self.raid_config['combat_runs'])
+            except ImportError as e:
+                self.logger.warning(f"⚠️ Combat simulator not available: {e}")
+                self.combat = False
+        return self.combat or None
+
+    def raid_ship_type(self):
+        """Ein Raid-Schiffstyp, von dem laut letzter Raid-Prüfung genug da ist (None = keiner)"""
+        needed = max(self.raid_config['raid_ship_count'], self.raid_config['min_ships_for_raid'])
+        for ship_type in self.raid_config['raid_ship_types']:
+            if self.available_ships.get(ship_type, 0) >= needed:
+                return ship_type
+        return None
+
+    def planned_raid_fleet(self):
+        """Schiffe, die select_ships_for_raid schicken würde (laut letzter Raid-Prüfung)"""
+        ship_type = self.raid_ship_type() or self.raid_config['raid_ship_types'][0]
+        return {ship_type: self.raid_config['raid_ship_count']}
+
     def navigate_to_system(self, offset=0):
         """Navigiere zu einem anderen System"""
         try:
@@ -109,7 +291,7 @@ class FleetManager:
                     # Submit oder Enter drücken
                     submit_btn = self.driver.find_element(By.CSS_SELECTOR, "input[type='submit'], .submit")
                     submit_btn.click()
-                    time.sleep(2)
+                    RUNTIME.pause(2)
                     return True
                 except:
                     continue
@@ -139,6 +321,8 @@ class FleetManager:
                     
                     for row in rows:
                         target_info = self.analyze_planet_row(row)
+                        # Lazy formatiert - kostet bei abgeschaltetem Debug fast nichts
+                        self.logger.debug("Galaxy row %s: %s", selector, target_info)
                         if target_info and self.is_good_raid_target(target_info):
                             targets.append(target_info)
                             
@@ -289,10 +473,21 @@ class FleetManager:
             
         return target_info['score'] > 40
 
-    def launch_raid(self, target_coords, ship_count):
-        """Starte einen Raid auf ein Ziel"""
+    def expected_loot(self, target):
+        """Geschätzte Beute eines Ziels"""
+        if 'combat' in target:
+            return target['combat']['expected_loot']
+        return int(target.get('estimated_resources', 0) * self.raid_config['plunder_ratio'])
+
+    def launch_raid(self, target_coords, ship_count, loot=0):
+        """Starte einen Raid auf ein Ziel (loot = erwartete Beute für die Statistik)"""
         self.logger.info(f"🚀 === LAUNCHING RAID TO {target_coords} ===")
         
+        step = f"raid:{target_coords}"
+        if STEPS.is_done(step):
+            self.logger.info(f"⏭️ Raid to {target_coords} was already sent - not launching twice")
+            return False
+            
         try:
             # Navigiere zur Flotten-Seite
             if not self.navigate_to_fleet():
@@ -310,8 +505,20 @@ class FleetManager:
             if not self.select_mission_type('attack'):
                 return False
                 
-            # Bestätige und starte
-            return self.confirm_and_launch_fleet()
+            # Bestätige und starte - ab hier kann die Flotte unterwegs sein
+            STEPS.mark(step, ttl=600)
+            if not self.confirm_and_launch_fleet():
+                STEPS.clear(step)
+                return False
+                
+            # Bestand lokal fortschreiben statt neu zu lesen
+            if self.selected_ships:
+                self.ship_inventory.record_launch(self.selected_ships, target_coords, mission='attack', loot=loot)
+            else:
+                self.ship_inventory.mark_suspect(reason="unknown ship type launched")
+            self.forget_target(target_coords)
+            RAIDS_LAUNCHED.inc()
+            return True
             
         except Exception as e:
             self.logger.error(f"❌ Raid launch error: {e}")
@@ -335,7 +542,7 @@ class FleetManager:
                     else:
                         element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     element.click()
-                    time.sleep(2)
+                    RUNTIME.pause(2)
                     self.logger.info("🚀 Navigated to fleet page")
                     return True
                 except:
@@ -349,20 +556,32 @@ class FleetManager:
 
     def select_ships_for_raid(self, ship_count):
         """Wähle Schiffe für den Raid aus"""
+        self.selected_ships = {}
+        
         try:
-            # Suche nach kleinen Transportern (beste Raid-Schiffe)
-            ship_selectors = [
-                "input[name*='small']",  # Kleine Transporter
-                "input[name*='light']",  # Light Fighter
-                ".ship-small",
-                "[class*='transport']"
-            ]
+            # Derselbe Typ wie bei Raid-Prüfung und Simulation - ohne Cache wie bisher der erste passende
+            ship_type = self.raid_ship_type()
+            if ship_type:
+                ship_id = SHIP_TYPE_IDS[ship_type]
+                ship_selectors = [f"input[name^='am{ship_id}']", f"#am{ship_id}",
+                                  f"input[name*='{ship_type.split('_')[0]}']"]
+            else:
+                ship_selectors = [
+                    "input[name*='small']",  # Kleine Transporter
+                    "input[name*='light']",  # Light Fighter
+                    ".ship-small",
+                    "[class*='transport']"
+                ]
             
             for selector in ship_selectors:
                 try:
                     ship_input = self.driver.find_element(By.CSS_SELECTOR, selector)
                     ship_input.clear()
                     ship_input.send_keys(str(ship_count))
+                    
+                    ship_type = ship_type_from_name(ship_input.get_attribute('name') or selector)
+                    if ship_type:
+                        self.selected_ships = {ship_type: ship_count}
                     self.logger.info(f"✅ Selected {ship_count} ships for raid")
                     return True
                 except:
@@ -437,18 +656,24 @@ class FleetManager:
             for selector in confirm_selectors:
                 try:
                     confirm_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                    # SICHERHEITS-CHECK: Bestätige nur bei geringer Schiffanzahl
-                    if self.safety_check_before_launch():
-                        confirm_btn.click()
-                        self.logger.info("🚀 Fleet launched successfully!")
-                        return True
-                    else:
-                        self.logger.warning("⚠️ Safety check failed - fleet not launched")
-                        return False
-                except:
+                except Exception:
                     continue
                     
+                # SICHERHEITS-CHECK: Bestätige nur bei geringer Schiffanzahl
+                if not self.safety_check_before_launch():
+                    self.logger.warning("⚠️ Safety check failed - fleet not launched")
+                    return False
+                    
+                # Genau ein Versand-Versuch - ein abgelehnter Klick wird nicht über
+                # den nächsten Selektor (oft derselbe Button) noch einmal geschickt
+                try:
+                    confirm_btn.click()
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Fleet dispatch failed: {e}")
+                    return False
+                self.logger.info("🚀 Fleet launched successfully!")
+                return True
+                    
             return False
             
         except Exception as e:
@@ -474,11 +699,28 @@ class FleetManager:
         except:
             return True  # Bei Unsicherheit eher erlauben
 
-    def auto_raid_cycle(self):
+    def has_raid_ships(self):
+        """Genug Raid-Schiffe laut Schiffs-Cache?"""
+        try:
+            self.available_ships = self.ship_inventory.get_ships()
+            return self.raid_ship_type() is not None
+        except Exception as e:
+            self.logger.debug(f"Raid ship check failed: {e}")
+            return True  # Bei Unsicherheit trotzdem versuchen
+
+    def auto_raid_cycle(self, wait_after_launch=True):
         """Vollautomatischer Raid-Zyklus"""
         self.logger.info("🏴‍☠️ === AUTO RAID CYCLE ===")
         
         try:
+            # 0. Schiffe prüfen bevor die Galaxie gescannt wird (aus dem Cache)
+            if not self.has_raid_ships():
+                self.logger.info("🚢 Not enough raid ships available")
+                return False
+                
+            # Neue Spionageberichte für die Kampf-Simulation
+            self.read_espionage_reports()
+                
             # 1. Scanne nach Zielen
             targets = self.scan_for_raid_targets()
             
@@ -491,12 +733,14 @@ class FleetManager:
             self.logger.info(f"🎯 Best target: {best_target['coordinates']} (Score: {best_target['score']})")
             
             # 3. Starte Raid mit kleiner Flotte (sicher)
-            success = self.launch_raid(best_target['coordinates'], 5)
+            success = self.launch_raid(best_target['coordinates'], self.raid_config['raid_ship_count'],
+                                       loot=self.expected_loot(best_target))
             
             if success:
                 self.logger.info("✅ Raid launched successfully!")
-                # Warte bevor nächster Raid
-                time.sleep(300)  # 5 Minuten warten
+                # Warte bevor nächster Raid (Scheduler plant selbst)
+                if wait_after_launch:
+                    RUNTIME.wait(300)  # 5 Minuten warten (Stop oder neue Arbeit beendet sofort)
                 return True
             else:
                 self.logger.warning("❌ Raid launch failed")
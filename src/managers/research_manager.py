@@ -0,0 +1,332 @@
+import re
+import time
+from urllib.parse import urljoin
+from src.browser.by import By
+from src.browser.scripts import RESEARCH_READ_SCRIPT
+from src.core.retry import STEPS
+from src.core.runtime import RUNTIME
+from src.game.research import (RESEARCH_REQUIREMENTS, RESEARCH_TYPE_IDS, max_planets, research_cost,
+                               research_time, research_type_from_id)
+
+RESEARCH_PAGE_URL = "index.php?page=ingame&component=research"
+
+
+class ResearchManager:
+    """
+    Forschung für den ganzen Account.
+
+    Alle Stufen kommen mit einem Bulk-Read der Forschungs-Seite und werden
+    zusammen mit dem Ende der Forschungs-Schleife gecacht. Solange das Labor
+    beschäftigt ist, wird die Seite nicht gelesen - der Job wacht genau zum
+    Forschungsende wieder auf.
+    """
+
+    def __init__(self, driver, logger, planet_registry, empire_state):
+        self.driver = driver
+        self.logger = logger
+        self.planet_registry = planet_registry
+        self.empire_state = empire_state
+
+        self.config = {
+            # Ziel-Stufen in Reihenfolge - fehlende Voraussetzungen werden vorgezogen
+            'plan': [
+                ('energy', 1),
+                ('combustion_drive', 2),  # Kleine Transporter für Raids
+                ('espionage', 2),
+                ('computer', 1),
+                ('impulse_drive', 3),  # Kolonieschiff
+                ('espionage', 4),
+                ('astrophysics', 1),  # Erste Kolonie
+                ('combustion_drive', 6),  # Schnellere Raids
+                ('weapons', 3),
+                ('shielding', 2),
+                ('armour', 3),
+                ('astrophysics', 3),
+                ('computer', 4),  # Mehr gleichzeitige Flotten
+                ('energy', 5),
+                ('shielding', 5),
+                ('hyperspace', 3),
+                ('astrophysics', 5),
+                ('impulse_drive', 6),
+                ('weapons', 6),
+                ('shielding', 6),
+                ('armour', 6),
+                ('hyperspace_drive', 4),
+                ('astrophysics', 7)
+            ],
+            'speed': 1,  # Forschungs-Geschwindigkeit des Universums
+            'queue_grace': 5,  # Sekunden Puffer nach Forschungsende
+            'idle_cooldown': 1800,  # Nichts zu forschen / Start fehlgeschlagen
+            'unavailable_cooldown': 3600,  # Forschungs-Seite nicht lesbar
+            'max_wait': 6 * 3600,  # Höchstens so lange auf Ressourcen warten
+            'script_timeout': 15
+        }
+
+        self.levels = {}  # Forschung -> Stufe
+        self.queue_end = None  # Ende der Forschungs-Schleife (Unix-Zeit)
+        self.active = None  # Laufende Forschung
+        self.read_at = None
+        self.last_plan = None
+        self.checkpoint = None  # CheckpointStore - jede Änderung wird sofort mitgeschrieben
+
+    # === LESEN ===
+
+    def refresh(self):
+        """Alle Stufen und die Forschungs-Schleife mit einem Aufruf lesen"""
+        data = self.run_script(RESEARCH_READ_SCRIPT, RESEARCH_PAGE_URL)
+
+        if not data or data.get('error') or not data.get('found'):
+            self.logger.warning("⚠️ Could not read research levels")
+            return False
+
+        return self.update_from_read(data)
+
+    def update_from_read(self, data):
+        """Übernimm das Ergebnis eines Bulk-Reads"""
+        levels = {}
+        for key, value in (data.get('levels') or {}).items():
+            research = research_type_from_id(key)
+            if research:
+                levels[research] = int(value) if str(value).isdigit() else 0
+
+        self.levels = levels
+        self.active = research_type_from_id(data.get('active'))
+        self.queue_end = self.parse_queue_end(data)
+        self.read_at = time.time()
+        self.save()
+
+        self.logger.info(f"🔬 Research levels: {levels}")
+        return True
+
+    def parse_queue_end(self, data):
+        """Ende der Forschungs-Schleife aus data-end oder Countdown-Text"""
+        end = str(data.get('end') or '')
+        if end.isdigit():
+            return int(end)
+
+        seconds = self.parse_duration(data.get('text', ''))
+        return time.time() + seconds if seconds else None
+
+    def parse_duration(self, text):
+        """Countdown-Text wie '1h 5m 3s' oder '2T 4Std 10Min' in Sekunden"""
+        units = {'w': 604800, 'd': 86400, 't': 86400, 'h': 3600, 'std': 3600,
+                 'm': 60, 'min': 60, 's': 1, 'sek': 1}
+        total = 0
+        for value, unit in re.findall(r'(\d+)\s*([a-zA-Z]+)', text or ''):
+            total += int(value) * units.get(unit.lower(), 0)
+        return total
+
+    def run_script(self, script, url):
+        """Führe Async-Script aus und fange Fehler ab"""
+        try:
+            self.driver.set_script_timeout(self.config['script_timeout'])
+            return self.driver.execute_async_script(script, url)
+        except Exception as e:
+            self.logger.debug(f"Research script failed: {e}")
+            return None
+
+    def level(self, research):
+        return self.levels.get(research, 0)
+
+    def combat_levels(self):
+        """Waffen, Schilde und Panzerung für die Kampf-Simulation"""
+        return {research: self.level(research) for research in ('weapons', 'shielding', 'armour')}
+
+    # === LABOR ===
+
+    def lab_planet(self):
+        """Planet mit dem höchsten Forschungslabor (None = Stufen unbekannt)"""
+        best = None
+        for planet_id in self.planet_registry.planet_ids():
+            lab = self.empire_state.get(planet_id)['buildings'].get('forschungslabor')
+            if lab is not None and (best is None or int(lab) > best[1]):
+                best = (planet_id, int(lab))
+        return best
+
+    def lab_level(self):
+        lab = self.lab_planet()
+        return lab[1] if lab else None
+
+    # === PLANUNG ===
+
+    def plan_next(self):
+        """Nächste Forschung laut Plan - mit Kosten und Dauer"""
+        lab = self.lab_level()
+        targets = list(self.config['plan'])
+
+        # Kolonisierung läuft und alle Planeten-Slots sind belegt: Astrophysik vorziehen
+        astrophysics = self.level('astrophysics')
+        if astrophysics and self.planet_registry.count_planets() >= max_planets(astrophysics):
+            targets.insert(0, ('astrophysics', astrophysics + 1))
+
+        for research, wanted in targets:
+            if self.level(research) >= wanted:
+                continue
+            step = self.next_step(research, lab)
+            if step:
+                level = self.level(step) + 1
+                cost = research_cost(step, level)
+                return {
+                    'research': step,
+                    'level': level,
+                    'cost': cost,
+                    'duration': research_time(cost, lab or 0, self.config['speed'])
+                }
+        return None
+
+    def next_step(self, research, lab):
+        """Forschung selbst oder ihre erste fehlende Voraussetzung (None = Labor zu klein)"""
+        for required, level in RESEARCH_REQUIREMENTS[research].items():
+            if required == 'forschungslabor':
+                if lab is not None and lab < level:
+                    return None
+            elif self.level(required) < level:
+                return self.next_step(required, lab)
+        return research
+
+    def time_until_affordable(self, planet_id, cost):
+        """Sekunden bis cost auf dem Labor-Planeten bezahlbar ist (None = unbekannt)"""
+        state = self.empire_state.get(planet_id)
+        wait = 0
+        for resource, amount in cost.items():
+            missing = amount - int(state['resources'].get(resource, 0) or 0)
+            if missing <= 0:
+                continue
+            per_hour = int(state['production'].get(resource, 0) or 0)
+            if per_hour <= 0:
+                return None
+            wait = max(wait, missing / per_hour * 3600)
+        return wait
+
+    # === FORSCHEN ===
+
+    def research_cycle(self):
+        """Labor belegen - gibt die Sekunden bis zum nächsten Versuch zurück"""
+        now = time.time()
+        if self.queue_end and self.queue_end > now:
+            # Gecachtes Forschungsende - kein Lesezugriff nötig
+            return self.queue_end - now + self.config['queue_grace']
+
+        if not self.refresh():
+            return self.config['unavailable_cooldown']
+
+        if self.queue_end and self.queue_end > now:
+            wait = int(self.queue_end - now)
+            self.logger.info(f"⏳ Lab busy with {self.active or 'research'} for {wait//60}m {wait%60}s")
+            return wait + self.config['queue_grace']
+
+        plan = self.plan_next()
+        self.last_plan = plan
+        if not plan:
+            self.logger.info("✅ No research needed right now")
+            return self.config['idle_cooldown']
+
+        lab = self.lab_planet()
+        planet_id = lab[0] if lab else self.planet_registry.active_planet_id()
+        label = f"{plan['research']} {plan['level']}"
+
+        wait = self.time_until_affordable(planet_id, plan['cost']) if planet_id else 0
+        if wait is None:
+            self.logger.info(f"💰 Research {label}: production unknown, checking later")
+            return self.config['idle_cooldown']
+        if wait > 0:
+            self.logger.info(f"💾 Research {label} affordable in ~{int(wait)//60} minutes")
+            return max(60, min(wait, self.config['max_wait']))
+
+        if self.start_research(plan, planet_id):
+            return self.queue_end - time.time() + self.config['queue_grace']
+        return self.config['idle_cooldown']
+
+    def start_research(self, plan, planet_id=None):
+        """Forschung auf der Forschungs-Seite des Labor-Planeten starten"""
+        research = plan['research']
+        tech_id = RESEARCH_TYPE_IDS[research]
+
+        step = f"research:{research}:{plan['level']}"
+        if STEPS.is_done(step):
+            self.logger.info(f"⏭️ {research} {plan['level']} was already started - not starting twice")
+            return False
+
+        try:
+            self.logger.info(f"🔬 Starting research: {research} {plan['level']}")
+            if planet_id:
+                self.driver.get(self.planet_registry.planet_url(planet_id, 'research'))
+                self.planet_registry.set_active(planet_id)
+            else:
+                self.driver.get(urljoin(self.driver.current_url, RESEARCH_PAGE_URL))
+
+            upgrade_selectors = [
+                f"[data-technology='{tech_id}'] button.upgrade",
+                f"[data-technology='{tech_id}'] .upgrade",
+                f"[data-technology='{tech_id}'] .fastBuild",
+                f"//li[@data-technology='{tech_id}']//a[contains(@class, 'build')]"
+            ]
+
+            # Ab dem Klick kann die Forschung laufen
+            STEPS.mark(step, ttl=600)
+            for selector in upgrade_selectors:
+                try:
+                    if selector.startswith("//"):
+                        button = self.driver.find_element(By.XPATH, selector)
+                    else:
+                        button = self.driver.find_element(By.CSS_SELECTOR, selector)
+                    button.click()
+                    break
+                except Exception:
+                    continue
+            else:
+                STEPS.clear(step)
+                self.logger.warning(f"⚠️ No research button for {research}")
+                return False
+
+            RUNTIME.pause(2)
+
+            # Forschungsende von der Seite - sonst aus der Formel
+            data = self.run_script(RESEARCH_READ_SCRIPT, None) or {}
+            queue_end = self.parse_queue_end(data)
+            self.queue_end = queue_end or time.time() + plan['duration']
+            self.active = research
+
+            if planet_id:
+                self.pay(planet_id, plan['cost'])
+            self.save()
+
+            wait = int(self.queue_end - time.time())
+            self.logger.info(f"✅ Research started: {research} {plan['level']} (ready in {wait//60}m {wait%60}s)")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"❌ Research start error: {e}")
+            return False
+
+    def pay(self, planet_id, cost):
+        """Kosten lokal vom Planeten-Zustand abziehen"""
+        resources = self.empire_state.get(planet_id)['resources']
+        self.empire_state.update(planet_id, resources={
+            resource: max(0, int(resources.get(resource, 0) or 0) - amount)
+            for resource, amount in cost.items()
+        })
+
+    # === CHECKPOINT ===
+
+    def restore(self, checkpoint):
+        """Stufen und Forschungsende aus dem Checkpoint übernehmen"""
+        self.checkpoint = checkpoint
+        saved = checkpoint.load('research').get('state')
+        if not saved:
+            return 0
+        self.levels = saved.get('levels', {})
+        self.queue_end = saved.get('queue_end')
+        self.active = saved.get('active')
+        self.read_at = saved.get('read_at')
+        return len(self.levels)
+
+    def save(self):
+        """Forschungs-Stand in den Checkpoint schreiben"""
+        if self.checkpoint:
+            self.checkpoint.put('research', 'state', {
+                'levels': self.levels,
+                'queue_end': self.queue_end,
+                'active': self.active,
+                'read_at': self.read_at
+            })
@@ -1,4 +1,4 @@
-from selenium.webdriver.common.by import By
+from src.browser.by import By
 import time
 
 class ResourceManager:
@@ -0,0 +1,274 @@
+import time
+from src.browser.by import By
+from src.core.retry import STEPS
+from src.core.runtime import RUNTIME
+from src.game.research import max_planets
+from src.game.ships import SHIP_REQUIREMENTS, SHIP_TYPE_IDS, ship_build_time, ship_cost
+
+
+class ShipyardManager:
+    """
+    Baut die Schiffe, die Raids und Kolonisierung brauchen.
+
+    Der Bedarf kommt aus dem Raid-Plan und den Kolonisierungs-Vorgaben, der
+    Bestand aus dem Schiffs-Cache (Bulk-Read der Flotten-Seite). Pro Planet
+    wird der ganze Fehlbestand in einem Werft-Auftrag bestellt; die
+    Fertigstellung landet als Werft-Auftrag im Schiffs-Cache, so dass der
+    Scheduler zum Bauende aufwacht.
+    """
+
+    def __init__(self, driver, logger, planet_registry, empire_state, ship_inventory, fleet_manager,
+                 colonization_manager, research_manager=None):
+        self.driver = driver
+        self.logger = logger
+        self.planet_registry = planet_registry
+        self.empire_state = empire_state
+        self.ship_inventory = ship_inventory
+        self.fleet_manager = fleet_manager
+        self.colonization_manager = colonization_manager
+        self.research_manager = research_manager
+
+        self.config = {
+            'raid_fleets': 2,  # So viele Raid-Flotten sollen gleichzeitig möglich sein
+            'raid_ship_type': 'small_cargo',
+            # Reihenfolge beim Bezahlen wenn nicht alles auf einmal reicht
+            'priority': ['colony_ship', 'small_cargo', 'light_fighter', 'large_cargo', 'espionage_probe'],
+            'speed': 1,  # Werft-Geschwindigkeit des Universums
+            'idle_cooldown': 1800,  # Nichts zu bauen / Auftrag fehlgeschlagen
+            'max_wait': 6 * 3600  # Höchstens so lange auf Ressourcen warten
+        }
+
+        self.last_orders = {}  # planet_id -> zuletzt bestellter Auftrag
+
+    # === BEDARF ===
+
+    def home_planet(self):
+        """Planet, von dem Raids und Kolonisierung starten"""
+        planet_id = self.planet_registry.active_planet_id()
+        if planet_id is None:
+            planet_id, _ = self.ship_inventory.current_planet()
+        return planet_id
+
+    def colonization_planned(self):
+        """Freier Planeten-Slot laut Astrophysik?"""
+        research = self.research_manager
+        if not research or not research.levels:
+            return False
+        return self.planet_registry.count_planets() < max_planets(research.level('astrophysics'))
+
+    def required_ships(self):
+        """Soll-Bestand pro Planet aus Raid-Plan und Kolonisierung"""
+        home = self.home_planet()
+        if home is None:
+            return {}
+
+        need = {self.config['raid_ship_type']:
+                self.fleet_manager.raid_config['raid_ship_count'] * self.config['raid_fleets']}
+
+        if self.colonization_planned():
+            for ship_type, count in self.colonization_manager.colonization_config['required_ships'].items():
+                need[ship_type] = need.get(ship_type, 0) + count
+
+        return {home: need}
+
+    def incoming_ships(self, planet_id):
+        """Schiffe in der Werft und auf dem Rückflug zu einem Planeten"""
+        incoming = {}
+        for order in self.ship_inventory.shipyard_orders:
+            if order['planet_id'] == planet_id:
+                incoming[order['ship_type']] = incoming.get(order['ship_type'], 0) + order['count']
+        for flight in self.ship_inventory.flights:
+            if flight['planet_id'] == planet_id:
+                for ship_type, count in flight['ships'].items():
+                    incoming[ship_type] = incoming.get(ship_type, 0) + count
+        return incoming
+
+    def missing_ships(self, planet_id, need):
+        """Fehlbestand = Soll - vorhanden - unterwegs/in Bau"""
+        have = self.ship_inventory.get_ships(planet_id)
+        incoming = self.incoming_ships(planet_id)
+
+        missing = {}
+        for ship_type, count in need.items():
+            short = count - have.get(ship_type, 0) - incoming.get(ship_type, 0)
+            if short > 0:
+                missing[ship_type] = short
+        return missing
+
+    def can_build(self, planet_id, ship_type):
+        """Werft-Stufe und Forschung reichen? (unbekannt = ja)"""
+        buildings = self.empire_state.get(planet_id)['buildings']
+        research = self.research_manager.levels if self.research_manager else {}
+
+        for required, level in SHIP_REQUIREMENTS.get(ship_type, {}).items():
+            if required == 'raumschiffwerft':
+                current = buildings.get(required)
+            else:
+                current = research.get(required) if research else None
+            if current is not None and int(current) < level:
+                return False
+        return ship_type in SHIP_REQUIREMENTS
+
+    # === PLANUNG ===
+
+    def plan_batch(self, planet_id, missing):
+        """Bezahlbarer Teil des Fehlbestands und Wartezeit für den Rest (None = unbekannt)"""
+        resources = self.empire_state.get(planet_id)['resources']
+        budget = {resource: int(resources.get(resource, 0) or 0) for resource in ('metal', 'crystal', 'deuterium')}
+        known = bool(resources)
+
+        batch = {}
+        for ship_type in sorted(missing, key=self.priority):
+            unit = ship_cost(ship_type)
+            affordable = missing[ship_type]
+            if known:
+                affordable = min([affordable] + [budget[r] // amount for r, amount in unit.items() if amount])
+            if affordable <= 0:
+                continue
+            batch[ship_type] = affordable
+            for resource, amount in unit.items():
+                budget[resource] -= amount * affordable
+
+        rest = {ship_type: count - batch.get(ship_type, 0) for ship_type, count in missing.items()}
+        rest = {ship_type: count for ship_type, count in rest.items() if count > 0}
+        wait = self.time_until_affordable(planet_id, rest) if rest and not batch else 0
+        return batch, wait
+
+    def priority(self, ship_type):
+        order = self.config['priority']
+        return order.index(ship_type) if ship_type in order else len(order)
+
+    def time_until_affordable(self, planet_id, ships):
+        """Sekunden bis der erste fehlende Schiffs-Typ bezahlbar ist (None = unbekannt)"""
+        state = self.empire_state.get(planet_id)
+        ship_type = min(ships, key=self.priority)
+        wait = 0
+        for resource, amount in ship_cost(ship_type).items():
+            missing = amount - int(state['resources'].get(resource, 0) or 0)
+            if missing <= 0:
+                continue
+            per_hour = int(state['production'].get(resource, 0) or 0)
+            if per_hour <= 0:
+                return None
+            wait = max(wait, missing / per_hour * 3600)
+        return wait
+
+    # === BAUEN ===
+
+    def shipyard_cycle(self):
+        """Fehlende Schiffe bestellen - gibt die Sekunden bis zum nächsten Versuch zurück"""
+        waits = []
+
+        for planet_id, need in self.required_ships().items():
+            missing = self.missing_ships(planet_id, need)
+            for ship_type in [s for s in missing if not self.can_build(planet_id, s)]:
+                self.logger.debug(f"{ship_type} not buildable yet on {planet_id}")
+                del missing[ship_type]
+
+            if not missing:
+                continue
+
+            batch, wait = self.plan_batch(planet_id, missing)
+            if batch:
+                self.submit_order(planet_id, batch)
+            elif wait is not None:
+                self.logger.info(f"💾 Shipyard order on {planet_id} affordable in ~{int(wait)//60} minutes: {missing}")
+                waits.append(wait)
+
+        completes = [o['completes_at'] for o in self.ship_inventory.shipyard_orders]
+        if completes:
+            return max(60, min(completes) - time.time() + 5)
+        if waits:
+            return max(60, min(min(waits), self.config['max_wait']))
+        return self.config['idle_cooldown']
+
+    def submit_order(self, planet_id, batch):
+        """Ein Werft-Auftrag mit allen Schiffs-Typen des Planeten"""
+        step = f"shipyard:{planet_id}"
+        if STEPS.is_done(step):
+            self.logger.info(f"⏭️ Shipyard order on {planet_id} was already submitted - not ordering twice")
+            return False
+
+        try:
+            self.logger.info(f"🏭 Shipyard order on {planet_id}: {batch}")
+            self.driver.get(self.planet_registry.planet_url(planet_id, 'shipyard'))
+            self.planet_registry.set_active(planet_id)
+
+            filled = {}
+            for ship_type, count in batch.items():
+                ship_id = SHIP_TYPE_IDS[ship_type]
+                for selector in [f"input[name='am{ship_id}']", f"#am{ship_id}",
+                                 f"[data-technology='{ship_id}'] input"]:
+                    try:
+                        amount_input = self.driver.find_element(By.CSS_SELECTOR, selector)
+                        amount_input.clear()
+                        amount_input.send_keys(str(count))
+                        filled[ship_type] = count
+                        break
+                    except Exception:
+                        continue
+
+            if not filled:
+                self.logger.warning(f"⚠️ No shipyard inputs on {planet_id}")
+                return False
+
+            submit_selectors = [
+                "input[type='submit']",
+                "button.upgrade",
+                ".build-it",
+                "//input[@value='Bauen']",
+                "//button[contains(text(), 'Bauen')]"
+            ]
+
+            # Ab dem Klick kann der Auftrag in der Werft sein
+            STEPS.mark(step, ttl=300)
+            for selector in submit_selectors:
+                try:
+                    if selector.startswith("//"):
+                        button = self.driver.find_element(By.XPATH, selector)
+                    else:
+                        button = self.driver.find_element(By.CSS_SELECTOR, selector)
+                    button.click()
+                    break
+                except Exception:
+                    continue
+            else:
+                STEPS.clear(step)
+                self.logger.warning(f"⚠️ No shipyard submit button on {planet_id}")
+                return False
+
+            RUNTIME.pause(2)
+            self.record_order(planet_id, filled)
+            return True
+
+        except Exception as e:
+            self.logger.error(f"❌ Shipyard order error ({planet_id}): {e}")
+            return False
+
+    def record_order(self, planet_id, ships):
+        """Fertigstellung je Typ nacheinander vormerken und Kosten abziehen"""
+        buildings = self.empire_state.get(planet_id)['buildings']
+        shipyard = int(buildings.get('raumschiffwerft') or 1)
+        nanites = int(buildings.get('nanofabrik') or 0)
+
+        # Die Werft arbeitet Aufträge nacheinander ab
+        queued = [o['completes_at'] for o in self.ship_inventory.shipyard_orders if o['planet_id'] == planet_id]
+        completes_at = max([time.time()] + queued)
+
+        resources = self.empire_state.get(planet_id)['resources']
+        spent = {'metal': 0, 'crystal': 0, 'deuterium': 0}
+
+        for ship_type in sorted(ships, key=self.priority):
+            count = ships[ship_type]
+            completes_at += count * ship_build_time(ship_type, shipyard, nanites, self.config['speed'])
+            self.ship_inventory.record_shipyard_order(ship_type, count, completes_at, planet_id=planet_id)
+            for resource, amount in ship_cost(ship_type, count).items():
+                spent[resource] += amount
+
+        self.empire_state.update(planet_id, resources={
+            resource: max(0, int(resources.get(resource, 0) or 0) - amount) for resource, amount in spent.items()
+        })
+        self.last_orders[planet_id] = dict(ships)
+
+        wait = int(completes_at - time.time())
+        self.logger.info(f"✅ Shipyard order placed on {planet_id}: {ships} (done in {wait//60}m {wait%60}s)")
@@ -0,0 +1 @@
+# OGame Bot Parsers Module
@@ -0,0 +1,144 @@
+# Parser für die Imperium-Übersicht (alle Planeten in einer Antwort)
+
+import json
+import re
+
+from src.game.buildings import building_name_from_id
+from src.game.defense import defense_type_from_id
+from src.game.ships import ship_type_from_id
+
+EMPIRE_PAGE_URL = "index.php?page=standalone&component=empire"
+
+RESOURCES = ['metal', 'crystal', 'deuterium', 'energy']
+
+
+def extract_empire_json(html):
+    """Hole das JSON-Objekt aus dem createImperiumHtml(...)-Aufruf"""
+    if not html:
+        return None
+
+    start = html.find('createImperiumHtml(')
+    if start == -1:
+        # Daten-Endpunkt liefert das JSON direkt
+        try:
+            data = json.loads(html)
+            return data if isinstance(data, dict) else None
+        except ValueError:
+            return None
+
+    brace = html.find('{', start)
+    if brace == -1:
+        return None
+
+    try:
+        data, _ = json.JSONDecoder().raw_decode(html[brace:])
+        return data
+    except ValueError:
+        return None
+
+
+def parse_empire_html(html):
+    """Imperium-Seite -> {planet_id: {resources, production, buildings, ships, defense, ...}}"""
+    data = extract_empire_json(html)
+    if not data:
+        return {}
+
+    planets = data.get('planets', [])
+    if isinstance(planets, dict):
+        planets = list(planets.values())
+
+    result = {}
+    for planet in planets:
+        parsed = parse_empire_planet(planet)
+        if parsed:
+            result[parsed['id']] = parsed
+
+    return result
+
+
+def parse_empire_planet(planet):
+    """Ein Planet aus dem Imperium-JSON"""
+    if not isinstance(planet, dict) or not planet.get('id'):
+        return None
+
+    parsed = {
+        'id': str(planet['id']),
+        'name': planet.get('name'),
+        'coordinates': clean_coordinates(planet.get('coordinates')),
+        'type': planet.get('type'),
+        'fields_used': to_int(planet.get('fieldUsed')),
+        'fields_max': to_int(planet.get('fieldMax')),
+        'resources': {},
+        'production': {},
+        'buildings': {},
+        'ships': {},
+        'defense': {}
+    }
+
+    for resource in RESOURCES:
+        if resource in planet:
+            parsed['resources'][resource] = str(to_int(planet[resource]))
+
+    parsed['production'] = parse_production(planet)
+
+    # Technologien stehen unter ihrer numerischen ID
+    for key, value in planet.items():
+        if not str(key).isdigit():
+            continue
+
+        level = to_int(value)
+        building = building_name_from_id(key)
+        ship = ship_type_from_id(key)
+        defense = defense_type_from_id(key)
+
+        if building:
+            parsed['buildings'][building] = level
+        elif ship:
+            parsed['ships'][ship] = level
+        elif defense:
+            parsed['defense'][defense] = level
+
+    return parsed
+
+
+def parse_production(planet):
+    """Stündliche Produktion - verschiedene Formate je nach Spielversion"""
+    production = {}
+
+    hourly = None
+    if isinstance(planet.get('production'), dict):
+        hourly = planet['production'].get('hourly')
+
+    if isinstance(hourly, list):
+        for resource, value in zip(RESOURCES, hourly):
+            production[resource] = str(to_int(value))
+        return production
+
+    for resource in RESOURCES:
+        for key in (f"{resource}Production", f"{resource}_production", f"production_{resource}"):
+            if key in planet:
+                production[resource] = str(to_int(planet[key]))
+                break
+
+    return production
+
+
+def to_int(value):
+    """Zahl aus JSON-Wert oder formatiertem Text"""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        cleaned = ''.join(c for c in value if c.isdigit() or c == '-')
+        try:
+            return int(cleaned) if cleaned else 0
+        except ValueError:
+            return 0
+    return 0
+
+
+def clean_coordinates(text):
+    """[1:2:3] -> 1:2:3"""
+    match = re.search(r'(\d+):(\d+):(\d+)', str(text or ''))
+    return f"{match.group(1)}:{match.group(2)}:{match.group(3)}" if match else None
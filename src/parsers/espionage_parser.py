@@ -0,0 +1,119 @@
+# Parser für Spionageberichte aus der Nachrichten-Seite (Reiter Spionage)
+
+import html as html_lib
+import json
+import re
+
+from src.game.defense import defense_type_from_id
+from src.game.research import research_type_from_id
+from src.game.ships import ship_type_from_id
+from src.parsers.empire_parser import clean_coordinates, to_int
+
+MESSAGES_PAGE_URL = "index.php?page=ingame&component=messages&tabid=20"
+
+# Abschnitt des Berichts -> (data-raw-Attribut, Name aus Technologie-ID)
+SECTIONS = {
+    'ships': ('data-raw-fleet', ship_type_from_id),
+    'defense': ('data-raw-defense', defense_type_from_id),
+    'research': ('data-raw-research', research_type_from_id)
+}
+
+# Ressourcen im Text, falls data-raw-resources fehlt
+RESOURCE_LABELS = {
+    'metal': r'(?:Metall|Metal)',
+    'crystal': r'(?:Kristall|Crystal)',
+    'deuterium': r'Deuterium'
+}
+
+REPORT_TITLES = re.compile(r'Spionagebericht|Espionage report', re.IGNORECASE)
+
+
+def split_messages(html):
+    """Nachrichten-Seite -> HTML je <li class="msg ...">"""
+    starts = [m.start() for m in re.finditer(r'<li[^>]*class="[^"]*\bmsg\b', html)]
+    return [html[start:end] for start, end in zip(starts, starts[1:] + [len(html)])]
+
+
+def raw_attribute(block, name):
+    """JSON aus einem data-raw-*-Attribut (None wenn es fehlt oder nicht lesbar ist)"""
+    match = re.search(rf'{name}=(["\'])(.*?)\1', block, re.DOTALL)
+    if not match:
+        return None
+    try:
+        return json.loads(html_lib.unescape(match.group(2)))
+    except ValueError:
+        return None
+
+
+def parse_section(block, attribute, name_from_id):
+    """{Technologie-ID: Anzahl} -> {Name: Anzahl}; None wenn die Sonden den Abschnitt nicht gesehen haben"""
+    data = raw_attribute(block, attribute)
+    if not isinstance(data, dict):
+        return None
+
+    section = {}
+    for key, value in data.items():
+        name = name_from_id(key)
+        if name:
+            section[name] = to_int(value)
+    return section
+
+
+def parse_resources(block, text):
+    """Ressourcen aus data-raw-resources oder dem Berichtstext"""
+    data = raw_attribute(block, 'data-raw-resources')
+    if isinstance(data, dict):
+        return {resource: to_int(data.get(resource)) for resource in RESOURCE_LABELS}
+
+    resources = {}
+    for resource, label in RESOURCE_LABELS.items():
+        match = re.search(rf'{label}\s*:?\s*([\d.,]+)', text)
+        if match:
+            resources[resource] = to_int(match.group(1))
+    return resources or None
+
+
+def parse_espionage_report(block):
+    """Eine Nachricht -> Bericht {coordinates, read_at, resources, ships, defense, research} oder None"""
+    text = ' '.join(html_lib.unescape(re.sub(r'<[^>]+>', ' ', block)).split())
+    coords_match = re.search(r'data-raw-coordinates="([^"]+)"', block)
+    if not coords_match and not REPORT_TITLES.search(text):
+        return None
+
+    coordinates = clean_coordinates(coords_match.group(1) if coords_match else text)
+    if not coordinates:
+        return None
+
+    time_match = re.search(r'data-(?:raw-timestamp|time)="(\d+)"', block)
+    report = {
+        'coordinates': coordinates,
+        'read_at': int(time_match.group(1)) if time_match else None
+    }
+
+    resources = parse_resources(block, text)
+    if resources is not None:
+        report['resources'] = resources
+
+    # Nicht gesehene Abschnitte fehlen ganz - leer heißt "keine Einheiten"
+    for section, (attribute, name_from_id) in SECTIONS.items():
+        parsed = parse_section(block, attribute, name_from_id)
+        if parsed is not None:
+            report[section] = parsed
+
+    return report
+
+
+def parse_espionage_reports(html):
+    """Nachrichten-Seite -> {Koordinaten: neuester Bericht}"""
+    if not html:
+        return {}
+
+    reports = {}
+    for block in split_messages(html):
+        report = parse_espionage_report(block)
+        if not report:
+            continue
+        known = reports.get(report['coordinates'])
+        if known is None or (report['read_at'] or 0) > (known['read_at'] or 0):
+            reports[report['coordinates']] = report
+    return reports
@@ -0,0 +1,165 @@
+# lxml-Gegenstücke zu den Lese-Scripts der Manager (für den HTTP-Treiber)
+
+import re
+
+import lxml.html
+
+
+def parse_document(html):
+    """HTML -> lxml-Dokument (None bei leerer Antwort)"""
+    if not html or not html.strip():
+        return None
+    return lxml.html.document_fromstring(html)
+
+
+def meta_content(doc, name):
+    """Inhalt eines <meta name=...>-Tags"""
+    found = doc.xpath(f"//meta[@name='{name}']/@content")
+    return found[0] if found else None
+
+
+def text_of(element):
+    return element.text_content() if element is not None else ''
+
+
+def first(element, selector):
+    """Erstes Element zum CSS-Selektor oder None"""
+    found = element.cssselect(selector)
+    return found[0] if found else None
+
+
+def visible_text(element):
+    """Text wie element.text in Selenium (ohne Script/Style, Leerraum zusammengefasst)"""
+    parts = []
+
+    def walk(node):
+        if not isinstance(node.tag, str) or node.tag in ('script', 'style', 'noscript'):
+            return
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    walk(element)
+    return ' '.join(' '.join(parts).split())
+
+
+def select_elements(root, by, value):
+    """Elemente zu einem Selenium-Locator (By.*) im Baum suchen"""
+    if by == "css selector":
+        return root.cssselect(value)
+    if by == "xpath":
+        return [e for e in root.xpath(value) if hasattr(e, 'tag') and isinstance(e.tag, str)]
+    if by == "id":
+        return root.xpath('.//*[@id=$v]', v=value)
+    if by == "name":
+        return root.xpath('.//*[@name=$v]', v=value)
+    if by == "class name":
+        return root.xpath(".//*[contains(concat(' ', normalize-space(@class), ' '), concat(' ', $v, ' '))]", v=value)
+    if by == "tag name":
+        return list(root.iterdescendants(value))
+    if by == "link text":
+        return [a for a in root.iterdescendants('a') if a.text_content().strip() == value]
+    if by == "partial link text":
+        return [a for a in root.iterdescendants('a') if value in a.text_content()]
+    raise ValueError(f"Unsupported locator: {by}")
+
+
+def digits(text):
+    return re.sub(r'[^0-9]', '', text or '')
+
+
+def read_current_planet(doc):
+    """Wie CURRENT_PLANET_SCRIPT"""
+    return {
+        'planet_id': meta_content(doc, 'ogame-planet-id'),
+        'coordinates': meta_content(doc, 'ogame-planet-coordinates')
+    }
+
+
+def read_ships(doc):
+    """Wie BULK_READ_SCRIPT: Schiffs-Anzahlen aus [data-technology] und am<ID>-Feldern"""
+    out = read_current_planet(doc)
+    out.update({'ships': {}, 'found': False})
+
+    for el in doc.cssselect("[data-technology]"):
+        amount = first(el, '.amount')
+        if amount is None:
+            continue
+        value = amount.get('data-value') or amount.text_content() or ''
+        out['ships'][el.get('data-technology')] = digits(value)
+        out['found'] = True
+
+    for el in doc.cssselect("input[name^='am'], input[name*='ship']"):
+        key = el.get('name') or el.get('id') or ''
+        value = el.get('max') or el.get('data-max') or ''
+        if key and value and key not in out['ships']:
+            out['ships'][key] = digits(value)
+            out['found'] = True
+
+    return out
+
+
+def read_event_rows(doc):
+    """Wie EVENT_LIST_SCRIPT: Flottenbewegungen der Ereignisliste"""
+    rows = []
+    for row in doc.cssselect("tr.eventFleet"):
+        rows.append({
+            'id': row.get('id') or '',
+            'mission': row.get('data-mission-type') or '',
+            'return_flight': row.get('data-return-flight') == 'true',
+            'arrival': row.get('data-arrival-time') or '',
+            'origin': text_of(first(row, '.coordsOrigin')),
+            'destination': text_of(first(row, '.destCoords'))
+        })
+    return {'rows': rows}
+
+
+def read_planet_list(doc):
+    """Wie PLANET_LIST_SCRIPT: Planeten-Liste der Seitenleiste"""
+    planets = []
+    for el in doc.cssselect("#planetList .smallplanet"):
+        link = first(el, 'a.planetlink')
+        moon = first(el, 'a.moonlink')
+        planets.append({
+            'id': (el.get('id') or '').replace('planet-', ''),
+            'name': text_of(first(el, '.planet-name')).strip(),
+            'coordinates': text_of(first(el, '.planet-koords')).strip(),
+            'title': (link.get('data-tooltip-title') or link.get('title') or '') if link is not None else '',
+            'active': 'hightlightPlanet' in (el.get('class') or ''),
+            'moon_href': (moon.get('href') or '') if moon is not None else '',
+            'moon_title': (moon.get('data-tooltip-title') or moon.get('title') or '') if moon is not None else ''
+        })
+    return planets
+
+
+def read_queue_end(doc):
+    """Wie QUEUE_END_SCRIPT: Ende der Gebäude-Bauschleife"""
+    el = first(doc, '#productionboxbuildingcomponent [data-end], .buildingCountdown, #buildingCountdown')
+    if el is None:
+        return None
+    return {'end': el.get('data-end') or '', 'text': el.text_content() or ''}
+
+
+def read_research(doc):
+    """Wie RESEARCH_READ_SCRIPT: Forschungs-Stufen und Ende der Forschungs-Schleife"""
+    out = {'levels': {}, 'active': None, 'end': '', 'text': '', 'found': False}
+
+    for el in doc.cssselect("[data-technology]"):
+        level = first(el, '.level')
+        if level is None:
+            continue
+        value = level.get('data-value') or level.text_content() or ''
+        out['levels'][el.get('data-technology')] = digits(value)
+        if el.get('data-status') == 'active':
+            out['active'] = el.get('data-technology')
+        out['found'] = True
+
+    queue = first(doc, '#productionboxresearchcomponent [data-end], .researchCountdown, #researchCountdown')
+    if queue is not None:
+        out['end'] = queue.get('data-end') or ''
+        out['text'] = queue.text_content() or ''
+
+    return out
@@ -0,0 +1 @@
+# OGame Bot Simulator Module
@@ -0,0 +1,365 @@
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+
+from config.planet_config import PlanetDevelopmentConfig
+from src.game.buildings import BUILDING_NAME_IDS
+from src.simulator.universe import BUILDING_COSTS, RESOURCES
+
+project_root = Path(__file__).resolve().parent.parent.parent
+
+PHASES = ['early', 'mid', 'late']
+STORAGE = {'metal': 'metallspeicher', 'crystal': 'kristallspeicher', 'deuterium': 'deuteriumtank'}
+REQUIREMENTS = {
+    'nanofabrik': {'roboterfabrik': 10},  # Computertechnik 10 wird nicht simuliert
+    'raumschiffwerft': {'roboterfabrik': 2}
+}
+START_RESOURCES = (500, 500, 0)  # Neuer Account
+
+
+class StrategyBatch:
+    """
+    Viele Bau-Strategien als Arrays (eine Zeile pro Variante).
+
+    Entspricht den Stellschrauben der PlanetDevelopmentConfig: Reihenfolge
+    (kleiner = wichtiger), Ziel-Level pro Phase, Energie-Schwelle und die
+    Level-Summen, ab denen Mid- bzw. Late-Game beginnt.
+    """
+
+    def __init__(self, buildings, rank, targets, energy_threshold, phase_levels):
+        self.buildings = list(buildings)
+        self.rank = rank  # (S, B)
+        self.targets = targets  # (S, Phase, B)
+        self.energy_threshold = energy_threshold  # (S,)
+        self.phase_levels = phase_levels  # (S, 2)
+
+    def __len__(self):
+        return len(self.rank)
+
+    @classmethod
+    def from_config(cls, config=PlanetDevelopmentConfig):
+        """Die aktuelle Konfiguration als einzelne Strategie"""
+        priority = config.BUILDING_PRIORITY
+        buildings = [name for name in sorted(priority, key=priority.get)
+                     if BUILDING_NAME_IDS.get(name) in BUILDING_COSTS]
+        return cls(
+            buildings,
+            np.array([[priority[name] for name in buildings]], dtype=float),
+            np.array([[[config.get_target_for_phase(phase).get(name, 0) for name in buildings]
+                       for phase in PHASES]]),
+            np.array([config.RESOURCE_RATIOS['energy_threshold']], dtype=float),
+            np.array([config.PHASE_LEVELS])
+        )
+
+    def variants(self, count, seed=1, target_spread=3, priority_noise=1.5, phase_spread=20):
+        """Strategie 0 (unverändert) plus count-1 zufällige Abwandlungen"""
+        rng = np.random.default_rng(seed)
+        n = max(0, count - 1)
+        shape = self.rank.shape[1]
+
+        rank = self.rank[:1] + rng.normal(0, priority_noise, (n, shape))
+        targets = np.clip(self.targets[:1] + rng.integers(-target_spread, target_spread + 1, (n, len(PHASES), shape)),
+                          0, None)
+        energy = rng.uniform(0.5, 1.0, n)
+        phase_levels = np.sort(np.clip(self.phase_levels[:1] + rng.integers(-phase_spread, phase_spread + 1, (n, 2)),
+                                       1, None), axis=1)
+
+        return StrategyBatch(
+            self.buildings,
+            np.concatenate([self.rank[:1], rank]),
+            np.concatenate([self.targets[:1], targets]),
+            np.concatenate([self.energy_threshold[:1], energy]),
+            np.concatenate([self.phase_levels[:1], phase_levels])
+        )
+
+    def describe(self, index):
+        """Eine Strategie in Config-Form (zum Übernehmen in planet_config.py)"""
+        order = np.argsort(self.rank[index], kind='stable')
+        return {
+            'BUILDING_PRIORITY': {self.buildings[col]: position + 1 for position, col in enumerate(order)},
+            'TARGETS': {
+                phase: {name: int(level) for name, level in zip(self.buildings, self.targets[index, p]) if level}
+                for p, phase in enumerate(PHASES)
+            },
+            'energy_threshold': round(float(self.energy_threshold[index]), 2),
+            'PHASE_LEVELS': [int(level) for level in self.phase_levels[index]]
+        }
+
+
+class EconomySimulator:
+    """
+    Deterministische Wirtschaft eines Planeten für viele Strategien zugleich.
+
+    Minen, Energie, Speicher und Bauschleife laufen in festen Zeitschritten
+    mit den OGame-Formeln; jede Operation rechnet über alle Strategien auf
+    einmal (NumPy), so dass tausende Varianten in Sekunden 30 Tage weit
+    kommen. Forschung, Flotten und Felder werden nicht simuliert.
+    """
+
+    def __init__(self, strategies, speed=1, temperature=30, step=300):
+        self.strategies = strategies
+        self.speed = speed
+        self.temperature = temperature
+        self.step = step
+
+        self.columns = {name: col for col, name in enumerate(strategies.buildings)}
+        costs = [BUILDING_COSTS[BUILDING_NAME_IDS[name]] for name in strategies.buildings]
+        self.base_cost = np.array([cost[:3] for cost in costs], dtype=float)  # (B, 3)
+        self.cost_factor = np.array([cost[3] for cost in costs], dtype=float)  # (B,)
+
+        # Ohne das Gebäude in der Strategie ist seine Voraussetzung nie erfüllt
+        self.requirements = [
+            (self.columns[name], self.columns.get(required), level)
+            for name, required_levels in REQUIREMENTS.items() if name in self.columns
+            for required, level in required_levels.items()
+        ]
+
+    # === FORMELN ===
+
+    def level(self, levels, name):
+        col = self.columns.get(name)
+        return levels[:, col] if col is not None else np.zeros(len(levels))
+
+    def production(self, levels):
+        """Stündliche Produktion (S, 3) und Energie-Verhältnis erzeugt/verbraucht (S,)"""
+        metal = self.level(levels, 'metallmine')
+        crystal = self.level(levels, 'kristallmine')
+        deuterium = self.level(levels, 'deuteriumsynthetisierer')
+        solar = self.level(levels, 'solarkraftwerk')
+        fusion = self.level(levels, 'fusionskraftwerk')
+
+        energy_made = 20 * solar * 1.1 ** solar + 30 * fusion * 1.05 ** fusion
+        energy_used = 10 * metal * 1.1 ** metal + 10 * crystal * 1.1 ** crystal + 20 * deuterium * 1.1 ** deuterium
+        ratio = np.ones(len(levels))
+        np.divide(energy_made, energy_used, out=ratio, where=energy_used > 0)
+        factor = np.minimum(1.0, ratio)
+
+        production = np.stack([
+            30 + 30 * metal * 1.1 ** metal * factor,
+            15 + 20 * crystal * 1.1 ** crystal * factor,
+            10 * deuterium * 1.1 ** deuterium * (1.44 - 0.004 * self.temperature) * factor
+            - 10 * fusion * 1.1 ** fusion
+        ], axis=1)
+        return production * self.speed, ratio
+
+    def storage(self, levels):
+        """Speicher-Kapazität (S, 3)"""
+        return np.stack([
+            5000 * np.floor(2.5 * np.exp(20 * self.level(levels, STORAGE[resource]) / 33))
+            for resource in RESOURCES
+        ], axis=1)
+
+    def build_cost(self, choice, levels):
+        """Kosten der nächsten Stufe (S, 3)"""
+        current = levels[np.arange(len(levels)), choice]
+        return self.base_cost[choice] * (self.cost_factor[choice] ** current)[:, None]
+
+    def build_time(self, cost, levels):
+        """Bauzeit in Sekunden (Roboter- und Nanitenfabrik verkürzen)"""
+        robots = self.level(levels, 'roboterfabrik')
+        nanites = self.level(levels, 'nanofabrik')
+        hours = (cost[:, 0] + cost[:, 1]) / (2500 * (1 + robots) * 2 ** nanites * self.speed)
+        return np.maximum(1, hours * 3600)
+
+    def requirements_met(self, levels):
+        allowed = np.ones(levels.shape, dtype=bool)
+        for col, required_col, level in self.requirements:
+            if required_col is None:
+                allowed[:, col] = False
+            else:
+                allowed[:, col] &= levels[:, required_col] >= level
+        return allowed
+
+    # === STRATEGIE ===
+
+    def choose(self, levels, ratio, capacity):
+        """Nächstes Gebäude pro Strategie (S,) und ob es überhaupt eins gibt (S,)"""
+        strategies = self.strategies
+        rows = np.arange(len(levels))
+
+        phase = (levels.sum(axis=1)[:, None] >= strategies.phase_levels).sum(axis=1)
+        wanted = strategies.targets[rows, phase]
+        score = np.where((levels < wanted) & self.requirements_met(levels), strategies.rank, np.inf)
+        choice = score.argmin(axis=1)
+        has_choice = np.isfinite(score.min(axis=1))
+
+        # Zu wenig Energie: erst ein Kraftwerk (wie should_build_energy)
+        solar = self.columns.get('solarkraftwerk')
+        if solar is not None:
+            low_energy = ratio < strategies.energy_threshold
+            choice = np.where(low_energy, solar, choice)
+            has_choice |= low_energy
+
+        # Kosten über der Speicher-Kapazität: erst den Speicher ausbauen
+        over = self.build_cost(choice, levels) > capacity
+        for r in reversed(range(len(RESOURCES))):
+            storage = self.columns.get(STORAGE[RESOURCES[r]])
+            if storage is not None:
+                choice = np.where(over[:, r], storage, choice)
+        return choice, has_choice
+
+    def run(self, days=30, target=None, production=None):
+        """Alle Strategien days Tage weit simulieren - Zeit bis zum Ziel pro Strategie"""
+        count = len(self.strategies)
+        rows = np.arange(count)
+        target_levels = np.zeros(len(self.columns))
+        for name, level in (target or {}).items():
+            if name not in self.columns:
+                raise ValueError(f"Unknown building in target: {name}")
+            target_levels[self.columns[name]] = level
+        target_production = np.array([(production or {}).get(resource, 0) for resource in RESOURCES], dtype=float)
+
+        levels = np.zeros((count, len(self.columns)), dtype=int)
+        resources = np.tile(np.array(START_RESOURCES, dtype=float), (count, 1))
+        queue = np.full(count, -1)
+        queue_end = np.zeros(count)
+        reached_at = np.full(count, np.inf)
+
+        horizon = days * 86400
+        now = 0.0
+        steps = 0
+        while True:
+            hourly, ratio = self.production(levels)
+            capacity = self.storage(levels)
+
+            reached = np.all(levels >= target_levels, axis=1) & np.all(hourly >= target_production, axis=1)
+            reached_at[reached & np.isinf(reached_at)] = now
+            if now >= horizon or np.isfinite(reached_at).all():
+                break
+
+            # Freie Bauschleifen: Gebäude wählen und starten sobald bezahlbar
+            idle = queue < 0
+            if idle.any():
+                choice, has_choice = self.choose(levels, ratio, capacity)
+                cost = self.build_cost(choice, levels)
+                start = idle & has_choice & np.all(resources >= cost, axis=1)
+                resources[start] -= cost[start]
+                queue[start] = choice[start]
+                queue_end[start] = now + self.build_time(cost[start], levels[start])
+
+            # Produktion des Schritts (bis zum Speicherlimit, Verbrauch nicht unter 0)
+            gain = hourly * self.step / 3600
+            resources = np.where(gain >= 0,
+                                 np.where(resources < capacity, np.minimum(capacity, resources + gain), resources),
+                                 np.maximum(0.0, resources + gain))
+            now += self.step
+            steps += 1
+
+            done = (queue >= 0) & (queue_end <= now)
+            levels[rows[done], queue[done]] += 1
+            queue[done] = -1
+
+        return {
+            'reached_at': reached_at,
+            'levels': levels,
+            'production': hourly,
+            'resources': resources,
+            'steps': steps
+        }
+
+
+# === BERICHT ===
+
+def format_duration(seconds):
+    if seconds is None or not np.isfinite(seconds):
+        return "not reached"
+    seconds = int(seconds)
+    return f"{seconds // 86400}d {seconds % 86400 // 3600:02}h {seconds % 3600 // 60:02}m"
+
+
+def build_report(strategies, result, top=10):
+    """Strategien nach Zeit bis zum Ziel - Strategie 0 ist die aktuelle Konfiguration"""
+    reached_at = result['reached_at']
+    order = np.argsort(reached_at, kind='stable')
+    baseline = reached_at[0]
+
+    def entry(index):
+        seconds = reached_at[index]
+        return {
+            'strategy': int(index),
+            'time_to_target': float(seconds) if np.isfinite(seconds) else None,
+            'vs_baseline': round(float(seconds / baseline - 1), 3) if np.isfinite(seconds) and np.isfinite(baseline)
+            else None,
+            'production': {resource: round(float(value)) for resource, value in zip(RESOURCES, result['production'][index])},
+            'levels': {name: int(level) for name, level in zip(strategies.buildings, result['levels'][index])},
+            'config': strategies.describe(index)
+        }
+
+    return {
+        'strategies': len(strategies),
+        'reached': int(np.isfinite(reached_at).sum()),
+        'baseline': entry(0),
+        'top': [entry(index) for index in order[:top]]
+    }
+
+
+def print_report(report):
+    baseline = report['baseline']
+    print(f"\n🏭 === ECONOMY SIMULATION: {report['strategies']} strategies, {report['reached']} reached the target ===")
+    print(f"   Current config: {format_duration(baseline['time_to_target'])}")
+    for position, entry in enumerate(report['top'], 1):
+        delta = f"{entry['vs_baseline']:+.1%}" if entry['vs_baseline'] is not None else ""
+        order = ', '.join(list(entry['config']['BUILDING_PRIORITY'])[:5])
+        print(f"   {position:2}. #{entry['strategy']:<5} {format_duration(entry['time_to_target']):>14} "
+              f"{delta:>8}  energy<{entry['config']['energy_threshold']:.2f} "
+              f"phases {entry['config']['PHASE_LEVELS']}  {order}, ...")
+
+
+def parse_pairs(text):
+    """'metallmine=20,kristallmine=15' -> dict"""
+    pairs = {}
+    for item in filter(None, (part.strip() for part in (text or '').split(','))):
+        name, _, value = item.partition('=')
+        pairs[name.strip()] = float(value)
+    return pairs
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline economy simulator for build strategies")
+    parser.add_argument("--variants", type=int, default=2000, help="strategies to simulate (0 = current config)")
+    parser.add_argument("--days", type=float, default=30)
+    parser.add_argument("--step", type=int, default=300, help="time step in seconds")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the strategy variants")
+    parser.add_argument("--target", default=",".join(f"{name}={level}" for name, level in
+                                                    PlanetDevelopmentConfig.EARLY_GAME_TARGETS.items()),
+                        help="building levels to reach, e.g. metallmine=20,kristallmine=15")
+    parser.add_argument("--production", default="", help="hourly production to reach, e.g. metal=3000,crystal=1500")
+    parser.add_argument("--target-spread", type=int, default=3, help="max +/- change of target levels per variant")
+    parser.add_argument("--priority-noise", type=float, default=1.5, help="random reordering of priorities")
+    parser.add_argument("--speed", type=int, default=1, help="universe speed")
+    parser.add_argument("--temperature", type=int, default=30, help="planet temperature (deuterium)")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--output", metavar="FILE", help="report JSON (default logs/economy_<time>.json)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S')
+    logger = logging.getLogger('EconomySimulator')
+
+    strategies = StrategyBatch.from_config().variants(args.variants, seed=args.seed,
+                                                      target_spread=args.target_spread,
+                                                      priority_noise=args.priority_noise)
+    simulator = EconomySimulator(strategies, speed=args.speed, temperature=args.temperature, step=args.step)
+
+    started = time.perf_counter()
+    result = simulator.run(args.days, target=parse_pairs(args.target), production=parse_pairs(args.production))
+    logger.info(f"⏱️ {len(strategies)} strategies x {result['steps']} steps in {time.perf_counter() - started:.2f}s")
+
+    report = build_report(strategies, result, args.top)
+    print_report(report)
+
+    output = Path(args.output) if args.output else project_root / "logs" / f"economy_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    logger.info(f"💾 Report saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
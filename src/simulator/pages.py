@@ -0,0 +1,289 @@
+# HTML-Seiten des Simulators (Struktur und Selektoren wie in OGame)
+
+import json
+from html import escape
+
+from src.game.buildings import BUILDING_IDS
+from src.game.ships import SHIP_IDS
+from src.simulator.universe import BUILDING_COSTS, MISSIONS, RESOURCES, SHIP_STATS, format_coords
+
+SHIP_LABELS = {
+    202: 'Kleiner Transporter',
+    203: 'Großer Transporter',
+    204: 'Leichter Jäger',
+    205: 'Schwerer Jäger',
+    206: 'Kreuzer',
+    207: 'Schlachtschiff',
+    208: 'Kolonieschiff',
+    209: 'Recycler',
+    210: 'Spionagesonde'
+}
+
+MISSION_LABELS = {1: 'Angreifen', 3: 'Transport', 4: 'Stationieren', 7: 'Kolonisieren', 15: 'Expedition'}
+
+MENU = [
+    ('overview', 'Übersicht'),
+    ('supplies', 'Versorgung'),
+    ('buildings', 'Gebäude'),
+    ('resources', 'Rohstoffe'),
+    ('fleetdispatch', 'Flotte'),
+    ('galaxy', 'Galaxie'),
+    ('messages', 'Nachrichten')
+]
+
+
+def ingame_url(component, **params):
+    query = ''.join(f"&{key}={value}" for key, value in params.items())
+    return escape(f"index.php?page=ingame&component={component}{query}")
+
+
+def number(value):
+    """1234567 -> 1.234.567"""
+    return f"{int(value):,}".replace(',', '.')
+
+
+def duration(seconds):
+    """Countdown-Text wie im Spiel (1h 5m 3s)"""
+    seconds = max(0, int(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    parts = [f"{hours}h"] if hours else []
+    if hours or minutes:
+        parts.append(f"{minutes}m")
+    parts.append(f"{secs}s")
+    return ' '.join(parts)
+
+
+def layout(universe, component, body, flash=None):
+    """Gemeinsamer Rahmen: Meta-Tags, Ressourcen-Leiste, Menü, Planeten-Liste"""
+    planet = universe.planet()
+    production = universe.production(planet)
+    g, s, p = planet['coords']
+
+    resources = ''.join(
+        f'<li><span id="resources_{r}" class="value" data-raw="{int(planet["resources"][r])}">'
+        f'{number(planet["resources"][r])}</span></li>'
+        for r in RESOURCES
+    )
+    resources += f'<li><span id="resources_energy" class="value">{number(production["energy"])}</span></li>'
+
+    menu = ''.join(
+        f'<li><a class="menubutton" href="{ingame_url(key)}"><span class="textlabel">{label}</span></a></li>'
+        for key, label in MENU
+    )
+
+    planets = []
+    for own in universe.planets.values():
+        highlight = ' hightlightPlanet' if own['id'] == planet['id'] else ''
+        coords = format_coords(own['coords'])
+        tooltip = escape(f"{own['name']} {coords}<br/>12.800km ({universe.fields_used(own)}/{own['fields_max']})")
+        planets.append(
+            f'<div class="smallplanet{highlight}" id="planet-{own["id"]}">'
+            f'<a class="planetlink" href="{ingame_url(component, cp=own["id"])}" data-tooltip-title="{tooltip}">'
+            f'<span class="planet-name">{escape(own["name"])}</span>'
+            f'<span class="planet-koords">{coords}</span></a></div>'
+        )
+
+    message = f'<div id="message" class="notice">{escape(flash)}</div>' if flash else ''
+
+    return f"""<!DOCTYPE html>
+<html lang="de">
+<head>
+<meta charset="utf-8">
+<meta name="ogame-planet-id" content="{planet['id']}">
+<meta name="ogame-planet-name" content="{escape(planet['name'])}">
+<meta name="ogame-planet-coordinates" content="{g}:{s}:{p}">
+<meta name="ogame-universe-speed" content="{universe.speed}">
+<title>OGame Simulator - {component}</title>
+</head>
+<body id="{component}">
+<div id="resourcesbarcomponent"><ul id="resources">{resources}</ul></div>
+<ul id="menuTable">{menu}</ul>
+<div id="planetList">{''.join(planets)}</div>
+{message}
+<div id="middle"><div id="content">{body}</div></div>
+</body>
+</html>"""
+
+
+def overview_page(universe, flash=None):
+    planet = universe.planet()
+    body = f"""<div id="overviewcomponent">
+<h2 id="planetNameHeader">{escape(planet['name'])}</h2>
+<p id="planetCoordinates">Koordinaten: <span class="coordinates">{format_coords(planet['coords'])}</span></p>
+<p id="planetFields">Felder: {universe.fields_used(planet)}/{planet['fields_max']}</p>
+<p id="planetTemperature">Temperatur: {planet['temperature'] - 40}°C bis {planet['temperature']}°C</p>
+{queue_box(universe, planet)}
+<div id="eventboxContent">{len(universe.fleets)} Flottenbewegungen</div>
+</div>"""
+    return layout(universe, 'overview', body, flash)
+
+
+def queue_box(universe, planet):
+    """Bauschleife mit data-end (Unix-Zeit) und Countdown"""
+    queue = planet['queue']
+    if not queue:
+        return '<div id="productionboxbuildingcomponent"><p class="idle">Keine Gebäude in Bau.</p></div>'
+
+    end = universe.wall_time(queue['end'])
+    remaining = (queue['end'] - universe.now()) / universe.time_scale
+    name = BUILDING_IDS[queue['building']].capitalize()
+    return (f'<div id="productionboxbuildingcomponent"><div class="construction" data-end="{int(end)}">'
+            f'<span class="queue_name">{name} {queue["level"]}</span> '
+            f'<span class="buildingCountdown">{duration(remaining)}</span></div></div>')
+
+
+def supplies_page(universe, component='supplies', flash=None):
+    """Gebäude mit Stufe, Kosten und Ausbau-Link (nur wenn möglich)"""
+    planet = universe.planet()
+    items = []
+
+    for building_id in BUILDING_COSTS:
+        name = BUILDING_IDS[building_id].capitalize()
+        level = planet['buildings'][building_id]
+        cost = universe.build_cost(building_id, level + 1)
+        affordable = all(planet['resources'][r] >= cost[r] for r in RESOURCES)
+        costs = ' '.join(f'<span class="cost {r}" data-value="{cost[r]}">{number(cost[r])}</span>'
+                         for r in RESOURCES if cost[r])
+
+        if affordable and not planet['queue']:
+            link = ingame_url('supplies', modus=1, type=building_id, token=universe.token)
+            action = f'<a class="build-it" href="{link}" title="{name}">Ausbauen</a>'
+        else:
+            action = '<span class="build-it_disabled">Ausbauen</span>'
+
+        items.append(
+            f'<li class="technology" data-technology="{building_id}" data-status="{"on" if affordable else "off"}">'
+            f'<span class="building_name">{name}</span>'
+            f'<span class="stock" title="{name}"><span class="level" data-value="{level}">{level}</span></span>'
+            f'<span class="costs">{costs}</span>'
+            f'<div class="actions">{action}</div></li>'
+        )
+
+    body = f'{queue_box(universe, planet)}<ul id="technologies">{"".join(items)}</ul>'
+    return layout(universe, component, body, flash)
+
+
+def resources_page(universe, flash=None):
+    """Produktions-Übersicht pro Stunde"""
+    planet = universe.planet()
+    production = universe.production(planet)
+    rows = ''.join(
+        f'<tr class="{r}"><td class="label">{r.capitalize()}</td>'
+        f'<td class="production" title="{r.capitalize()} Produktion">{number(production[r])}</td>'
+        f'<td class="storage">{number(universe.storage(planet, r))}</td></tr>'
+        for r in RESOURCES
+    )
+    body = f'<table id="productionTable"><tr><th>Rohstoff</th><th>pro Stunde</th><th>Speicher</th></tr>{rows}</table>'
+    return layout(universe, 'resources', body, flash)
+
+
+def galaxy_page(universe, galaxy, system, flash=None):
+    """Galaxie-Ansicht mit Navigations-Formular und 15 Positionen"""
+    rows = []
+    for position, slot in enumerate(universe.system_slots(galaxy, system), start=1):
+        if slot is None:
+            rows.append(f'<tr class="row empty_filter"><td class="position position-{position}">{position}</td>'
+                        f'<td class="planetname"></td><td class="playername"></td><td class="action"></td></tr>')
+            continue
+
+        owner = slot['owner'] or 'Du'
+        status = ' inactive' if slot.get('inactive') else ''
+        suffix = ' (i)' if slot.get('inactive') else ''
+        rows.append(
+            f'<tr class="row"><td class="position position-{position}">{position}'
+            f'<span class="planet-icon"></span></td>'
+            f'<td class="planetname">{escape(slot["name"])}</td>'
+            f'<td class="playername{status}">{escape(owner)}{suffix}</td>'
+            f'<td class="coords">{format_coords(slot["coords"])}</td></tr>'
+        )
+
+    body = f"""<div id="galaxycomponent">
+<form id="galaxyForm" method="get" action="index.php">
+<input type="hidden" name="page" value="ingame">
+<input type="hidden" name="component" value="galaxy">
+<input type="text" id="galaxy_input" name="galaxy" value="{galaxy}">
+<input type="text" id="system_input" name="system" value="{system}">
+<input type="submit" class="submit" value="Los!">
+</form>
+<table id="galaxytable" data-galaxy="{galaxy}" data-system="{system}">{''.join(rows)}</table>
+</div>"""
+    return layout(universe, 'galaxy', body, flash)
+
+
+def fleet_page(universe, flash=None):
+    """Flotten-Versand: Schiffe, Mission und Ziel in einem Formular"""
+    planet = universe.planet()
+    ships = []
+    for ship_id in SHIP_STATS:
+        count = planet['ships'].get(ship_id, 0)
+        ship_class = ' class="ship-small"' if ship_id == 202 else ''
+        ships.append(
+            f'<li class="technology" data-technology="{ship_id}">'
+            f'<span class="ship_name">{SHIP_LABELS[ship_id]}</span>'
+            f'<span class="amount" data-value="{count}">{number(count)}</span>'
+            f'<input type="text" name="am{ship_id}_{SHIP_IDS[ship_id]}"{ship_class} max="{count}" value=""></li>'
+        )
+
+    missions = ''.join(
+        f'<label><input type="radio" name="mission" value="{mission}"> {MISSION_LABELS[mission]}</label>'
+        for mission in MISSIONS
+    )
+
+    body = f"""<div id="fleetdispatchcomponent">
+<form id="fleetForm" method="post" action="{ingame_url('fleetdispatch', action='sendFleet')}">
+<ul id="missions">{missions}</ul>
+<ul id="military">{''.join(ships)}</ul>
+<div id="coordinates">
+<input type="text" name="galaxy" value="">
+<input type="text" name="system" value="">
+<input type="text" name="planet" value="">
+</div>
+<input type="hidden" name="speed" value="10">
+<input type="hidden" name="token" value="{universe.token}">
+<input type="submit" id="sendFleet" class="send-fleet" value="Senden">
+</form>
+<script>var fleetSendingToken = "{universe.token}";</script>
+</div>"""
+    return layout(universe, 'fleetdispatch', body, flash)
+
+
+def event_list(universe):
+    """Ereignisliste (Ajax-Fragment): Hin- und Rückflug je Flotte"""
+    rows = []
+    for fleet in sorted(universe.fleets, key=lambda f: f['arrival']):
+        legs = [] if fleet['returning'] else [(False, fleet['arrival'])]
+        if fleet['mission'] != 4 or fleet['returning']:
+            legs.append((True, fleet['return_at']))
+
+        for returning, at in legs:
+            row_id = f"eventRow-{fleet['id']}{'-return' if returning else ''}"
+            rows.append(
+                f'<tr class="eventFleet" id="{row_id}" data-mission-type="{fleet["mission"]}" '
+                f'data-return-flight="{"true" if returning else "false"}" '
+                f'data-arrival-time="{int(universe.wall_time(at))}">'
+                f'<td class="missionFleet">{MISSION_LABELS[fleet["mission"]]}</td>'
+                f'<td class="coordsOrigin">{format_coords(fleet["origin"])}</td>'
+                f'<td class="destCoords">{format_coords(fleet["target"])}</td></tr>'
+            )
+    return f'<table id="eventContent">{"".join(rows)}</table>'
+
+
+def messages_page(universe, flash=None):
+    items = ''.join(
+        f'<li class="msg" data-msg-id="{m["id"]}"><span class="msg_title">{escape(m["title"])}</span>'
+        f'<span class="msg_date" data-time="{int(universe.wall_time(m["time"]))}"></span>'
+        f'<div class="msg_content">{escape(m["text"])}</div></li>'
+        for m in reversed(universe.messages)
+    )
+    return layout(universe, 'messages', f'<ul id="messagesList">{items}</ul>', flash)
+
+
+def empire_page(universe):
+    """Imperium-Ansicht: Daten im createImperiumHtml(...)-Aufruf"""
+    data = json.dumps(universe.empire_data())
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Imperium</title></head>
+<body><div id="empireTable"></div>
+<script>createImperiumHtml({data}, 1);</script>
+</body></html>"""
@@ -0,0 +1,256 @@
+import argparse
+import json
+import logging
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from src.simulator import pages
+from src.simulator.universe import Universe
+
+GAME_PATH = "/game/index.php"
+START_PATH = GAME_PATH + "?page=ingame&component=overview"
+
+PAGE_COMPONENTS = ['overview', 'supplies', 'buildings', 'resources', 'galaxy', 'fleetdispatch', 'messages']
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    """HTTP-Anfragen an den Simulator weiterreichen"""
+
+    server_version = "OGameSimulator/1.0"
+
+    def do_GET(self):
+        self.handle_request('GET')
+
+    def do_POST(self):
+        self.handle_request('POST')
+
+    def handle_request(self, method):
+        simulator = self.server.simulator
+        simulator.delay()
+
+        parts = urlsplit(self.path)
+        form = {}
+        if method == 'POST':
+            length = int(self.headers.get('Content-Length') or 0)
+            form = dict(parse_qsl(self.rfile.read(length).decode('utf-8'), keep_blank_values=True))
+
+        status, content_type, body, location = simulator.route(parts.path, dict(parse_qsl(parts.query)), form)
+
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('Set-Cookie', f"PHPSESSID={simulator.universe.token[:16]}; Path=/")
+        if location:
+            self.send_header('Location', location)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        self.server.simulator.logger.debug(f"{self.address_string()} {format % args}")
+
+
+class SimulatorServer:
+    """
+    Lokaler Web-Server mit OGame-förmigen Seiten (Übersicht, Gebäude,
+    Rohstoffe, Galaxie, Flotten-Versand, Ereignisliste, Nachrichten,
+    Imperium) auf Basis eines deterministischen Universums.
+
+    latency/jitter (Sekunden) verzögern jede Antwort - der Jitter kommt
+    aus einem eigenen Seed und ist damit wiederholbar.
+    """
+
+    def __init__(self, universe, logger, host="127.0.0.1", port=8080, latency=0.0, jitter=0.0, seed=1):
+        self.universe = universe
+        self.logger = logger
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(f"latency:{seed}")
+
+        self.lock = threading.Lock()
+        self.flash = None  # Meldung für die nächste Seite (nach Redirect)
+        self.requests = 0
+        self.httpd = None
+        self.thread = None
+
+    @property
+    def url(self):
+        """Start-URL - *.localhost zeigt im Browser auf 127.0.0.1 und enthält 'ogame' für die Tab-Erkennung"""
+        host = "ogame.localhost" if self.host in ("127.0.0.1", "localhost", "0.0.0.0") else self.host
+        return f"http://{host}:{self.port}{START_PATH}"
+
+    @property
+    def local_url(self):
+        """Start-URL für Clients ohne *.localhost-Auflösung (requests) - 'ogame' steht im Pfad"""
+        host = "127.0.0.1" if self.host == "0.0.0.0" else self.host
+        return f"http://{host}:{self.port}/ogame{START_PATH}"
+
+    def delay(self):
+        """Künstliche Latenz vor jeder Antwort"""
+        seconds = self.latency + (self.rng.uniform(-self.jitter, self.jitter) if self.jitter else 0)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    # === ROUTING ===
+
+    def route(self, path, params, form):
+        """-> (Status, Content-Type, Body, Location)"""
+        if path in ('/', '/game', '/game/'):
+            return self.redirect(START_PATH)
+        if not path.endswith(GAME_PATH):
+            return 404, 'text/plain; charset=utf-8', 'Not found', None
+
+        with self.lock:
+            self.requests += 1
+            universe = self.universe
+            if params.get('cp'):
+                universe.set_active(params['cp'])
+            universe.tick()
+
+            page = params.get('page', 'ingame')
+            component = params.get('component', 'overview')
+
+            if page == 'componentOnly' and component == 'eventList':
+                return self.html(pages.event_list(universe))
+            if page == 'standalone' and component == 'empire':
+                return self.html(pages.empire_page(universe))
+            if page != 'ingame' or component not in PAGE_COMPONENTS:
+                return 404, 'text/plain; charset=utf-8', 'Unknown page', None
+
+            if component in ('supplies', 'buildings') and params.get('modus') == '1':
+                return self.build(params, component)
+            if component == 'fleetdispatch' and params.get('action') == 'sendFleet':
+                return self.send_fleet({**params, **form}, ajax=params.get('ajax') == '1')
+
+            flash, self.flash = self.flash, None
+            return self.html(self.render(component, params, flash))
+
+    def render(self, component, params, flash):
+        universe = self.universe
+        if component == 'overview':
+            return pages.overview_page(universe, flash)
+        if component in ('supplies', 'buildings'):
+            return pages.supplies_page(universe, component, flash)
+        if component == 'resources':
+            return pages.resources_page(universe, flash)
+        if component == 'galaxy':
+            home = universe.planet()['coords']
+            galaxy = min(max(to_int(params.get('galaxy'), home[0]), 1), universe.galaxies)
+            system = min(max(to_int(params.get('system'), home[1]), 1), universe.systems)
+            return pages.galaxy_page(universe, galaxy, system, flash)
+        if component == 'fleetdispatch':
+            return pages.fleet_page(universe, flash)
+        return pages.messages_page(universe, flash)
+
+    def build(self, params, component):
+        """Ausbau-Link: bauen und zur Gebäude-Seite zurück"""
+        if params.get('token') != self.universe.token:
+            self.flash = "Ungültiges Token"
+        else:
+            ok, self.flash = self.universe.start_build(None, to_int(params.get('type'), 0))
+            self.logger.info(f"🏗️ Build {'started' if ok else 'rejected'}: {self.flash}")
+        return self.redirect(f"index.php?page=ingame&component={component}")
+
+    def send_fleet(self, values, ajax=False):
+        """Flotten-Versand per Formular oder Ajax (JSON-Antwort)"""
+        ships = {}
+        for key, value in values.items():
+            match = re.match(r'am(\d+)', key)
+            if match and to_int(value, 0) > 0:
+                ships[int(match.group(1))] = to_int(value, 0)
+
+        target = (to_int(values.get('galaxy'), 0), to_int(values.get('system'), 0),
+                  to_int(values.get('position') or values.get('planet'), 0))
+
+        if values.get('token') and values['token'] != self.universe.token:
+            ok, result = False, "Ungültiges Token"
+        else:
+            ok, result = self.universe.send_fleet(None, ships, target, to_int(values.get('mission'), 0),
+                                                  speed=to_int(values.get('speed'), 10))
+
+        message = "Flotte wurde versendet." if ok else result
+        self.logger.info(f"🚀 Fleet {'sent' if ok else 'rejected'}: {ships} -> {target} ({message})")
+
+        if ajax:
+            body = {'success': ok, 'message': message, 'errors': [] if ok else [{'message': message}],
+                    'newAjaxToken': self.universe.token}
+            return 200, 'application/json', json.dumps(body), None
+
+        self.flash = message
+        return self.redirect("index.php?page=ingame&component=fleetdispatch")
+
+    def html(self, body):
+        return 200, 'text/html; charset=utf-8', body, None
+
+    def redirect(self, location):
+        return 303, 'text/plain; charset=utf-8', '', location
+
+    # === SERVER ===
+
+    def start(self):
+        """Im Hintergrund-Thread starten (z.B. für Benchmarks)"""
+        self.httpd = ThreadingHTTPServer((self.host, self.port), SimulatorHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.simulator = self
+        self.port = self.httpd.server_address[1]  # port=0 -> freier Port
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        self.logger.info(f"🪐 Simulator running on {self.url}")
+        return self
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+
+def to_int(value, default=0):
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Local OGame simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=1, help="universe and jitter seed")
+    parser.add_argument("--galaxies", type=int, default=1)
+    parser.add_argument("--systems", type=int, default=50)
+    parser.add_argument("--speed", type=int, default=1, help="universe speed (production, build and flight times)")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="game seconds per real second")
+    parser.add_argument("--latency", type=float, default=0.0, help="response delay in milliseconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random +/- delay in milliseconds")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S')
+    logger = logging.getLogger('OGameSimulator')
+
+    universe = Universe(seed=args.seed, galaxies=args.galaxies, systems=args.systems, speed=args.speed,
+                        time_scale=args.time_scale)
+    server = SimulatorServer(universe, logger, host=args.host, port=args.port,
+                             latency=args.latency / 1000, jitter=args.jitter / 1000, seed=args.seed)
+    server.start()
+    logger.info(f"   Start the bot with: python ogame_bot.py --start-url '{server.url}'")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+import math
+import random
+import time
+
+from src.game.buildings import BUILDING_IDS
+from src.game.ships import SHIP_IDS
+
+# Basiskosten (Metall, Kristall, Deuterium) und Faktor pro Stufe
+BUILDING_COSTS = {
+    1: (60, 15, 0, 1.5),
+    2: (48, 24, 0, 1.6),
+    3: (225, 75, 0, 1.5),
+    4: (75, 30, 0, 1.5),
+    12: (900, 360, 180, 1.8),
+    14: (400, 120, 200, 2),
+    15: (1000000, 500000, 100000, 2),
+    21: (400, 200, 100, 2),
+    22: (1000, 0, 0, 2),
+    23: (1000, 500, 0, 2),
+    24: (1000, 1000, 0, 2),
+    31: (200, 400, 200, 2),
+    33: (0, 50000, 100000, 2),
+    34: (20000, 40000, 0, 2),
+    36: (200, 0, 50, 5),
+    44: (20000, 20000, 1000, 2)
+}
+
+# Flugfähige Schiffe: Geschwindigkeit, Ladekapazität, Angriff
+SHIP_STATS = {
+    202: (5000, 5000, 5),
+    203: (7500, 25000, 5),
+    204: (12500, 50, 50),
+    205: (10000, 100, 150),
+    206: (15000, 800, 400),
+    207: (10000, 1500, 1000),
+    208: (2500, 7500, 50),
+    209: (2000, 20000, 1),
+    210: (100000000, 0, 0)
+}
+
+MISSIONS = {1: 'attack', 3: 'transport', 4: 'deploy', 7: 'colonize', 15: 'expedition'}
+
+RESOURCES = ['metal', 'crystal', 'deuterium']
+
+NPC_NAMES = ['Aldebaran', 'Bellatrix', 'Capella', 'Deneb', 'Electra', 'Fomalhaut', 'Gienah', 'Hadar',
+             'Izar', 'Jabbah', 'Kochab', 'Lesath', 'Mimosa', 'Nunki', 'Okab', 'Polaris']
+
+HOME_BUILDINGS = {1: 4, 2: 2, 3: 1, 4: 4, 14: 1, 21: 1}
+HOME_SHIPS = {202: 10, 204: 20, 208: 1}
+MAX_PLANETS = 9  # Astrophysik gibt es im Simulator nicht
+
+
+class Universe:
+    """
+    Deterministisches Mini-OGame für den Simulator.
+
+    Produktion, Bauschleifen und Flüge werden beim Zugriff bis "jetzt"
+    fortgeschrieben. Fremde Systeme entstehen beim ersten Besuch aus
+    (seed, Galaxie, System) - gleiche Seeds ergeben das gleiche Universum,
+    egal in welcher Reihenfolge gescannt wird. time_scale > 1 lässt die
+    Spielzeit schneller laufen.
+    """
+
+    def __init__(self, seed=1, galaxies=1, systems=50, speed=1, time_scale=1.0, clock=None):
+        self.seed = seed
+        self.galaxies = galaxies
+        self.systems = systems
+        self.speed = speed
+        self.time_scale = time_scale
+        self.clock = clock or time.time
+        self.started_at = self.clock()
+
+        self.rng = random.Random(seed)
+        self.token = f"{random.Random(f'token:{seed}').getrandbits(128):032x}"
+        self.next_id = 33620000
+        self.slots = {}  # (galaxy, system, position) -> Planet
+        self.generated_systems = set()
+        self.planets = {}  # planet_id -> eigener Planet
+        self.fleets = []
+        self.messages = []
+        self.active_planet = None
+
+        home = self.create_planet((1, self.rng.randint(1, systems), self.rng.randint(4, 12)), 'Heimatplanet')
+        home['buildings'].update(HOME_BUILDINGS)
+        home['ships'].update(HOME_SHIPS)
+        home['resources'] = {'metal': 5000.0, 'crystal': 3000.0, 'deuterium': 1000.0}
+        self.active_planet = home['id']
+
+    def now(self):
+        """Spielzeit (bei time_scale != 1 schneller als die Uhr)"""
+        return self.started_at + (self.clock() - self.started_at) * self.time_scale
+
+    def wall_time(self, game_time):
+        """Spielzeit -> Unix-Zeit (für data-end/data-arrival-time)"""
+        return time.time() + (game_time - self.now()) / self.time_scale
+
+    def new_id(self):
+        self.next_id += 1
+        return str(self.next_id)
+
+    # === PLANETEN ===
+
+    def create_planet(self, coords, name):
+        """Eigenen Planeten anlegen"""
+        planet = {
+            'id': self.new_id(),
+            'name': name,
+            'coords': coords,
+            'owner': None,
+            'buildings': {building_id: 0 for building_id in BUILDING_IDS},
+            'resources': {'metal': 500.0, 'crystal': 500.0, 'deuterium': 0.0},
+            'ships': {ship_id: 0 for ship_id in SHIP_STATS},
+            'queue': None,
+            'fields_max': 140 + 10 * (8 - abs(8 - coords[2])),
+            'temperature': 80 - 8 * coords[2],
+            'updated_at': self.now()
+        }
+        self.generate_system(coords[0], coords[1])
+        self.slots[coords] = planet
+        self.planets[planet['id']] = planet
+        return planet
+
+    def generate_system(self, galaxy, system):
+        """Fremde Planeten eines Systems (deterministisch aus dem Seed)"""
+        if (galaxy, system) in self.generated_systems:
+            return
+        self.generated_systems.add((galaxy, system))
+
+        rng = random.Random(f"{self.seed}:{galaxy}:{system}")
+        for position in range(1, 16):
+            if rng.random() > 0.45 or (galaxy, system, position) in self.slots:
+                continue
+            inactive = rng.random() < 0.3
+            self.slots[(galaxy, system, position)] = {
+                'id': self.new_id(),
+                'name': 'Kolonie' if rng.random() < 0.5 else 'Heimatplanet',
+                'coords': (galaxy, system, position),
+                'owner': f"{rng.choice(NPC_NAMES)}{rng.randint(1, 999)}",
+                'inactive': inactive,
+                'defense': 0 if inactive else rng.randint(0, 20000),
+                'resources': {r: float(rng.randint(1000, 60000)) for r in RESOURCES}
+            }
+
+    def system_slots(self, galaxy, system):
+        """Positionen 1-15 eines Systems (None = frei)"""
+        self.generate_system(galaxy, system)
+        return [self.slots.get((galaxy, system, position)) for position in range(1, 16)]
+
+    def planet(self, planet_id=None):
+        """Eigener Planet (Standard: aktiver Planet)"""
+        return self.planets.get(str(planet_id or self.active_planet))
+
+    def set_active(self, planet_id):
+        if str(planet_id) in self.planets:
+            self.active_planet = str(planet_id)
+
+    def fields_used(self, planet):
+        return sum(planet['buildings'].values())
+
+    # === WIRTSCHAFT ===
+
+    def production(self, planet):
+        """Stündliche Produktion und Energie-Bilanz"""
+        level = planet['buildings']
+        energy_made = 20 * level[4] * 1.1 ** level[4] + 30 * level[12] * 1.05 ** level[12]
+        energy_used = (10 * level[1] * 1.1 ** level[1] + 10 * level[2] * 1.1 ** level[2] +
+                       20 * level[3] * 1.1 ** level[3])
+        factor = min(1.0, energy_made / energy_used) if energy_used else 1.0
+
+        deut_factor = 1.44 - 0.004 * planet['temperature']
+        return {
+            'metal': (30 + 30 * level[1] * 1.1 ** level[1] * factor) * self.speed,
+            'crystal': (15 + 20 * level[2] * 1.1 ** level[2] * factor) * self.speed,
+            'deuterium': (10 * level[3] * 1.1 ** level[3] * deut_factor * factor - 10 * level[12]) * self.speed,
+            'energy': energy_made - energy_used
+        }
+
+    def storage(self, planet, resource):
+        level = planet['buildings'][{'metal': 22, 'crystal': 23, 'deuterium': 24}[resource]]
+        return 5000 * int(2.5 * math.exp(20 * level / 33))
+
+    def accrue(self, planet, seconds):
+        """Produktion für seconds Sekunden gutschreiben (bis zum Speicherlimit)"""
+        if seconds <= 0:
+            return
+        production = self.production(planet)
+        for resource in RESOURCES:
+            capacity = self.storage(planet, resource)
+            amount = planet['resources'][resource]
+            gain = production[resource] * seconds / 3600
+            if gain > 0 and amount < capacity:
+                planet['resources'][resource] = min(capacity, amount + gain)
+            elif gain < 0:
+                planet['resources'][resource] = max(0.0, amount + gain)
+
+    def update_planet(self, planet, until=None):
+        """Planeten bis until (Standard: jetzt) fortschreiben"""
+        until = until or self.now()
+        queue = planet['queue']
+        while queue and queue['end'] <= until:
+            self.accrue(planet, queue['end'] - planet['updated_at'])
+            planet['updated_at'] = queue['end']
+            planet['buildings'][queue['building']] = queue['level']
+            planet['queue'] = queue = None
+        self.accrue(planet, until - planet['updated_at'])
+        planet['updated_at'] = max(planet['updated_at'], until)
+
+    def build_cost(self, building_id, level):
+        metal, crystal, deuterium, factor = BUILDING_COSTS[building_id]
+        scale = factor ** (level - 1)
+        return {'metal': int(metal * scale), 'crystal': int(crystal * scale), 'deuterium': int(deuterium * scale)}
+
+    def build_time(self, planet, cost):
+        """Bauzeit in Sekunden (Roboter- und Nanitenfabrik verkürzen)"""
+        level = planet['buildings']
+        hours = (cost['metal'] + cost['crystal']) / (2500 * (1 + level[14]) * 2 ** level[15] * self.speed)
+        return max(1, int(hours * 3600))
+
+    def start_build(self, planet_id, building_id):
+        """Ausbau starten - (ok, Meldung)"""
+        planet = self.planet(planet_id)
+        if not planet or building_id not in BUILDING_COSTS:
+            return False, "Unbekanntes Gebäude"
+        self.update_planet(planet)
+
+        if planet['queue']:
+            return False, "Bauschleife belegt"
+        if self.fields_used(planet) >= planet['fields_max']:
+            return False, "Keine freien Felder"
+
+        level = planet['buildings'][building_id] + 1
+        cost = self.build_cost(building_id, level)
+        if any(planet['resources'][r] < cost[r] for r in RESOURCES):
+            return False, "Nicht genug Ressourcen"
+
+        for resource in RESOURCES:
+            planet['resources'][resource] -= cost[resource]
+        now = self.now()
+        planet['queue'] = {'building': building_id, 'level': level, 'start': now,
+                           'end': now + self.build_time(planet, cost)}
+        return True, f"{BUILDING_IDS[building_id].capitalize()} Stufe {level} wird gebaut"
+
+    # === FLOTTEN ===
+
+    def distance(self, origin, target):
+        if origin[0] != target[0]:
+            return 20000 * abs(origin[0] - target[0])
+        if origin[1] != target[1]:
+            return 2700 + 95 * abs(origin[1] - target[1])
+        if origin[2] != target[2]:
+            return 1000 + 5 * abs(origin[2] - target[2])
+        return 5
+
+    def flight_time(self, origin, target, ships, speed=10):
+        """Flugdauer in Sekunden - das langsamste Schiff bestimmt"""
+        slowest = min(SHIP_STATS[ship_id][0] for ship_id, count in ships.items() if count)
+        seconds = 10 + 3500 / (speed / 10) * math.sqrt(self.distance(origin, target) * 10 / slowest)
+        return max(1, int(seconds / self.speed))
+
+    def send_fleet(self, planet_id, ships, target, mission, speed=10):
+        """Flotte starten - (ok, Meldung oder Flotte)"""
+        planet = self.planet(planet_id)
+        if not planet:
+            return False, "Unbekannter Planet"
+        self.process_fleets()
+        self.update_planet(planet)
+
+        ships = {ship_id: count for ship_id, count in ships.items() if count > 0 and ship_id in SHIP_STATS}
+        if not ships:
+            return False, "Keine Schiffe ausgewählt"
+        for ship_id, count in ships.items():
+            if planet['ships'].get(ship_id, 0) < count:
+                return False, f"Nicht genug {SHIP_IDS[ship_id]}"
+
+        galaxy, system, position = target
+        if not (1 <= galaxy <= self.galaxies and 1 <= system <= self.systems and 1 <= position <= 15):
+            return False, "Ungültiges Ziel"
+        if mission not in MISSIONS:
+            return False, "Ungültige Mission"
+        if MISSIONS[mission] == 'colonize' and not ships.get(208):
+            return False, "Kolonisierung braucht ein Kolonieschiff"
+        if MISSIONS[mission] == 'attack' and self.slots.get(target) is None:
+            self.generate_system(galaxy, system)
+            if self.slots.get(target) is None:
+                return False, "Kein Planet an diesem Ziel"
+
+        for ship_id, count in ships.items():
+            planet['ships'][ship_id] -= count
+
+        now = self.now()
+        duration = self.flight_time(planet['coords'], target, ships, speed)
+        fleet = {
+            'id': self.new_id(),
+            'mission': mission,
+            'origin_id': planet['id'],
+            'origin': planet['coords'],
+            'target': target,
+            'ships': ships,
+            'cargo': {r: 0 for r in RESOURCES},
+            'departed': now,
+            'arrival': now + duration,
+            'return_at': now + 2 * duration,
+            'returning': False
+        }
+        self.fleets.append(fleet)
+        return True, fleet
+
+    def process_fleets(self):
+        """Ankünfte und Rückkehr bis jetzt abarbeiten (in zeitlicher Reihenfolge)"""
+        now = self.now()
+        while True:
+            due = [f for f in self.fleets if (f['return_at'] if f['returning'] else f['arrival']) <= now]
+            if not due:
+                return
+            fleet = min(due, key=lambda f: f['return_at'] if f['returning'] else f['arrival'])
+            if fleet['returning']:
+                self.fleet_returned(fleet)
+            else:
+                self.fleet_arrived(fleet)
+
+    def fleet_arrived(self, fleet):
+        mission = MISSIONS[fleet['mission']]
+        target = self.slots.get(fleet['target'])
+        coords = format_coords(fleet['target'])
+
+        if mission == 'attack' and target and target.get('owner'):
+            power = sum(SHIP_STATS[s][2] * n for s, n in fleet['ships'].items())
+            if target['defense'] >= power:
+                self.add_message(fleet['arrival'], f"Kampfbericht {coords}", "Die Flotte wurde zerstört.")
+                self.fleets.remove(fleet)
+                return
+            capacity = sum(SHIP_STATS[s][1] * n for s, n in fleet['ships'].items())
+            for resource in RESOURCES:
+                loot = int(min(target['resources'][resource] / 2, capacity / len(RESOURCES)))
+                target['resources'][resource] -= loot
+                fleet['cargo'][resource] += loot
+            loot_text = ', '.join(f"{fleet['cargo'][r]} {r}" for r in RESOURCES)
+            self.add_message(fleet['arrival'], f"Kampfbericht {coords}", f"Beute: {loot_text}")
+
+        elif mission == 'colonize':
+            self.generate_system(fleet['target'][0], fleet['target'][1])
+            if self.slots.get(fleet['target']) is None and len(self.planets) < MAX_PLANETS:
+                colony = self.create_planet(fleet['target'], 'Kolonie')
+                colony['updated_at'] = fleet['arrival']
+                fleet['ships'][208] -= 1
+                self.add_message(fleet['arrival'], f"Kolonisierung {coords}", "Neue Kolonie gegründet.")
+            else:
+                self.add_message(fleet['arrival'], f"Kolonisierung {coords}", "Die Position ist bereits besetzt.")
+
+        elif mission == 'deploy' and target and target['id'] in self.planets:
+            self.update_planet(target, fleet['arrival'])
+            for ship_id, count in fleet['ships'].items():
+                target['ships'][ship_id] += count
+            self.fleets.remove(fleet)
+            return
+
+        if not any(fleet['ships'].values()):
+            self.fleets.remove(fleet)
+            return
+        fleet['returning'] = True
+
+    def fleet_returned(self, fleet):
+        origin = self.planets.get(fleet['origin_id'])
+        self.fleets.remove(fleet)
+        if not origin:
+            return
+        self.update_planet(origin, fleet['return_at'])
+        for ship_id, count in fleet['ships'].items():
+            origin['ships'][ship_id] += count
+        for resource in RESOURCES:
+            origin['resources'][resource] += fleet['cargo'][resource]
+
+    def add_message(self, at, title, text):
+        self.messages.append({'id': self.new_id(), 'time': at, 'title': title, 'text': text})
+
+    def tick(self):
+        """Alles bis jetzt fortschreiben (vor jeder Anfrage)"""
+        self.process_fleets()
+        for planet in self.planets.values():
+            self.update_planet(planet)
+
+    # === IMPERIUM ===
+
+    def empire_data(self):
+        """Daten wie im createImperiumHtml(...)-Aufruf der Imperium-Seite"""
+        planets = []
+        for planet in self.planets.values():
+            production = self.production(planet)
+            entry = {
+                'id': int(planet['id']),
+                'name': planet['name'],
+                'type': 1,
+                'coordinates': format_coords(planet['coords']),
+                'fieldUsed': self.fields_used(planet),
+                'fieldMax': planet['fields_max'],
+                'metal': int(planet['resources']['metal']),
+                'crystal': int(planet['resources']['crystal']),
+                'deuterium': int(planet['resources']['deuterium']),
+                'energy': int(production['energy']),
+                'production': {'hourly': [int(production[r]) for r in RESOURCES] + [int(production['energy'])]}
+            }
+            entry.update({str(k): v for k, v in planet['buildings'].items()})
+            entry.update({str(k): v for k, v in planet['ships'].items()})
+            planets.append(entry)
+        return {'planets': planets}
+
+
+def format_coords(coords):
+    return f"[{coords[0]}:{coords[1]}:{coords[2]}]"
@@ -0,0 +1 @@
+# OGame Bot State Module
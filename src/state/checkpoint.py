@@ -0,0 +1,88 @@
+import json
+import sqlite3
+import threading
+import time
+
+
+class CheckpointStore:
+    """
+    Absturzsicherer Zwischenstand in einer SQLite-Datei.
+
+    Jeder Zustand schreibt seine Änderung sofort als eigene Zeile
+    (Abschnitt, Schlüssel -> JSON) - kein Komplett-Dump pro Zyklus. Nach
+    einem Neustart wird daraus der warme Cache gefüllt und nur noch
+    einmal gegen das Spiel abgeglichen.
+    """
+
+    def __init__(self, path, logger):
+        self.path = str(path)
+        self.logger = logger
+        self.lock = threading.Lock()  # Browser-Aufrufe laufen im Async-Kern in Worker-Threads
+
+        # Autocommit + WAL: jede Zeile ist sofort auf Platte, ohne fsync pro Schreibvorgang
+        self.db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoint ("
+            "section TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, updated_at REAL NOT NULL, "
+            "PRIMARY KEY (section, key))"
+        )
+        self.writes = 0
+
+    def put(self, section, key, value):
+        """Einen Eintrag schreiben (ersetzt den alten)"""
+        try:
+            data = json.dumps(value, ensure_ascii=False, default=str)
+            with self.lock:
+                self.db.execute("INSERT OR REPLACE INTO checkpoint VALUES (?, ?, ?, ?)",
+                                (section, str(key), data, time.time()))
+                self.writes += 1
+        except Exception as e:
+            self.logger.warning(f"⚠️ Checkpoint write {section}/{key} failed: {e}")
+
+    def delete(self, section, key=None):
+        """Eintrag (oder ganzen Abschnitt) entfernen"""
+        try:
+            with self.lock:
+                if key is None:
+                    self.db.execute("DELETE FROM checkpoint WHERE section = ?", (section,))
+                else:
+                    self.db.execute("DELETE FROM checkpoint WHERE section = ? AND key = ?", (section, str(key)))
+                self.writes += 1
+        except Exception as e:
+            self.logger.warning(f"⚠️ Checkpoint delete {section}/{key} failed: {e}")
+
+    def load(self, section):
+        """Alle Einträge eines Abschnitts (key -> Wert)"""
+        try:
+            with self.lock:
+                rows = self.db.execute("SELECT key, value FROM checkpoint WHERE section = ?", (section,)).fetchall()
+        except Exception as e:
+            self.logger.warning(f"⚠️ Checkpoint read {section} failed: {e}")
+            return {}
+
+        entries = {}
+        for key, value in rows:
+            try:
+                entries[key] = json.loads(value)
+            except ValueError:
+                continue  # Unlesbare Zeile überspringen
+        return entries
+
+    def saved_at(self):
+        """Zeitpunkt der letzten Änderung (None = leer)"""
+        with self.lock:
+            row = self.db.execute("SELECT MAX(updated_at) FROM checkpoint").fetchone()
+        return row[0] if row else None
+
+    def clear(self):
+        """Alles verwerfen (zu alter Stand)"""
+        with self.lock:
+            self.db.execute("DELETE FROM checkpoint")
+
+    def close(self):
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
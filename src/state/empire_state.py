@@ -0,0 +1,100 @@
+import time
+
+
+class EmpireState:
+    """
+    Zustand pro Planet: Ressourcen, Gebäude, Bau-Plan, Bauschleife, Cooldown.
+
+    Alle Manager schreiben hier rein statt den Zustand bei jedem Zyklus
+    neu aus dem DOM zu lesen.
+    """
+
+    def __init__(self, logger):
+        self.logger = logger
+        self.planets = {}
+        self.checkpoint = None  # CheckpointStore - jede Änderung wird sofort mitgeschrieben
+
+    def get(self, planet_id):
+        """Zustand eines Planeten (wird bei Bedarf angelegt)"""
+        if planet_id not in self.planets:
+            self.planets[planet_id] = {
+                'resources': {},
+                'production': {},
+                'buildings': {},
+                'ships': {},
+                'defense': {},
+                'plan': [],
+                'queue_end': None,  # Ende der Gebäude-Bauschleife
+                'cooldown_until': None,
+                'updated_at': None
+            }
+        return self.planets[planet_id]
+
+    def update(self, planet_id, **fields):
+        """Felder eines Planeten aktualisieren"""
+        state = self.get(planet_id)
+        for key, value in fields.items():
+            if isinstance(value, dict) and isinstance(state.get(key), dict):
+                state[key].update(value)
+            else:
+                state[key] = value
+        state['updated_at'] = time.time()
+        self.save(planet_id)
+        return state
+
+    def forget(self, planet_ids):
+        """Planeten entfernen die nicht mehr existieren"""
+        for planet_id in list(self.planets):
+            if planet_id not in planet_ids:
+                del self.planets[planet_id]
+                if self.checkpoint:
+                    self.checkpoint.delete('empire', planet_id)
+
+    def set_queue_end(self, planet_id, queue_end):
+        """Bauschleife belegt bis queue_end (Unix-Zeit) - None = frei"""
+        self.get(planet_id)['queue_end'] = queue_end
+        self.save(planet_id)
+
+    def set_cooldown(self, planet_id, seconds):
+        """Planet für eine Weile überspringen"""
+        self.get(planet_id)['cooldown_until'] = time.time() + seconds
+        self.save(planet_id)
+
+    # === CHECKPOINT ===
+
+    def restore(self, checkpoint):
+        """Zustand aus dem Checkpoint übernehmen und ab jetzt mitschreiben"""
+        self.checkpoint = checkpoint
+        for planet_id, state in checkpoint.load('empire').items():
+            self.get(planet_id).update(state)
+        return len(self.planets)
+
+    def save(self, planet_id):
+        """Einen Planeten in den Checkpoint schreiben"""
+        if self.checkpoint and planet_id is not None and planet_id in self.planets:
+            self.checkpoint.put('empire', planet_id, self.planets[planet_id])
+
+    def ready_at(self, planet_id):
+        """Ab wann ist der Planet wieder dran?"""
+        state = self.get(planet_id)
+        times = [t for t in (state['queue_end'], state['cooldown_until']) if t]
+        return max(times) if times else 0
+
+    def is_ready(self, planet_id, now=None):
+        """Bauschleife frei und kein Cooldown?"""
+        return self.ready_at(planet_id) <= (now or time.time())
+
+    def next_ready_time(self, planet_ids=None):
+        """Frühester Zeitpunkt an dem ein Planet wieder dran ist"""
+        planet_ids = planet_ids if planet_ids is not None else list(self.planets)
+        times = [self.ready_at(pid) for pid in planet_ids]
+        return min(times) if times else None
+
+    def total_resources(self):
+        """Summe der Ressourcen über alle Planeten"""
+        totals = {'metal': 0, 'crystal': 0, 'deuterium': 0}
+        for state in self.planets.values():
+            for resource in totals:
+                value = state['resources'].get(resource, 0)
+                totals[resource] += int(value or 0)
+        return totals
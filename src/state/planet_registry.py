@@ -0,0 +1,225 @@
+import re
+import time
+from urllib.parse import urlsplit
+
+from src.browser.scripts import PLANET_LIST_SCRIPT
+
+
+class PlanetRegistry:
+    """
+    Liste aller eigenen Planeten (IDs, Namen, Koordinaten, Monde, Felder).
+
+    Wird einmal aus der Planeten-Liste gelesen und nur nach einer
+    angekommenen Kolonisierung oder auf Anfrage neu aufgebaut.
+    """
+
+    def __init__(self, driver, logger):
+        self.driver = driver
+        self.logger = logger
+
+        self.config = {
+            'pending_check_interval': 600,  # Ohne Ankunftszeit alle 10 Min nachsehen
+            'pending_max_age': 86400,  # Kolonisierung nach 24h aufgeben
+            'retry_interval': 60  # Nach fehlgeschlagenem Lesen (Seite ohne Liste) so lange nicht erneut
+        }
+
+        self.planets = {}  # planet_id -> Planet-Info
+        self.order = []  # Reihenfolge wie in der Planeten-Liste
+        self.loaded_at = None
+        self.failed_at = None  # Letzter fehlgeschlagener Leseversuch
+        self.pending_colonies = []  # Unterwegs befindliche Kolonisierungen
+        self.checkpoint = None  # CheckpointStore - jede Änderung wird sofort mitgeschrieben
+
+    def ensure_loaded(self):
+        """Lade Liste falls nötig - nach einem Fehlschlag erst wieder nach retry_interval"""
+        if self.loaded_at is not None and not self.colonization_due():
+            return True
+        if self.failed_at and time.time() - self.failed_at < self.config['retry_interval']:
+            return self.loaded_at is not None
+        return self.refresh()
+
+    def refresh(self):
+        """Lies die Planeten-Liste neu"""
+        try:
+            rows = self.driver.execute_script(PLANET_LIST_SCRIPT) or []
+        except Exception as e:
+            self.logger.error(f"❌ Planet list read error: {e}")
+            self.failed_at = time.time()
+            return False
+
+        if not rows:
+            self.logger.warning("⚠️ Planet list not found on current page")
+            self.failed_at = time.time()
+            return False
+
+        planets = {}
+        order = []
+        for row in rows:
+            planet = self.parse_planet_row(row)
+            if planet:
+                planets[planet['id']] = planet
+                order.append(planet['id'])
+
+        self.planets = planets
+        self.order = order
+        self.loaded_at = time.time()
+        self.failed_at = None
+
+        # Angekommene Kolonien aus der Warteliste entfernen
+        known = {p['coordinates'] for p in planets.values()}
+        pending = []
+        for colony in self.pending_colonies:
+            if colony['coordinates'] in known:
+                continue
+            if self.loaded_at - colony['launched_at'] > self.config['pending_max_age']:
+                self.logger.info(f"🪐 Colonization of {colony['coordinates']} never arrived")
+                continue
+            # Noch nicht da - ab jetzt im normalen Intervall nachsehen
+            colony['arrival'] = None
+            colony['checked_at'] = self.loaded_at
+            pending.append(colony)
+        self.pending_colonies = pending
+        self.save()
+
+        self.logger.info(f"🪐 Planet registry: {len(planets)} planets ({max(0, len(planets) - 1)} colonies)")
+        return True
+
+    def parse_planet_row(self, row):
+        """Wandle Roh-Daten einer Listen-Zeile um"""
+        planet_id = row.get('id')
+        if not planet_id:
+            return None
+
+        fields_used, fields_max = self.parse_fields(row.get('title', ''))
+
+        moon = None
+        if row.get('moon_href'):
+            moon_match = re.search(r'cp=(\d+)', row['moon_href'])
+            if moon_match:
+                moon = {
+                    'id': moon_match.group(1),
+                    'name': self.parse_tooltip_name(row.get('moon_title', ''))
+                }
+
+        return {
+            'id': planet_id,
+            'name': row.get('name') or planet_id,
+            'coordinates': self.clean_coordinates(row.get('coordinates')),
+            'fields_used': fields_used,
+            'fields_max': fields_max,
+            'active': bool(row.get('active')),
+            'moon': moon
+        }
+
+    def parse_fields(self, text):
+        """Felder aus Tooltip, z.B. '12.800km (25/163)'"""
+        match = re.search(r'\((\d+)\s*/\s*(\d+)\)', text or '')
+        if match:
+            return int(match.group(1)), int(match.group(2))
+        return None, None
+
+    def parse_tooltip_name(self, text):
+        """Namen aus Tooltip-Titel holen"""
+        text = re.sub(r'<[^>]+>', ' ', text or '')
+        return text.split('[')[0].strip() or None
+
+    def clean_coordinates(self, text):
+        """[1:2:3] -> 1:2:3"""
+        match = re.search(r'(\d+):(\d+):(\d+)', text or '')
+        return f"{match.group(1)}:{match.group(2)}:{match.group(3)}" if match else None
+
+    # === KOLONISIERUNG ===
+
+    def expect_new_planet(self, coordinates, arrival=None):
+        """Kolonisierung gestartet - nach Ankunft Liste neu lesen"""
+        self.pending_colonies.append({
+            'coordinates': self.clean_coordinates(coordinates),
+            'arrival': arrival,
+            'launched_at': time.time(),
+            'checked_at': time.time()
+        })
+        self.save()
+
+    def colonization_due(self, now=None):
+        """Ist eine Kolonisierung inzwischen angekommen? (checked_at setzt refresh)"""
+        now = now or time.time()
+        for colony in self.pending_colonies:
+            if colony['arrival']:
+                if colony['arrival'] <= now:
+                    return True
+            elif now - colony['checked_at'] > self.config['pending_check_interval']:
+                return True
+        return False
+
+    # === CHECKPOINT ===
+
+    def restore(self, checkpoint):
+        """Planeten-Liste und laufende Kolonisierungen aus dem Checkpoint übernehmen"""
+        self.checkpoint = checkpoint
+        saved = checkpoint.load('planets').get('registry')
+        if not saved:
+            return 0
+        self.planets = saved.get('planets', {})
+        self.order = [planet_id for planet_id in saved.get('order', []) if planet_id in self.planets]
+        self.loaded_at = saved.get('loaded_at')
+        self.pending_colonies = saved.get('pending_colonies', [])
+        return len(self.planets)
+
+    def save(self):
+        """Liste in den Checkpoint schreiben"""
+        if self.checkpoint:
+            self.checkpoint.put('planets', 'registry', {
+                'planets': self.planets,
+                'order': self.order,
+                'loaded_at': self.loaded_at,
+                'pending_colonies': self.pending_colonies
+            })
+
+    # === ABFRAGEN ===
+
+    def planet_ids(self):
+        """Alle Planeten-IDs in Listen-Reihenfolge"""
+        self.ensure_loaded()
+        return list(self.order)
+
+    def get(self, planet_id):
+        """Planet-Info zu einer ID"""
+        self.ensure_loaded()
+        return self.planets.get(planet_id)
+
+    def by_coordinates(self, coordinates):
+        """Planet-Info zu Koordinaten"""
+        self.ensure_loaded()
+        coordinates = self.clean_coordinates(coordinates)
+        for planet in self.planets.values():
+            if planet['coordinates'] == coordinates:
+                return planet
+        return None
+
+    def active_planet_id(self):
+        """Aktuell ausgewählter Planet laut letzter Liste"""
+        self.ensure_loaded()
+        for planet_id in self.order:
+            if self.planets[planet_id]['active']:
+                return planet_id
+        return self.order[0] if self.order else None
+
+    def set_active(self, planet_id):
+        """Aktiven Planeten nach cp=-Wechsel merken"""
+        for pid, planet in self.planets.items():
+            planet['active'] = pid == planet_id
+
+    def count_planets(self):
+        """Anzahl aller Planeten inkl. Hauptplanet"""
+        self.ensure_loaded()
+        return len(self.planets)
+
+    def count_colonies(self):
+        """Anzahl Kolonien (ohne Hauptplanet)"""
+        self.ensure_loaded()
+        return max(0, len(self.planets) - 1)
+
+    def planet_url(self, planet_id, component='overview'):
+        """URL für einen günstigen cp=-Wechsel"""
+        parts = urlsplit(self.driver.current_url)
+        return f"{parts.scheme}://{parts.netloc}{parts.path}?page=ingame&component={component}&cp={planet_id}"
@@ -0,0 +1,325 @@
+import re
+import time
+
+from src.browser.scripts import BULK_READ_SCRIPT, CURRENT_PLANET_SCRIPT, EVENT_LIST_SCRIPT
+from src.core.metrics import FLEETS_RETURNED, record_loot
+from src.game.ships import ship_type_from_id, ship_type_from_name
+
+FLEET_PAGE_URL = "index.php?page=ingame&component=fleetdispatch"
+EVENT_LIST_URL = "index.php?page=componentOnly&component=eventList&ajax=1"
+
+# Kolonisierung verbraucht das Kolonieschiff
+CONSUMING_MISSIONS = {'colonize': ['colony_ship']}
+
+
+class ShipInventory:
+    """
+    Schiffs-Bestand pro Planet.
+
+    Wird einmal per Bulk-Read der Flotten-Seite gefüllt und danach lokal
+    fortgeschrieben: Flottenstarts ziehen ab, Rückkehrer laut Ereignisliste
+    und fertige Werft-Aufträge werden gutgeschrieben. Die Seite wird nur
+    neu gelesen wenn der Bestand verdächtig ist.
+    """
+
+    def __init__(self, driver, logger):
+        self.driver = driver
+        self.logger = logger
+
+        self.config = {
+            'max_age': 1800,  # Nach 30 Min sicherheitshalber neu lesen
+            'event_grace': 60,  # So lange darf ein Start in der Ereignisliste fehlen
+            'script_timeout': 15
+        }
+
+        self.planets = {}  # planet_id -> {'ships', 'coordinates', 'read_at', 'suspect'}
+        self.flights = []  # Eigene Flotten unterwegs
+        self.shipyard_orders = []  # Laufende Werft-Aufträge
+        self.checkpoint = None  # CheckpointStore - jede Änderung wird sofort mitgeschrieben
+
+    # === LESEN ===
+
+    def current_planet(self):
+        """Hole ID und Koordinaten des aktiven Planeten"""
+        try:
+            info = self.driver.execute_script(CURRENT_PLANET_SCRIPT) or {}
+            return info.get('planet_id'), self.clean_coordinates(info.get('coordinates'))
+        except Exception as e:
+            self.logger.debug(f"Current planet lookup failed: {e}")
+            return None, None
+
+    def get_ships(self, planet_id=None):
+        """Schiffe eines Planeten - liest die Seite nur wenn nötig"""
+        if planet_id is None:
+            planet_id, _ = self.current_planet()
+
+        self.apply_due()
+
+        if self.is_suspect(planet_id):
+            self.refresh(planet_id)
+
+        entry = self.planets.get(planet_id)
+        return dict(entry['ships']) if entry else {}
+
+    def get_count(self, ship_type, planet_id=None):
+        """Anzahl eines Schiff-Typs"""
+        return self.get_ships(planet_id).get(ship_type, 0)
+
+    def has_ships(self, required, planet_id=None):
+        """Prüfe ob alle geforderten Schiffe vorhanden sind"""
+        ships = self.get_ships(planet_id)
+        return all(ships.get(ship_type, 0) >= count for ship_type, count in required.items())
+
+    def is_suspect(self, planet_id):
+        """Muss der Bestand neu gelesen werden?"""
+        entry = self.planets.get(planet_id)
+        if not entry or entry['suspect']:
+            return True
+        return time.time() - entry['read_at'] > self.config['max_age']
+
+    def mark_suspect(self, planet_id=None, reason=""):
+        """Markiere Bestand als unzuverlässig (nächster Zugriff liest neu)"""
+        targets = [planet_id] if planet_id is not None else list(self.planets)
+        for pid in targets:
+            if pid in self.planets:
+                self.planets[pid]['suspect'] = True
+                self.save_planet(pid)
+        if reason:
+            self.logger.info(f"🚢 Ship inventory marked for re-read: {reason}")
+
+    def refresh(self, planet_id=None):
+        """Lies den kompletten Bestand mit einem Aufruf"""
+        url = FLEET_PAGE_URL
+        if planet_id is not None:
+            url = f"{url}&cp={planet_id}"
+
+        data = self.run_script(BULK_READ_SCRIPT, url)
+
+        # Fallback: aktuelle Seite direkt lesen (z.B. wenn fetch blockiert ist)
+        if not data or data.get('error') or not data.get('found'):
+            data = self.run_script(BULK_READ_SCRIPT, None)
+
+        if not data or data.get('error') or not data.get('found'):
+            self.logger.warning("⚠️ Could not read ship inventory")
+            return False
+
+        return self.update_from_read(data, planet_id)
+
+    def update_from_read(self, data, planet_id=None):
+        """Übernimm das Ergebnis eines Bulk-Reads"""
+        planet_id = data.get('planet_id') or planet_id
+        ships = {}
+
+        for key, value in (data.get('ships') or {}).items():
+            ship_type = ship_type_from_id(key) or ship_type_from_name(key)
+            if not ship_type:
+                continue
+            count = int(value) if str(value).isdigit() else 0
+            ships[ship_type] = max(ships.get(ship_type, 0), count)
+
+        now = time.time()
+        self.planets[planet_id] = {
+            'ships': ships,
+            'coordinates': self.clean_coordinates(data.get('coordinates')),
+            'read_at': now,
+            'suspect': False
+        }
+        self.save_planet(planet_id)
+
+        # Schon fertige Werft-Aufträge und zurückgekehrte Flotten stecken bereits im gelesenen Bestand
+        done = [o for o in self.shipyard_orders if o['planet_id'] == planet_id and o['completes_at'] <= now]
+        returned = [f for f in self.flights
+                    if f['planet_id'] == planet_id and f['returns_at'] and f['returns_at'] <= now]
+        if done:
+            self.shipyard_orders = [o for o in self.shipyard_orders if o not in done]
+        for flight in returned:
+            self.flights.remove(flight)
+            self.record_return(flight, now)
+        if done or returned:
+            self.save_missions()
+
+        self.logger.info(f"🚢 Ship inventory {planet_id}: {ships}")
+        return True
+
+    def run_script(self, script, url):
+        """Führe Async-Script aus und fange Fehler ab"""
+        try:
+            self.driver.set_script_timeout(self.config['script_timeout'])
+            return self.driver.execute_async_script(script, url)
+        except Exception as e:
+            self.logger.debug(f"Ship inventory script failed: {e}")
+            return None
+
+    # === EREIGNISSE ===
+
+    def record_launch(self, ships, target_coords, mission='attack', planet_id=None, origin_coords=None, loot=0):
+        """Flotte gestartet: Bestand lokal abziehen (loot = erwartete Beute)"""
+        if planet_id is None:
+            planet_id, origin_coords = self.current_planet()
+
+        entry = self.planets.get(planet_id)
+        if not entry:
+            self.mark_suspect(planet_id)
+            return
+
+        for ship_type, count in ships.items():
+            have = entry['ships'].get(ship_type, 0)
+            if count > have:
+                # Wir haben mehr geschickt als wir kannten
+                entry['suspect'] = True
+            entry['ships'][ship_type] = max(0, have - count)
+
+        consumed = CONSUMING_MISSIONS.get(mission, [])
+        returning = {s: c for s, c in ships.items() if s not in consumed and c > 0}
+
+        if returning:
+            self.flights.append({
+                'planet_id': planet_id,
+                'origin': origin_coords or entry.get('coordinates'),
+                'target': self.clean_coordinates(target_coords),
+                'ships': returning,
+                'mission': mission,
+                'loot': loot,
+                'launched_at': time.time(),
+                'returns_at': None
+            })
+            self.save_missions()
+        self.save_planet(planet_id)
+
+    def record_shipyard_order(self, ship_type, count, completes_at, planet_id=None):
+        """Werft-Auftrag: Schiffe werden bei Fertigstellung gutgeschrieben"""
+        if planet_id is None:
+            planet_id, _ = self.current_planet()
+
+        self.shipyard_orders.append({
+            'planet_id': planet_id,
+            'ship_type': ship_type,
+            'count': count,
+            'completes_at': completes_at
+        })
+        self.save_missions()
+
+    def sync_event_list(self):
+        """Gleiche eigene Flüge mit der Ereignisliste ab"""
+        if not self.flights:
+            self.apply_due()  # Fertige Werft-Aufträge gutschreiben
+            return True
+
+        data = self.run_script(EVENT_LIST_SCRIPT, EVENT_LIST_URL)
+        if not data or data.get('error'):
+            self.logger.debug("Event list not available")
+            return False
+
+        self.apply_event_rows(data.get('rows', []))
+        self.apply_due()
+        return True
+
+    def apply_event_rows(self, rows, now=None):
+        """Rückkehrzeiten aus Ereignislisten-Zeilen übernehmen"""
+        now = now or time.time()
+        unmatched = list(rows)
+        lost = []
+
+        for flight in self.flights:
+            pair = {flight['origin'], flight['target']}
+            match = None
+
+            for row in unmatched:
+                row_pair = {self.clean_coordinates(row.get('origin')), self.clean_coordinates(row.get('destination'))}
+                if row_pair == pair:
+                    match = row
+                    # Rückflug-Zeile bevorzugen
+                    if row.get('return_flight'):
+                        break
+
+            if match:
+                unmatched.remove(match)
+                flight['seen'] = True
+                if match.get('return_flight') and str(match.get('arrival', '')).isdigit():
+                    flight['returns_at'] = int(match['arrival'])
+            elif now - flight['launched_at'] > self.config['event_grace']:
+                # Flotte ist nicht mehr unterwegs
+                if flight['returns_at']:
+                    # Rückflug war in der Liste - Flotte ist zurück
+                    flight['returns_at'] = min(flight['returns_at'], now)
+                else:
+                    # Ohne Rückflug-Zeile verschwunden (im Kampf zerstört) oder nie gesehen
+                    # (Start fehlgeschlagen) - nichts gutschreiben, Bestand neu lesen
+                    lost.append(flight)
+                    reason = ("fleet left the event list without a return flight" if flight.get('seen')
+                              else "launched fleet never showed up in event list")
+                    self.mark_suspect(flight['planet_id'], reason)
+
+        for flight in lost:
+            self.flights.remove(flight)
+        self.save_missions()
+
+    def apply_due(self, now=None):
+        """Zurückgekehrte Flotten und fertige Schiffe gutschreiben"""
+        now = now or time.time()
+        returned = [f for f in self.flights if f['returns_at'] and f['returns_at'] <= now]
+        finished = [o for o in self.shipyard_orders if o['completes_at'] <= now]
+
+        for flight in returned:
+            self.flights.remove(flight)
+            self.credit(flight['planet_id'], flight['ships'])
+            self.record_return(flight, now)
+
+        for order in finished:
+            self.shipyard_orders.remove(order)
+            self.credit(order['planet_id'], {order['ship_type']: order['count']})
+            self.logger.info(f"🏭 Shipyard finished on {order['planet_id']}: {order['count']}x {order['ship_type']}")
+
+        if returned or finished:
+            self.save_missions()
+
+    def record_return(self, flight, now):
+        """Rückkehr für Statistik und Log festhalten"""
+        FLEETS_RETURNED.inc(mission=flight['mission'])
+        if flight.get('loot'):
+            record_loot(flight['loot'], now)
+        self.logger.info(f"🛬 Fleet returned to {flight['planet_id']}: {flight['ships']}")
+
+    def credit(self, planet_id, ships):
+        """Schiffe einem Planeten gutschreiben"""
+        entry = self.planets.get(planet_id)
+        if not entry:
+            return
+        for ship_type, count in ships.items():
+            entry['ships'][ship_type] = entry['ships'].get(ship_type, 0) + count
+        self.save_planet(planet_id)
+
+    def next_event_time(self):
+        """Nächster Zeitpunkt an dem sich der Bestand ändert"""
+        times = [f['returns_at'] for f in self.flights if f['returns_at']]
+        times += [o['completes_at'] for o in self.shipyard_orders]
+        return min(times) if times else None
+
+    # === CHECKPOINT ===
+
+    def restore(self, checkpoint):
+        """Bestand, Flüge und Werft-Aufträge aus dem Checkpoint übernehmen"""
+        self.checkpoint = checkpoint
+        self.planets.update(checkpoint.load('ships'))
+        missions = checkpoint.load('missions')
+        self.flights = missions.get('flights', [])
+        self.shipyard_orders = missions.get('shipyard', [])
+        return len(self.flights)
+
+    def save_planet(self, planet_id):
+        """Bestand eines Planeten in den Checkpoint schreiben"""
+        if self.checkpoint and planet_id is not None and planet_id in self.planets:
+            self.checkpoint.put('ships', planet_id, self.planets[planet_id])
+
+    def save_missions(self):
+        """Eigene Flüge und Werft-Aufträge in den Checkpoint schreiben"""
+        if self.checkpoint:
+            self.checkpoint.put('missions', 'flights', self.flights)
+            self.checkpoint.put('missions', 'shipyard', self.shipyard_orders)
+
+    def clean_coordinates(self, text):
+        """[1:2:3] -> 1:2:3"""
+        if not text:
+            return None
+        match = re.search(r'(\d+):(\d+):(\d+)', text)
+        return f"{match.group(1)}:{match.group(2)}:{match.group(3)}" if match else None